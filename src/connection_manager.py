@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any, List, Optional, Type, Dict
 from src.connections.base_connection import BaseConnection
@@ -26,6 +27,21 @@ from src.connections.monad_connection import MonadConnection
 logger = logging.getLogger("connection_manager")
 
 
+async def validate_all(connections: List[BaseConnection], limit: int = 8) -> List[bool]:
+    """Run every connection's configuration check concurrently, at most `limit` at a time"""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def check(connection: BaseConnection) -> bool:
+        async with semaphore:
+            return await connection.is_configured_async()
+
+    results = await asyncio.gather(
+        *(check(connection) for connection in connections),
+        return_exceptions=True,
+    )
+    return [result is True for result in results]
+
+
 class ConnectionManager:
     def __init__(self, agent_config):
         self.connections: Dict[str, BaseConnection] = {}
@@ -134,10 +150,9 @@ class ConnectionManager:
     def list_connections(self) -> None:
         """List all available connections and their status"""
         logging.info("\nAVAILABLE CONNECTIONS:")
-        for name, connection in self.connections.items():
-            status = (
-                "✅ Configured" if connection.is_configured() else "❌ Not Configured"
-            )
+        configured = asyncio.run(validate_all(list(self.connections.values())))
+        for name, is_configured in zip(self.connections, configured):
+            status = "✅ Configured" if is_configured else "❌ Not Configured"
             logging.info(f"- {name}: {status}")
 
     def list_actions(self, connection_name: str) -> None:
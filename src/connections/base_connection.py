@@ -1,7 +1,8 @@
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 @dataclass
 class ActionParameter:
@@ -10,23 +11,48 @@ class ActionParameter:
     type: type
     description: str
 
+def _compile_validator(parameters: List[ActionParameter]) -> Callable[[Dict[str, Any]], List[str]]:
+    """Specialize parameter validation for one action; error messages are built up front"""
+    specs = tuple(
+        (
+            param.name,
+            param.required,
+            param.type,
+            f"Missing required parameter: {param.name}",
+            f"Invalid type for {param.name}. Expected {getattr(param.type, '__name__', param.type)}",
+        )
+        for param in parameters
+    )
+
+    def validate(params: Dict[str, Any]) -> List[str]:
+        errors = []
+        for name, required, param_type, missing_error, type_error in specs:
+            if name in params:
+                value = params[name]
+                # Values that already have the right type need no coercion
+                if type(value) is not param_type:
+                    try:
+                        params[name] = param_type(value)
+                    except ValueError:
+                        errors.append(type_error)
+            elif required:
+                errors.append(missing_error)
+        return errors
+
+    return validate
+
 @dataclass
 class Action:
     name: str
     parameters: List[ActionParameter]
     description: str
-    
+    _validator: Callable[[Dict[str, Any]], List[str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._validator = _compile_validator(self.parameters)
+
     def validate_params(self, params: Dict[str, Any]) -> List[str]:
-        errors = []
-        for param in self.parameters:
-            if param.required and param.name not in params:
-                errors.append(f"Missing required parameter: {param.name}")
-            elif param.name in params:
-                try:
-                    params[param.name] = param.type(params[param.name])
-                except ValueError:
-                    errors.append(f"Invalid type for {param.name}. Expected {param.type.__name__}")
-        return errors
+        return self._validator(params)
 
 class BaseConnection(ABC):
     def __init__(self, config):
@@ -84,6 +110,13 @@ class BaseConnection(ABC):
         """
         pass
 
+    async def is_configured_async(self, verbose = False) -> bool:
+        """
+        Async variant of is_configured so several connections can be checked concurrently.
+        Runs the blocking check in a worker thread unless a connection overrides it.
+        """
+        return await asyncio.to_thread(self.is_configured, verbose)
+
     @abstractmethod
     def register_actions(self) -> None:
         """
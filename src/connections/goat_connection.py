@@ -1,14 +1,15 @@
 import logging
 import os
 import importlib
-from typing import Dict, Any, List, Type, get_type_hints, Union
+from functools import lru_cache, partial
+from typing import Dict, Any, Callable, List, Tuple, Type, get_type_hints, get_origin, get_args, Union
 from dataclasses import is_dataclass
 from eth_account import Account
 from pydantic import BaseModel
 from web3 import Web3
-from dotenv import set_key, load_dotenv
+from dotenv import load_dotenv
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
-from src.helpers import print_h_bar
+from src.helpers import print_h_bar, set_env_vars
 from src.action_handler import register_action
 from goat.classes.plugin_base import PluginBase
 from goat import ToolBase, WalletClientBase, get_tools
@@ -16,6 +17,25 @@ from goat_wallets.web3 import Web3EVMWalletClient
 
 logger = logging.getLogger("connections.goat_connection")
 
+_NoneType = type(None)
+_MISSING = object()
+_BASIC_TYPES = frozenset({str, int, float, bool})
+
+
+@lru_cache(maxsize=None)
+def _unwrap_optional(field_type: Any) -> Tuple[Any, bool]:
+    """Return the inner type of an Optional annotation and whether it was optional"""
+    if field_type is not None and get_origin(field_type) is Union:
+        args = get_args(field_type)
+        if _NoneType in args:
+            return next(t for t in args if t is not _NoneType), True
+    return field_type, False
+
+
+def _dispatch(connection: "GoatConnection", tool_name: str, agent, **kwargs) -> Any:
+    """Route a registered agent action to the GOAT tool of the same name"""
+    return connection.perform_action(tool_name, kwargs)
+
 
 class GoatConnectionError(Exception):
     """Base exception for Goat connection errors"""
@@ -29,6 +49,81 @@ class GoatConfigurationError(GoatConnectionError):
     pass
 
 
+def _resolve_type(raw_value: str, module) -> Any:
+    """Resolve a type from a string, either from plugin module or fully qualified path"""
+    try:
+        # Try to load from plugin module first
+        return getattr(module, raw_value)
+    except AttributeError:
+        try:
+            # Try as fully qualified import
+            module_path, class_name = raw_value.rsplit(".", 1)
+            type_module = importlib.import_module(module_path)
+            return getattr(type_module, class_name)
+        except (ValueError, ImportError, AttributeError) as e:
+            raise GoatConfigurationError(
+                f"Could not resolve type '{raw_value}'"
+            ) from e
+
+
+def _build_converter(field_type: Type) -> Callable[[Any, Any], Any]:
+    """Build a function that validates and converts a value to its expected type"""
+    # Handle basic types
+    if field_type in _BASIC_TYPES:
+        return lambda raw_value, module: field_type(raw_value)
+
+    # Handle Lists
+    is_list = getattr(field_type, "__origin__", None) is list
+    if is_list:
+        convert_element = _build_converter(field_type.__args__[0])
+
+        def convert_list(raw_value: Any, module) -> List[Any]:
+            if not isinstance(raw_value, list):
+                raise ValueError(f"Expected list, got {type(raw_value).__name__}")
+            return [convert_element(item, module) for item in raw_value]
+
+        return convert_list
+
+    # Handle dynamic types (classes/types that need to be imported)
+    def convert_dynamic(raw_value: Any, module) -> Any:
+        if isinstance(raw_value, str):
+            return _resolve_type(raw_value, module)
+        raise ValueError(f"Unsupported type: {field_type}")
+
+    return convert_dynamic
+
+
+@lru_cache(maxsize=None)
+def _build_validator(
+    options_class: Type,
+) -> Callable[[Dict[str, Any], Any, str], Dict[str, Any]]:
+    """Build a validator converting raw plugin args into options_class fields"""
+    converters = [
+        (field_name, _build_converter(field_type))
+        for field_name, field_type in get_type_hints(options_class).items()
+    ]
+
+    def validate(raw_args: Dict[str, Any], module, plugin_name: str) -> Dict[str, Any]:
+        validated_args = {}
+        for field_name, convert in converters:
+            raw_value = raw_args.get(field_name, _MISSING)
+            if raw_value is _MISSING:
+                raise GoatConfigurationError(
+                    f"Missing required option '{field_name}' for plugin '{plugin_name}'"
+                )
+
+            try:
+                validated_args[field_name] = convert(raw_value, module)
+            except (ValueError, TypeError) as e:
+                raise GoatConfigurationError(
+                    f"Invalid value for option '{field_name}' in plugin '{plugin_name}': {str(e)}"
+                ) from e
+
+        return validated_args
+
+    return validate
+
+
 class GoatConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         logger.info("🐐 Initializing Goat connection...")
@@ -37,48 +132,13 @@ class GoatConnection(BaseConnection):
         self._wallet_client: WalletClientBase | None = None
         self._plugins: Dict[str, PluginBase] = {}
         self._action_registry: Dict[str, ToolBase] = {}
+        self._w3: Web3 | None = None
+        self._connectivity_checked = False
+        self._actions_fingerprint: tuple | None = None
         self._config = self.validate_config(
             config
         )  # Store config but don't register actions yet
 
-    def _resolve_type(self, raw_value: str, module) -> Any:
-        """Resolve a type from a string, either from plugin module or fully qualified path"""
-        try:
-            # Try to load from plugin module first
-            return getattr(module, raw_value)
-        except AttributeError:
-            try:
-                # Try as fully qualified import
-                module_path, class_name = raw_value.rsplit(".", 1)
-                type_module = importlib.import_module(module_path)
-                return getattr(type_module, class_name)
-            except (ValueError, ImportError, AttributeError) as e:
-                raise GoatConfigurationError(
-                    f"Could not resolve type '{raw_value}'"
-                ) from e
-
-    def _validate_value(self, raw_value: Any, field_type: Type, module) -> Any:
-        """Validate and convert a value to its expected type"""
-        # Handle basic types
-        if field_type in (str, int, float, bool):
-            return field_type(raw_value)
-
-        # Handle Lists
-        if hasattr(field_type, "__origin__") and field_type.__origin__ is list:
-            if not isinstance(raw_value, list):
-                raise ValueError(f"Expected list, got {type(raw_value).__name__}")
-
-            element_type = field_type.__args__[0]
-            return [
-                self._validate_value(item, element_type, module) for item in raw_value
-            ]
-
-        # Handle dynamic types (classes/types that need to be imported)
-        if isinstance(raw_value, str):
-            return self._resolve_type(raw_value, module)
-
-        raise ValueError(f"Unsupported type: {field_type}")
-
     def _load_plugin(self, plugin_config: Dict[str, Any]) -> None:
         """Dynamically load plugins from goat_plugins namespace"""
         plugin_name = plugin_config["name"]
@@ -102,31 +162,11 @@ class GoatConnection(BaseConnection):
                     f"Plugin '{plugin_name}' options must be a dataclass"
                 )
 
-            # Get the expected fields and their types from the options class
-            option_fields = get_type_hints(options_class)
-
             # Convert and validate the provided args
-            validated_args = {}
-            raw_args = plugin_config.get("args", {})
-
-            for field_name, field_type in option_fields.items():
-                if field_name not in raw_args:
-                    raise GoatConfigurationError(
-                        f"Missing required option '{field_name}' for plugin '{plugin_name}'"
-                    )
-
-                raw_value = raw_args[field_name]
-
-                try:
-                    validated_value = self._validate_value(
-                        raw_value, field_type, module
-                    )
-                    validated_args[field_name] = validated_value
-
-                except (ValueError, TypeError) as e:
-                    raise GoatConfigurationError(
-                        f"Invalid value for option '{field_name}' in plugin '{plugin_name}': {str(e)}"
-                    ) from e
+            validate_args = _build_validator(options_class)
+            validated_args = validate_args(
+                plugin_config.get("args", {}), module, plugin_name
+            )
 
             # Create the options instance
             plugin_options = options_class(**validated_args)
@@ -157,19 +197,7 @@ class GoatConnection(BaseConnection):
 
         for field_name, field in model_class.model_fields.items():
             # Get field type, handling Optional types
-            field_type = field.annotation
-            is_optional = False
-
-            # Handle Optional types
-            if field_type is not None:
-                # Check if it's an Optional type
-                origin = getattr(field_type, "__origin__", None)
-                if origin is Union:
-                    args = getattr(field_type, "__args__", None)
-                    if args and type(None) in args:
-                        # Get the non-None type from Optional
-                        field_type = next(t for t in args if t is not type(None))
-                        is_optional = True
+            field_type, is_optional = _unwrap_optional(field.annotation)
 
             # Get description from Field
             description = field.description or f"Parameter {field_name}"
@@ -234,6 +262,12 @@ class GoatConnection(BaseConnection):
 
     def _register_actions_with_wallet(self) -> None:
         """Register actions with the current wallet client"""
+        # Tools are bound to the wallet client and plugin instances (which carry their
+        # options), so they only need rebuilding when one of those objects is replaced
+        fingerprint = (self._wallet_client, tuple(sorted(self._plugins.items())))
+        if self._action_registry and fingerprint == self._actions_fingerprint:
+            return
+
         self.actions = {}  # Clear existing actions
         self._action_registry = {}  # Clear existing registry
 
@@ -251,16 +285,21 @@ class GoatConnection(BaseConnection):
             )
             self._action_registry[tool.name] = tool
 
-            register_action(tool.name)(
-                lambda agent, tool_name=tool.name, **kwargs: self.perform_action(
-                    tool_name, kwargs
-                )
-            )
+            register_action(tool.name)(partial(_dispatch, self, tool.name))
+
+        self._actions_fingerprint = fingerprint
 
     def register_actions(self) -> None:
         """Initial action registration - deferred until wallet is configured"""
         pass  # We'll register actions after wallet configuration
 
+    def _get_web3(self, rpc_url: str) -> Web3:
+        """Return the cached Web3 instance, creating it if the RPC URL changed"""
+        if self._w3 is None or self._w3.provider.endpoint_uri != rpc_url:
+            self._w3 = Web3(Web3.HTTPProvider(rpc_url))
+            self._connectivity_checked = False
+        return self._w3
+
     def _create_wallet(self) -> bool:
         """Create wallet from environment variables"""
         try:
@@ -271,17 +310,17 @@ class GoatConnection(BaseConnection):
             if not rpc_url or not private_key:
                 return False
 
-            # Initialize Web3 and test connection
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
-            if not w3.is_connected():
-                logger.error("Failed to connect to RPC provider")
-                return False
+            # Initialize Web3; connectivity is checked on first action instead
+            w3 = self._get_web3(rpc_url)
 
             # Test private key by creating account
             try:
                 account = Account.from_key(private_key)
-                w3.eth.default_account = account.address
-                self._wallet_client = Web3EVMWalletClient(w3)
+                # Keep the current wallet client (and the tools bound to it) unless the
+                # provider or account changed; a new Web3 has no default account yet
+                if self._wallet_client is None or w3.eth.default_account != account.address:
+                    w3.eth.default_account = account.address
+                    self._wallet_client = Web3EVMWalletClient(w3)
                 # Register actions now that we have a wallet
                 self._register_actions_with_wallet()
                 return True
@@ -345,7 +384,7 @@ class GoatConnection(BaseConnection):
                 )
 
             # Initialize Web3 and test connection
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
+            w3 = self._get_web3(rpc_url)
             if not w3.is_connected():
                 raise ConnectionError(
                     "Failed to connect to RPC provider. Please check your URL."
@@ -359,22 +398,17 @@ class GoatConnection(BaseConnection):
                 raise ValueError(f"Invalid private key: {str(e)}")
 
             # Save to .env
-            if not os.path.exists(".env"):
-                logger.debug("Creating new .env file")
-                with open(".env", "w") as f:
-                    f.write("")
-
             env_vars = {
                 "GOAT_RPC_PROVIDER_URL": rpc_url,
                 "GOAT_WALLET_PRIVATE_KEY": private_key,
             }
 
-            for key, value in env_vars.items():
-                set_key(".env", key, value)
-                logger.debug(f"Saved {key} to .env")
+            set_env_vars(env_vars)
+            logger.debug(f"Saved {', '.join(env_vars)} to .env")
 
             # Initialize wallet client
             w3.eth.default_account = account.address
+            self._connectivity_checked = True
             self._wallet_client = Web3EVMWalletClient(w3)
 
             # Register actions now that we have a wallet
@@ -395,9 +429,14 @@ class GoatConnection(BaseConnection):
 
     def perform_action(self, action_name: str, kwargs) -> Any:
         """Execute a GOAT action using a plugin's tool"""
-        action = self.actions.get(action_name)
-        if not action:
+        try:
+            tool = self._action_registry[action_name]
+        except KeyError:
             raise KeyError(f"Unknown action: {action_name}")
 
-        tool = self._action_registry[action_name]
+        if not self._connectivity_checked and self._w3 is not None:
+            if not self._w3.is_connected():
+                raise GoatConnectionError("Failed to connect to RPC provider")
+            self._connectivity_checked = True
+
         return tool.execute(kwargs)
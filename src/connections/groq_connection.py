@@ -23,6 +23,8 @@ class GroqConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self._client = None
+        self._chat_create = None
+        self._models_list = None
 
     @property
     def is_llm_provider(self) -> bool:
@@ -78,6 +80,9 @@ class GroqConnection(BaseConnection):
                 api_key=api_key,
                 base_url="https://api.groq.com/openai/v1"
             )
+            # Bind hot-path methods once to skip the attribute chain per call
+            self._chat_create = self._client.chat.completions.create
+            self._models_list = self._client.models.list
         return self._client
 
     def configure(self) -> bool:
@@ -140,13 +145,13 @@ class GroqConnection(BaseConnection):
     def generate_text(self, prompt: str, system_prompt: str, model: str = None, **kwargs) -> str:
         """Generate text using Groq models"""
         try:
-            client = self._get_client()
+            self._get_client()
             
             # Use configured model if none provided
             if not model:
                 model = self.config["model"]
 
-            completion = client.chat.completions.create(
+            completion = self._chat_create(
                 model=model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -163,9 +168,9 @@ class GroqConnection(BaseConnection):
     def check_model(self, model: str, **kwargs) -> bool:
         """Check if a specific model is available"""
         try:
-            client = self._get_client()
+            self._get_client()
             try:
-                models = client.models.list()
+                models = self._models_list()
                 for groq_model in models.data:
                     if groq_model.id == model:
                         return True
@@ -179,8 +184,8 @@ class GroqConnection(BaseConnection):
     def list_models(self, **kwargs) -> None:
         """List all available Groq models"""
         try:
-            client = self._get_client()
-            response = client.models.list().data
+            self._get_client()
+            response = self._models_list().data
         
             model_ids= [model.id for model in response]
 
@@ -1,22 +1,83 @@
 import logging
 import os
+import re
 import time
+import threading
+import asyncio
+import atexit
+import aiohttp
 import requests
-from typing import Dict, Any, Optional, Union
-from dotenv import load_dotenv, set_key
-from web3 import Web3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Union
+from dotenv import load_dotenv
+from web3 import Web3, AsyncWeb3, AsyncHTTPProvider
+from web3.contract import Contract
 from web3.middleware import geth_poa_middleware
 from src.constants.networks import EVM_NETWORKS
 from src.constants.abi import ERC20_ABI
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
+from src.helpers import set_env_vars
+from src.helpers.http import close_async_http, loads, shared_aiohttp_session
 
 logger = logging.getLogger("connections.monad_connection")
 
+# Load .env once at import instead of on every action; configure() reloads it
+load_dotenv()
+
 # Constants specific to Monad testnet
 MONAD_BASE_GAS_PRICE = 50  # gwei - hardcoded for testnet
 MONAD_CHAIN_ID = 10143
 MONAD_SCANNER_URL = "testnet.monadexplorer.com"
 ZERO_EX_API_URL = "https://api.0x.org/swap"
+BALANCE_OF_SELECTOR = "0x70a08231"  # balanceOf(address)
+DECIMALS_SELECTOR = "0x313ce567"  # decimals()
+SWAP_GAS_LIMIT = 500000  # Default gas limit for swaps without a quoted gas value
+CONFIG_CHECK_TTL = 30  # seconds a successful is_configured() check stays valid
+_PRIVKEY_RE = re.compile(r'^0x[0-9a-fA-F]{64}$')
+
+# Size connection pools for concurrent swaps/transfers so connections aren't discarded
+DEFAULT_POOL_SIZE = max(32, 4 * (os.cpu_count() or 1))
+
+def _make_adapter(pool_maxsize: int) -> HTTPAdapter:
+    return HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504])
+    )
+
+# Shared keep-alive session for the RPC endpoint and the 0x API
+_SESSION = requests.Session()
+_adapter = _make_adapter(DEFAULT_POOL_SIZE)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# Swaps run on one long-lived loop thread, so the 0x session and the AsyncWeb3
+# provider session stay bound to a loop that is still open between swaps
+_swap_loop: Optional[asyncio.AbstractEventLoop] = None
+_swap_loop_lock = threading.Lock()
+
+def _run_swap(coro):
+    global _swap_loop
+    with _swap_loop_lock:
+        if _swap_loop is None:
+            _swap_loop = asyncio.new_event_loop()
+            threading.Thread(target=_swap_loop.run_forever, name="monad-swap-loop", daemon=True).start()
+            atexit.register(_close_swap_loop)
+    return asyncio.run_coroutine_threadsafe(coro, _swap_loop).result()
+
+def _close_swap_loop() -> None:
+    asyncio.run_coroutine_threadsafe(close_async_http(), _swap_loop).result()
+    _swap_loop.call_soon_threadsafe(_swap_loop.stop)
+
+@lru_cache(maxsize=4)
+def _zeroex_headers(api_key: Optional[str]) -> Dict[str, Optional[str]]:
+    """0x API v2 headers, built once per API key"""
+    return {
+        "0x-api-key": api_key,
+        "0x-version": "v2"
+    }
 
 class MonadConnectionError(Exception):
     """Base exception for Monad connection errors"""
@@ -26,6 +87,7 @@ class MonadConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         logger.info("Initializing Monad connection...")
         self._web3 = None
+        self._aw3 = None
         self.NATIVE_TOKEN = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
         
         # Get network configuration
@@ -35,8 +97,21 @@ class MonadConnection(BaseConnection):
             
         self.scanner_url = MONAD_SCANNER_URL
         self.chain_id = MONAD_CHAIN_ID
+        self._decimals_cache: Dict[str, int] = {}
+        self._erc20_cache: Dict[str, Contract] = {}
+        self._account = None
+        self._account_pk = None
+        self._last_ok_ts = 0.0
+        self._nonce_lock = threading.Lock()
+        self._next_nonce: Optional[int] = None
+        self._nonce_address: Optional[str] = None
         
         super().__init__(config)
+
+        # Give the RPC endpoint its own pool, optionally sized from config; instances
+        # sharing an endpoint share the pool mounted by the first of them
+        if self.rpc_url not in _SESSION.adapters:
+            _SESSION.mount(self.rpc_url, _make_adapter(int(config.get("rpc_pool_size", DEFAULT_POOL_SIZE))))
         self._initialize_web3()
 
     def _get_explorer_link(self, tx_hash: str) -> str:
@@ -48,12 +123,14 @@ class MonadConnection(BaseConnection):
         if not self._web3:
             for attempt in range(3):
                 try:
-                    self._web3 = Web3(Web3.HTTPProvider(self.rpc_url))
+                    self._web3 = Web3(Web3.HTTPProvider(
+                        self.rpc_url,
+                        session=_SESSION,
+                        request_kwargs={"timeout": 10}
+                    ))
                     self._web3.middleware_onion.inject(geth_poa_middleware, layer=0)
                     
-                    if not self._web3.is_connected():
-                        raise MonadConnectionError("Failed to connect to Monad network")
-                    
+                    # Reading the chain ID doubles as the connectivity check
                     chain_id = self._web3.eth.chain_id
                     if chain_id != self.chain_id:
                         raise MonadConnectionError(f"Connected to wrong chain. Expected {self.chain_id}, got {chain_id}")
@@ -67,6 +144,98 @@ class MonadConnection(BaseConnection):
                     logger.warning(f"Web3 initialization attempt {attempt + 1} failed: {str(e)}")
                     time.sleep(1)
 
+    def _get_async_web3(self) -> AsyncWeb3:
+        """Async sibling of the Web3 connection, used to overlap swap preflight calls"""
+        if self._web3 is None:
+            raise MonadConnectionError("Web3 connection is not initialized")
+        if self._aw3 is None:
+            self._aw3 = AsyncWeb3(AsyncHTTPProvider(self.rpc_url))
+        return self._aw3
+
+    def _take_nonce(self, address: str) -> int:
+        """Reserve the next nonce from the local tracker, syncing with the node on first use"""
+        with self._nonce_lock:
+            if self._next_nonce is None or address != self._nonce_address:
+                self._next_nonce = self._web3.eth.get_transaction_count(address, "pending")
+                self._nonce_address = address
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    def _send_transaction(self, account, tx: Dict[str, Any]):
+        """Sign and send a transaction, resyncing the nonce tracker if it fails"""
+        try:
+            signed = account.sign_transaction(tx)
+            return self._web3.eth.send_raw_transaction(signed.rawTransaction)
+        except Exception:
+            # The reserved nonce was not used (or is stale), refetch it on next use
+            with self._nonce_lock:
+                self._next_nonce = None
+            raise
+
+    def _erc20(self, token_address: str) -> Contract:
+        """Get the ERC20 contract object for a token, built once per address"""
+        address = Web3.to_checksum_address(token_address)
+        contract = self._erc20_cache.get(address)
+        if contract is None:
+            contract = self._web3.eth.contract(address=address, abi=ERC20_ABI)
+            self._erc20_cache[address] = contract
+        return contract
+
+    def _token_decimals(self, token_address: str) -> int:
+        """Get ERC20 decimals, cached per token since they never change"""
+        address = Web3.to_checksum_address(token_address)
+        decimals = self._decimals_cache.get(address)
+        if decimals is None:
+            decimals = self._erc20(address).functions.decimals().call()
+            self._decimals_cache[address] = decimals
+        return decimals
+
+    def _erc20_balance(self, token_address: str, holder: str) -> Tuple[int, int]:
+        """Read raw ERC20 balance and decimals via raw eth_calls in one batched request"""
+        address = Web3.to_checksum_address(token_address)
+        calls = [
+            ("eth_call", [{
+                "to": address,
+                "data": BALANCE_OF_SELECTOR + holder.lower().replace("0x", "").rjust(64, "0")
+            }, "latest"])
+        ]
+
+        decimals = self._decimals_cache.get(address)
+        if decimals is None:
+            calls.append(("eth_call", [{"to": address, "data": DECIMALS_SELECTOR}, "latest"]))
+            raw_balance, raw_decimals = self._batch_rpc(calls)
+            decimals = self._decimals_cache[address] = int(raw_decimals, 16)
+        else:
+            raw_balance, = self._batch_rpc(calls)
+
+        return int(raw_balance, 16), decimals
+
+    def _batch_rpc(self, calls: List[Tuple[str, list]]) -> List[Any]:
+        """Send several JSON-RPC calls in one HTTP request and return their results in order"""
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        response = _SESSION.post(self.rpc_url, json=payload, timeout=10)
+        response.raise_for_status()
+
+        reply = loads(response.content)
+        # Nodes that reject the whole batch answer with a single error object
+        if not isinstance(reply, list):
+            error = reply.get("error") if isinstance(reply, dict) else reply
+            raise MonadConnectionError(f"Batch RPC request failed: {error}")
+
+        results = {}
+        for item in reply:
+            if "error" in item:
+                raise MonadConnectionError(f"RPC call {calls[item['id']][0]} failed: {item['error']}")
+            results[item["id"]] = item["result"]
+        missing = [calls[i][0] for i in range(len(calls)) if i not in results]
+        if missing:
+            raise MonadConnectionError(f"Batch RPC reply has no result for: {', '.join(missing)}")
+        return [results[i] for i in range(len(calls))]
+
     @property
     def is_llm_provider(self) -> bool:
         return False
@@ -118,7 +287,11 @@ class MonadConnection(BaseConnection):
         private_key = os.getenv('MONAD_PRIVATE_KEY')
         if not private_key:
             raise MonadConnectionError("No wallet private key configured")
-        return self._web3.eth.account.from_key(private_key)
+        # Deriving the account is costly, so only redo it when the key changes
+        if private_key != self._account_pk:
+            self._account = self._web3.eth.account.from_key(private_key)
+            self._account_pk = private_key
+        return self._account
 
     def configure(self) -> bool:
         """Sets up Monad wallet"""
@@ -131,17 +304,13 @@ class MonadConnection(BaseConnection):
                 return True
 
         try:
-            if not os.path.exists('.env'):
-                with open('.env', 'w') as f:
-                    f.write('')
-
             # Get wallet private key  
             private_key = input("\nEnter your wallet private key: ")
             if not private_key.startswith('0x'):
                 private_key = '0x' + private_key
                 
             # Validate private key format
-            if len(private_key) != 66 or not all(c in '0123456789abcdefABCDEF' for c in private_key[2:]):
+            if not _PRIVKEY_RE.match(private_key):
                 raise ValueError("Invalid private key format")
             
             # Test private key by deriving address
@@ -149,16 +318,22 @@ class MonadConnection(BaseConnection):
             logger.info(f"\nDerived address: {account.address}")
 
             # Test connection
-            if not self._web3.is_connected():
+            try:
+                self._web3.eth.block_number
+            except Exception:
                 raise MonadConnectionError("Failed to connect to Monad network")
             
-            # Save credentials
-            set_key('.env', 'MONAD_PRIVATE_KEY', private_key)
+            updates = {'MONAD_PRIVATE_KEY': private_key}
 
             # Get optional 0x API key
             zeroex_key = input("\nEnter your 0x API key (optional, press Enter to skip): ")
             if zeroex_key.strip():
-                set_key('.env', 'ZEROEX_API_KEY', zeroex_key)
+                updates['ZEROEX_API_KEY'] = zeroex_key
+
+            # Save credentials in a single write and pick them up in this process
+            set_env_vars(updates)
+            load_dotenv(override=True)
+            self._last_ok_ts = 0.0
 
             logger.info("\n✅ Monad configuration saved successfully!")
             return True
@@ -169,23 +344,27 @@ class MonadConnection(BaseConnection):
 
     def is_configured(self, verbose: bool = False) -> bool:
         """Check if Monad connection is properly configured"""
+        if time.monotonic() - self._last_ok_ts < CONFIG_CHECK_TTL:
+            return True
+
         try:
-            load_dotenv()
-            
             if not os.getenv('MONAD_PRIVATE_KEY'):
                 if verbose:
                     logger.error("Missing MONAD_PRIVATE_KEY in .env")
                 return False
 
-            if not self._web3.is_connected():
+            # Single lightweight eth_blockNumber ping to confirm the node responds
+            try:
+                self._web3.eth.block_number
+            except Exception:
                 if verbose:
                     logger.error("Not connected to Monad network")
                 return False
                 
-            # Test account access
-            account = self._get_current_account()
-            balance = self._web3.eth.get_balance(account.address)
-                
+            # Deriving the account confirms the key is usable
+            self._get_current_account()
+
+            self._last_ok_ts = time.monotonic()
             return True
 
         except Exception as e:
@@ -210,18 +389,22 @@ class MonadConnection(BaseConnection):
                 raw_balance = self._web3.eth.get_balance(account.address)
                 return self._web3.from_wei(raw_balance, 'ether')
             
-            contract = self._web3.eth.contract(
-                address=Web3.to_checksum_address(token_address), 
-                abi=ERC20_ABI 
-            )
-            decimals = contract.functions.decimals().call()
-            raw_balance = contract.functions.balanceOf(account.address).call()
+            raw_balance, decimals = self._erc20_balance(token_address, account.address)
             return raw_balance / (10 ** decimals)
             
         except Exception as e:
             logger.error(f"Failed to get balance: {str(e)}")
             return 0
 
+    def _get_balance_wei(self, token_address: Optional[str] = None) -> int:
+        """Get raw native (wei) or token (base units) balance for the configured wallet"""
+        account = self._get_current_account()
+        if token_address is None or token_address.lower() == self.NATIVE_TOKEN.lower():
+            return self._web3.eth.get_balance(account.address)
+
+        raw_balance, _ = self._erc20_balance(token_address, account.address)
+        return raw_balance
+
     def _prepare_transfer_tx(
         self, 
         to_address: str,
@@ -232,42 +415,41 @@ class MonadConnection(BaseConnection):
         try:
             account = self._get_current_account()
             
-            # Get latest nonce
-            nonce = self._web3.eth.get_transaction_count(account.address)
-            
             # Use fixed gas price for testnet
             gas_price = Web3.to_wei(MONAD_BASE_GAS_PRICE, 'gwei')
             
             if token_address and token_address.lower() != self.NATIVE_TOKEN.lower():
                 # Prepare ERC20 transfer
-                contract = self._web3.eth.contract(
-                    address=Web3.to_checksum_address(token_address),
-                    abi=ERC20_ABI
-                )
-                decimals = contract.functions.decimals().call()
+                contract = self._erc20(token_address)
+                decimals = self._token_decimals(token_address)
                 amount_raw = int(amount * (10 ** decimals))
                 
-                # Monad charges based on gas limit, not usage
-                tx = contract.functions.transfer(
-                    Web3.to_checksum_address(to_address),
-                    amount_raw
-                ).build_transaction({
+                # Encode calldata directly; build_transaction would add preflight RPCs.
+                # Monad charges based on gas limit, not usage, so use a fixed limit
+                tx = {
                     'from': account.address,
-                    'nonce': nonce,
+                    'to': contract.address,
+                    'value': 0,
+                    'data': contract.encodeABI(
+                        fn_name="transfer",
+                        args=[Web3.to_checksum_address(to_address), amount_raw]
+                    ),
+                    'gas': 100000,  # Standard ERC20 transfer gas
                     'gasPrice': gas_price,
                     'chainId': self.chain_id
-                })
+                }
             else:
                 # Prepare native token transfer
                 tx = {
-                    'nonce': nonce,
                     'to': Web3.to_checksum_address(to_address),
                     'value': self._web3.to_wei(amount, 'ether'),
                     'gas': 21000,  # Standard ETH transfer gas
                     'gasPrice': gas_price,
                     'chainId': self.chain_id
                 }
-            
+
+            # Reserve the nonce last, so a bad address or amount can't leave a gap
+            tx['nonce'] = self._take_nonce(account.address)
             return tx
 
         except Exception as e:
@@ -284,21 +466,23 @@ class MonadConnection(BaseConnection):
         try:
             account = self._get_current_account()
 
-            # Check balance including gas cost since Monad charges on gas limit
-            gas_cost = Web3.to_wei(MONAD_BASE_GAS_PRICE * 21000, 'gwei')
-            gas_cost_eth = float(self._web3.from_wei(gas_cost, 'ether'))
-            total_required = float(amount) + gas_cost_eth
-            
-            current_balance = float(self.get_balance(token_address=token_address))
+            # Check balance in integer base units, including gas cost for native
+            # transfers since Monad charges on gas limit
+            current_balance = self._get_balance_wei(token_address)
+            if token_address is None or token_address.lower() == self.NATIVE_TOKEN.lower():
+                gas_cost = MONAD_BASE_GAS_PRICE * 21000 * 10**9
+                total_required = self._web3.to_wei(amount, 'ether') + gas_cost
+            else:
+                total_required = int(amount * 10 ** self._token_decimals(token_address))
+
             if current_balance < total_required:
                 raise ValueError(
-                    f"Insufficient balance. Required: {total_required}, Available: {current_balance}"
+                    f"Insufficient balance. Required: {total_required}, Available: {current_balance} (base units)"
                 )
 
             # Prepare and send transaction
             tx = self._prepare_transfer_tx(to_address, amount, token_address)
-            signed = account.sign_transaction(tx)
-            tx_hash = self._web3.eth.send_raw_transaction(signed.rawTransaction)
+            tx_hash = self._send_transaction(account, tx)
             
             tx_url = self._get_explorer_link(tx_hash.hex())
             return f"Transaction sent: {tx_url}"
@@ -307,100 +491,128 @@ class MonadConnection(BaseConnection):
             logger.error(f"Transfer failed: {str(e)}")
             raise
 
+    def _build_swap_quote_request(self, token_in: str, token_out: str, amount: float, sender: str) -> Tuple[str, Dict, Dict]:
+        """Build the 0x v2 quote URL, headers and params"""
+        # Use 0x API's native token identifier for ETH
+        if token_in == "0x0000000000000000000000000000000000000000" or token_in.lower() == self.NATIVE_TOKEN.lower():
+            amount_raw = self._web3.to_wei(amount, 'ether')
+            token_in = self.NATIVE_TOKEN
+            logger.debug("Using native token identifier: %s", token_in)
+        else:
+            decimals = self._token_decimals(token_in)
+            amount_raw = int(amount * (10 ** decimals))
+
+        # Set up API request according to v2 spec
+        headers = _zeroex_headers(os.getenv('ZEROEX_API_KEY'))
+        
+        params = {
+            "sellToken": token_in,
+            "buyToken": token_out,
+            "sellAmount": str(amount_raw),
+            "chainId": str(self.chain_id),
+            "taker": sender
+        }
+
+        url = f"{ZERO_EX_API_URL}/permit2/quote"
+        logger.debug("\nPARAMS %s\nURL %s", params, url)
+        return url, headers, params
+
+    def _log_swap_quote_response(self, status_code: int, headers, body) -> None:
+        """Log full 0x API response details, only when debug logging is enabled"""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("\n=== 0x API Response ===")
+        logger.debug("Status Code: %s", status_code)
+        logger.debug("Headers:")
+        for key, value in headers.items():
+            logger.debug("%s: %s", key, value)
+        logger.debug("\nResponse Body:")
+        logger.debug("%s", body() if callable(body) else body)
+        logger.debug("=== End Response ===\n")
+
     def _get_swap_quote(self, token_in: str, token_out: str, amount: float, sender: str) -> Dict:
         """Get swap quote from 0x API using v2 endpoints"""
         try:
-            load_dotenv()
-            
-            # Use 0x API's native token identifier for ETH
-            if token_in == "0x0000000000000000000000000000000000000000" or token_in.lower() == self.NATIVE_TOKEN.lower():
-                amount_raw = self._web3.to_wei(amount, 'ether')
-                token_in = self.NATIVE_TOKEN
-                logger.debug(f"Using native token identifier: {token_in}")
-            else:
-                token_contract = self._web3.eth.contract(
-                    address=Web3.to_checksum_address(token_in),
-                    abi=ERC20_ABI
-                )
-                decimals = token_contract.functions.decimals().call()
-                amount_raw = int(amount * (10 ** decimals))
-
-            # Set up API request according to v2 spec
-            headers = {
-                "0x-api-key": os.getenv('ZEROEX_API_KEY'),
-                "0x-version": "v2"
-            }
-            
-            params = {
-                "sellToken": token_in,
-                "buyToken": token_out,
-                "sellAmount": str(amount_raw),
-                "chainId": str(self.chain_id),
-                "taker": sender
-            }
-
-            url = f"{ZERO_EX_API_URL}/permit2/quote"
-            logger.debug("\nHEADERS ")
-            logger.debug(headers)
-            logger.debug("\nPARAMS ")
-            logger.debug(params)
-            logger.debug("\nURL ")
-            logger.debug(url)
-            response = requests.get(
+            url, headers, params = self._build_swap_quote_request(token_in, token_out, amount, sender)
+            response = _SESSION.get(
                 url,
                 headers=headers,
                 params=params
             )
-            logger.debug(f"\nHEADER FROM OBJECT : {response.request.headers}")
             response.raise_for_status()
 
-                # Log full response details
-            logger.info("\n=== 0x API Response ===")
-            logger.info(f"Status Code: {response.status_code}")
-            logger.info("Headers:")
-            for key, value in response.headers.items():
-                logger.info(f"{key}: {value}")
-            logger.info("\nResponse Body:")
-            logger.info(response.text)
-            logger.info("=== End Response ===\n")
+            # Pass a callable so the body is only decoded when it is logged
+            self._log_swap_quote_response(response.status_code, response.headers, lambda: response.text)
             
-            data = response.json()
+            data = loads(response.content)
             return data
 
         except Exception as e:
             logger.error(f"Failed to get swap quote: {str(e)}")
             raise
 
+    async def _aget_swap_quote(
+        self,
+        session: aiohttp.ClientSession,
+        token_in: str,
+        token_out: str,
+        amount: float,
+        sender: str
+    ) -> Dict:
+        """Get swap quote from 0x API without blocking the event loop"""
+        try:
+            url, headers, params = await asyncio.to_thread(
+                self._build_swap_quote_request, token_in, token_out, amount, sender
+            )
+            async with session.get(url, headers=headers, params=params) as response:
+                response.raise_for_status()
+                body = await response.read()
+                self._log_swap_quote_response(response.status, response.headers, lambda: body.decode())
+                return loads(body)
+
+        except Exception as e:
+            logger.error(f"Failed to get swap quote: {str(e)}")
+            raise
+
     def swap(self, token_in: str, token_out: str, amount: float, slippage: float = 0.5) -> str:
         """Execute token swap using 0x API with Monad-specific handling"""
+        return _run_swap(self.swap_async(token_in, token_out, amount, slippage))
+
+    async def swap_async(self, token_in: str, token_out: str, amount: float, slippage: float = 0.5) -> str:
+        """Execute token swap, running independent preflight calls concurrently"""
         try:
-            logger.debug(f"\nStarting swap with parameters:")
-            logger.debug(f"token_in: {token_in}")
-            logger.debug(f"token_out: {token_out}")
-            logger.debug(f"amount: {amount}")
+            logger.debug(
+                "\nStarting swap with parameters:\ntoken_in: %s\ntoken_out: %s\namount: %s",
+                token_in, token_out, amount
+            )
             
+            aw3 = self._get_async_web3()
             account = self._get_current_account()
-            logger.debug(f"Account address: {account.address}")
+            logger.debug("Account address: %s", account.address)
 
             # For native token swaps, use None as token_address for balance check
             is_native = (token_in.lower() == self.NATIVE_TOKEN.lower() or 
                         token_in == "0x0000000000000000000000000000000000000000")
-            
-            current_balance = self.get_balance(token_address=None if is_native else token_in)
-            logger.debug(f"Current balance: {current_balance}")
+
+            if is_native:
+                balance_task = aw3.eth.get_balance(account.address)
+            else:
+                balance_task = asyncio.to_thread(self.get_balance, token_in)
+
+            session = shared_aiohttp_session()
+            # Balance check and quote fetch are independent
+            current_balance, quote_data = await asyncio.gather(
+                balance_task,
+                self._aget_swap_quote(session, token_in, token_out, amount, account.address)
+            )
+            if is_native:
+                current_balance = self._web3.from_wei(current_balance, 'ether')
+            logger.debug("Current balance: %s", current_balance)
             
             if current_balance < amount:
                 raise ValueError(f"Insufficient balance. Required: {amount}, Available: {current_balance}")
             
-            # Get swap quote with v2 API
-            quote_data = self._get_swap_quote(
-                token_in,
-                token_out,
-                amount,
-                account.address
-            )
-            
-            logger.debug(f"Quote data received: {quote_data}")
+            logger.debug("Quote data received: %s", quote_data)
 
             # Extract transaction data from quote
             transaction = quote_data.get("transaction")
@@ -413,11 +625,24 @@ class MonadConnection(BaseConnection):
                 amount_raw = int(quote_data.get("sellAmount"))
                     
                 if spender_address:  # Only attempt approval if we have a spender address
-                    approval_hash = self._handle_token_approval(token_in, spender_address, amount_raw)
+                    approval_hash = await asyncio.to_thread(
+                        self._handle_token_approval, token_in, spender_address, amount_raw
+                    )
                     if approval_hash:
                         logger.info(f"Token approval transaction: {self._get_explorer_link(approval_hash)}")
-                        # Wait for approval confirmation
-                        self._web3.eth.wait_for_transaction_receipt(approval_hash)
+                        # Refresh the quote while waiting for approval confirmation
+                        receipt, quote_data = await asyncio.gather(
+                            aw3.eth.wait_for_transaction_receipt(
+                                approval_hash, timeout=60, poll_latency=0.2
+                            ),
+                            self._aget_swap_quote(session, token_in, token_out, amount, account.address)
+                        )
+                        if receipt['status'] != 1:
+                            raise ValueError("Token approval failed")
+
+                        transaction = quote_data.get("transaction")
+                        if not transaction or not transaction.get("to") or not transaction.get("data"):
+                            raise ValueError("Invalid transaction data in quote")
             
             # Prepare swap transaction using quote data
             tx = {
@@ -425,21 +650,17 @@ class MonadConnection(BaseConnection):
                 'to': Web3.to_checksum_address(transaction["to"]),
                 'data': transaction["data"],
                 'value': self._web3.to_wei(amount, 'ether') if is_native else 0,
-                'nonce': self._web3.eth.get_transaction_count(account.address),
                 'gasPrice': Web3.to_wei(MONAD_BASE_GAS_PRICE, 'gwei'),
                 'chainId': self.chain_id,
             }
 
-            # Estimate gas or use quote's gas estimate
-            try:
-                tx['gas'] = int(transaction.get("gas", 0)) or self._web3.eth.estimate_gas(tx)
-            except Exception as e:
-                logger.warning(f"Gas estimation failed: {e}, using default gas limit")
-                tx['gas'] = 500000  # Default gas limit for swaps
+            # Use the quote's gas estimate, falling back to a conservative limit
+            # rather than paying for an eth_estimateGas round trip
+            tx['gas'] = int(transaction.get("gas") or 0) or SWAP_GAS_LIMIT
+            tx['nonce'] = self._take_nonce(account.address)
 
             # Sign and send transaction
-            signed_tx = account.sign_transaction(tx)
-            tx_hash = self._web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+            tx_hash = self._send_transaction(account, tx)
 
             tx_url = self._get_explorer_link(tx_hash.hex())
             return f"Swap transaction sent: {tx_url}"
@@ -448,66 +669,56 @@ class MonadConnection(BaseConnection):
             logger.error(f"Swap failed: {str(e)}")
             raise
 
-        def _handle_token_approval(
-            self,
-            token_address: str,
-            spender_address: str,
-            amount: int
-        ) -> Optional[str]:
-            """Handle token approval for spender, returns tx hash if approval needed"""
-            try:
-                account = self._get_current_account()
+    def _handle_token_approval(
+        self,
+        token_address: str,
+        spender_address: str,
+        amount: int
+    ) -> Optional[str]:
+        """Send token approval for spender if needed, returns the unconfirmed tx hash"""
+        try:
+            account = self._get_current_account()
+            
+            token_contract = self._erc20(token_address)
+            
+            # Check current allowance
+            current_allowance = token_contract.functions.allowance(
+                account.address,
+                spender_address
+            ).call()
+            
+            if current_allowance < amount:
+                # Prepare approval transaction with fixed gas price and gas limit
+                approve_tx = {
+                    'from': account.address,
+                    'to': token_contract.address,
+                    'value': 0,
+                    'data': token_contract.encodeABI(
+                        fn_name="approve",
+                        args=[Web3.to_checksum_address(spender_address), amount]
+                    ),
+                    'gas': 100000,  # Standard approval gas
+                    'gasPrice': Web3.to_wei(MONAD_BASE_GAS_PRICE, 'gwei'),
+                    'nonce': self._take_nonce(account.address),
+                    'chainId': self.chain_id
+                }
                 
-                token_contract = self._web3.eth.contract(
-                    address=Web3.to_checksum_address(token_address),
-                    abi=ERC20_ABI
-                )
+                # Sign and send approval transaction, the caller waits for the receipt
+                tx_hash = self._send_transaction(account, approve_tx)
                 
-                # Check current allowance
-                current_allowance = token_contract.functions.allowance(
-                    account.address,
-                    spender_address
-                ).call()
+                return tx_hash.hex()
                 
-                if current_allowance < amount:
-                    # Prepare approval transaction with fixed gas price
-                    approve_tx = token_contract.functions.approve(
-                        spender_address,
-                        amount
-                    ).build_transaction({
-                        'from': account.address,
-                        'nonce': self._web3.eth.get_transaction_count(account.address),
-                        'gasPrice': Web3.to_wei(MONAD_BASE_GAS_PRICE, 'gwei'),
-                        'chainId': self.chain_id
-                    })
-                    
-                    # Set fixed gas for approval on Monad
-                    approve_tx['gas'] = 100000  # Standard approval gas
-                    
-                    # Sign and send approval transaction
-                    signed_approve = account.sign_transaction(approve_tx)
-                    tx_hash = self._web3.eth.send_raw_transaction(signed_approve.rawTransaction)
-                    
-                    # Wait for approval to be mined
-                    receipt = self._web3.eth.wait_for_transaction_receipt(tx_hash)
-                    if receipt['status'] != 1:
-                        raise ValueError("Token approval failed")
-                    
-                    return tx_hash.hex()
-                    
-                return None
+            return None
 
-            except Exception as e:
-                logger.error(f"Token approval failed: {str(e)}")
-                raise
+        except Exception as e:
+            logger.error(f"Token approval failed: {str(e)}")
+            raise
 
     def perform_action(self, action_name: str, kwargs: Dict[str, Any]) -> Any:
         """Execute a Monad action with validation"""
         if action_name not in self.actions:
             raise KeyError(f"Unknown action: {action_name}")
 
-        load_dotenv()
-        
         if not self.is_configured(verbose=True):
             raise MonadConnectionError("Monad connection is not properly configured")
 
@@ -1,11 +1,18 @@
 import logging
+import os
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from typing import Dict, Any
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
+from src.helpers.http import loads
 
 logger = logging.getLogger("connections.ollama_connection")
 
+# Shared keep-alive session so repeated calls reuse the same connection
+_SESSION = requests.Session()
+DEFAULT_POOL_SIZE = max(32, 4 * (os.cpu_count() or 1))
+
 
 class OllamaConnectionError(Exception):
     """Base exception for Ollama connection errors"""
@@ -21,6 +28,12 @@ class OllamaConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.base_url = config.get("base_url", "http://localhost:11434")  # Default to local Ollama setup
+        self._mount_pool()
+
+    def _mount_pool(self) -> None:
+        """Mount a connection pool sized for concurrent requests on the Ollama host"""
+        pool_size = int(self.config.get("pool_size", DEFAULT_POOL_SIZE))
+        _SESSION.mount(self.base_url, HTTPAdapter(pool_maxsize=pool_size))
 
     @property
     def is_llm_provider(self) -> bool:
@@ -65,6 +78,7 @@ class OllamaConnection(BaseConnection):
         if response.lower() != 'y':
             new_url = input("\nEnter the base URL for Ollama (e.g., http://localhost:11434): ")
             self.base_url = new_url
+            self._mount_pool()
 
         try:
             # Test connection
@@ -79,7 +93,7 @@ class OllamaConnection(BaseConnection):
         """Test if Ollama is reachable"""
         try:
             url = f"{self.base_url}/v1/models"
-            response = requests.get(url)
+            response = _SESSION.get(url)
             if response.status_code != 200:
                 raise OllamaAPIError(f"Failed to connect to Ollama: {response.status_code} - {response.text}")
         except Exception as e:
@@ -95,35 +109,40 @@ class OllamaConnection(BaseConnection):
                 logger.error(f"Ollama configuration check failed: {e}")
             return False
 
-    def generate_text(self, prompt: str, system_prompt: str, model: str = None, **kwargs) -> str:
-        """Generate text using Ollama API with streaming support"""
+    def generate_text(self, prompt: str, system_prompt: str, model: str = None, stream: bool = False, **kwargs) -> str:
+        """Generate text using Ollama API, optionally consuming the streamed response"""
         try:
             url = f"{self.base_url}/api/generate"
             payload = {
                 "model": model or self.config["model"],
                 "prompt": prompt,
                 "system": system_prompt,
+                "stream": stream,
             }
-            response = requests.post(url, json=payload, stream=True)
+            response = _SESSION.post(url, json=payload, stream=stream, timeout=300)
 
             if response.status_code != 200:
                 raise OllamaAPIError(f"API error: {response.status_code} - {response.text}")
 
-            # Initialize an empty string to store the complete response
-            full_response = ""
+            # Non-streaming responses arrive as a single JSON object
+            if not stream:
+                return loads(response.content).get("response", "")
+
+            # Collect chunks and join once instead of repeated string concatenation
+            chunks = []
 
             # Process each line of the response as a JSON object
-            for line in response.iter_lines():
+            for line in response.iter_lines(decode_unicode=True):
                 if line:
                     try:
                         # Parse the JSON object
-                        data = json.loads(line.decode("utf-8"))
+                        data = loads(line)
                         # Append the "response" field to the full response
-                        full_response += data.get("response", "")
+                        chunks.append(data.get("response", ""))
                     except json.JSONDecodeError as e:
                         raise OllamaAPIError(f"Failed to parse JSON: {e}")
 
-            return full_response
+            return "".join(chunks)
 
         except Exception as e:
             raise OllamaAPIError(f"Text generation failed: {e}")
@@ -1,12 +1,27 @@
 import logging
 import os
-from typing import Dict, Any
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Any, AsyncIterator, Iterator, Tuple
 from dotenv import load_dotenv, set_key
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
+from src.helpers.http import shared_async_http, shared_http
 
 logger = logging.getLogger("connections.perplexity_connection")
 
+load_dotenv()
+
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL = 300  # seconds a cached search answer stays valid
+_API_KEY_RE = re.compile(r"pplx-[A-Za-z0-9]{32,}")
+KEY_RECHECK_INTERVAL = 60  # seconds before a key that failed validation is probed again
+# API key -> (accepted by the API, monotonic time of the check); a key that passed once
+# stays valid for the process, so repeated is_configured() calls stay local
+_key_checks: Dict[str, Tuple[bool, float]] = {}
+SEARCH_SYSTEM_PROMPT = "You are a search assistant. Please provide detailed and accurate information based on the search query."
+
 
 class PerplexityConnectionError(Exception):
     """Base exception for Perplexity connection errors"""
@@ -23,11 +38,27 @@ class PerplexityConfigurationError(PerplexityConnectionError):
     pass
 
 
+_PERPLEXITY_ACTIONS = {
+    "search": Action(
+        name="search",
+        parameters=[
+            ActionParameter("query", True, str, "The search query to process"),
+            ActionParameter("model", False, str, "Model to use for search (defaults to sonar-reasoning-pro)")
+        ],
+        description="Perform a search query using Perplexity's Sonar API"
+    )
+}
+
+
 class PerplexityConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self._client = None
+        self._async_client = None
+        self._async_http = None
         self.base_url = "https://api.perplexity.ai"
+        # (model, query) -> (expiry, answer), least recently used first
+        self._search_cache = OrderedDict()
 
     @property
     def is_llm_provider(self) -> bool:
@@ -52,25 +83,64 @@ class PerplexityConnection(BaseConnection):
             api_key = os.getenv("PERPLEXITY_API_KEY")
             if not api_key:
                 raise PerplexityConfigurationError("Perplexity API key not found in environment")
+            # Shared keep-alive pool so repeat searches skip the TCP/TLS handshake
             self._client = OpenAI(
                 api_key=api_key,
-                base_url=self.base_url
+                base_url=self.base_url,
+                http_client=shared_http()
             )
         return self._client
 
+    def _get_async_client(self) -> AsyncOpenAI:
+        """Get or create the async Perplexity client used for streaming"""
+        # The shared async pool is per event loop, so rebuild if the caller's loop changed
+        http = shared_async_http()
+        if not self._async_client or self._async_http is not http:
+            api_key = os.getenv("PERPLEXITY_API_KEY")
+            if not api_key:
+                raise PerplexityConfigurationError("Perplexity API key not found in environment")
+            self._async_http = http
+            self._async_client = AsyncOpenAI(
+                api_key=api_key,
+                base_url=self.base_url,
+                http_client=http
+            )
+        return self._async_client
+
     def register_actions(self) -> None:
         """Register available Perplexity actions"""
-        self.actions = {
-            "search": Action(
-                name="search",
-                parameters=[
-                    ActionParameter("query", True, str, "The search query to process"),
-                    ActionParameter("model", False, str, "Model to use for search (defaults to sonar-reasoning-pro)")
-                ],
-                description="Perform a search query using Perplexity's Sonar API"
-            )
+        self.actions = _PERPLEXITY_ACTIONS
+        self._dispatch = {
+            name: getattr(self, name.replace('-', '_')) for name in self.actions
         }
 
+    @classmethod
+    def reload_env(cls) -> None:
+        """Pick up .env edits made after import"""
+        load_dotenv(override=True)
+
+    def _check_api_key(self, api_key: str) -> bool:
+        """Validate the key with one minimal completion, reusing earlier results"""
+        if not _API_KEY_RE.fullmatch(api_key):
+            raise PerplexityConfigurationError("API key must look like pplx-...")
+
+        checked = _key_checks.get(api_key)
+        if checked and (checked[0] or time.monotonic() - checked[1] < KEY_RECHECK_INTERVAL):
+            return checked[0]
+
+        try:
+            OpenAI(api_key=api_key, base_url=self.base_url, http_client=shared_http()).chat.completions.create(
+                model=self._resolve_model(),
+                messages=[{"role": "user", "content": "ping"}],
+                max_tokens=1
+            )
+            valid = True
+        except Exception as e:
+            logger.debug("Perplexity rejected the API key: %s", e)
+            valid = False
+        _key_checks[api_key] = (valid, time.monotonic())
+        return valid
+
     def configure(self) -> bool:
         """Setup Perplexity API configuration"""
         logger.info("\n🔍 PERPLEXITY API SETUP")
@@ -88,16 +158,19 @@ class PerplexityConnection(BaseConnection):
         api_key = input("\nEnter your Perplexity API key: ")
 
         try:
+            if not self._check_api_key(api_key):
+                raise PerplexityConfigurationError("Perplexity API rejected the key")
+
             if not os.path.exists('.env'):
                 with open('.env', 'w') as f:
                     f.write('')
 
             set_key('.env', 'PERPLEXITY_API_KEY', api_key)
-            
-            # Test the configuration
-            client = self._get_client()
-            self.search("test")  # Simple test query
-            
+            self.reload_env()
+            self._client = None
+            self._async_client = None
+            self._search_cache.clear()
+
             logger.info("\n✅ Perplexity API configuration successfully saved!")
             return True
 
@@ -108,61 +181,96 @@ class PerplexityConnection(BaseConnection):
     def is_configured(self, verbose = False) -> bool:
         """Check if Perplexity API key is configured and valid"""
         try:
-            load_dotenv()
             api_key = os.getenv('PERPLEXITY_API_KEY')
             if not api_key:
                 return False
 
-            client = self._get_client()
-            self.search("test")  # Quick test query
+            # Only a key not yet validated in this process costs an API call
+            if not self._check_api_key(api_key):
+                raise PerplexityConfigurationError("PERPLEXITY_API_KEY was rejected by the API")
             return True
             
         except Exception as e:
             if verbose:
-                logger.debug(f"Configuration check failed: {e}")
+                logger.debug("Configuration check failed: %s", e)
             return False
 
-    def search(self, query: str, model: str = None, **kwargs) -> str:
-        """Perform a search query using Perplexity"""
+    async def is_configured_async(self, verbose = False) -> bool:
+        """Answer inline once the key has been validated, else probe it in a worker thread"""
+        checked = _key_checks.get(os.getenv('PERPLEXITY_API_KEY') or '')
+        if checked and checked[0]:
+            return True
+        return await super().is_configured_async(verbose)
+
+    def _resolve_model(self, model: str = None) -> str:
+        """Use configured model if none provided"""
+        return model or self.config.get("model", "sonar-reasoning-pro")
+
+    @staticmethod
+    def _search_messages(query: str) -> list:
+        return [
+            {"role": "system", "content": SEARCH_SYSTEM_PROMPT},
+            {"role": "user", "content": query}
+        ]
+
+    def search_stream(self, query: str, model: str = None, **kwargs) -> Iterator[str]:
+        """Yield a Perplexity search answer chunk by chunk as it is generated"""
         try:
-            client = self._get_client()
-            
-            # Use configured model if none provided
-            if not model:
-                model = self.config.get("model", "sonar-reasoning-pro")
-
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a search assistant. Please provide detailed and accurate information based on the search query."
-                },
-                {
-                    "role": "user",
-                    "content": query
-                }
-            ]
-
-            completion = client.chat.completions.create(
-                model=model,
-                messages=messages
+            stream = self._get_client().chat.completions.create(
+                model=self._resolve_model(model),
+                messages=self._search_messages(query),
+                stream=True
             )
+            for chunk in stream:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
 
-            return completion.choices[0].message.content
-            
         except Exception as e:
             raise PerplexityAPIError(f"Search failed: {e}")
 
+    async def search_stream_async(self, query: str, model: str = None, **kwargs) -> AsyncIterator[str]:
+        """Async variant of search_stream that keeps the event loop free while waiting"""
+        try:
+            stream = await self._get_async_client().chat.completions.create(
+                model=self._resolve_model(model),
+                messages=self._search_messages(query),
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+
+        except Exception as e:
+            raise PerplexityAPIError(f"Search failed: {e}")
+
+    def search(self, query: str, model: str = None, **kwargs) -> str:
+        """Perform a search query using Perplexity"""
+        model = self._resolve_model(model)
+
+        key = (model, query)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._search_cache.move_to_end(key)
+                return cached[1]
+            del self._search_cache[key]
+
+        answer = "".join(self.search_stream(query, model))
+        self._search_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL, answer)
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return answer
+
     def perform_action(self, action_name: str, kwargs) -> Any:
         """Execute a Perplexity action with validation"""
-        if action_name not in self.actions:
-            raise KeyError(f"Unknown action: {action_name}")
+        try:
+            action = self.actions[action_name]
+            method = self._dispatch[action_name]
+        except KeyError:
+            raise KeyError(f"Unknown action: {action_name}") from None
 
-        action = self.actions[action_name]
         errors = action.validate_params(kwargs)
         if errors:
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
 
-        # Call the appropriate method based on action name
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name)
         return method(**kwargs) 
\ No newline at end of file
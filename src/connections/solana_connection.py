@@ -1,35 +1,67 @@
 import logging
 import os
-import requests
 import asyncio
-from typing import Dict, Any, Optional
+import base64
+import re
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
-from src.types import JupiterTokenData
-from src.constants import LAMPORTS_PER_SOL, SPL_TOKENS
-from src.helpers.solana.pumpfun import PumpfunTokenManager
-from src.helpers.solana.faucet import FaucetManager
-from src.helpers.solana.lend import AssetLender
-from src.helpers.solana.stake import StakeManager
-from src.helpers.solana.trade import TradeManager
-from src.helpers.solana.token_deploy import TokenDeploymentManager
-from src.helpers.solana.performance import SolanaPerformanceTracker
-from src.helpers.solana.transfer import SolanaTransferHelper
-from src.helpers.solana.read import SolanaReadHelper
-
+from src.constants import SPL_TOKENS
+from src.helpers.http import close_async_http, dumps, loads, shared_async_http
 
 from dotenv import load_dotenv, set_key
 
-from jupiter_python_sdk.jupiter import Jupiter
-
-from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Confirmed
+import httpx
 
 from solders.keypair import Keypair  # type: ignore
 
+# The Solana RPC client, Jupiter SDK and src.helpers.solana managers are heavy
+# and only some are used in a given run, so they are imported where needed
+if TYPE_CHECKING:
+    from solana.rpc.async_api import AsyncClient
+
 
 logger = logging.getLogger("connections.solana_connection")
 
+load_dotenv()
+
+# Concurrent async balance reads arriving within this window share one
+# getMultipleAccounts call
+BALANCE_BATCH_WINDOW = 0.005
+
+TOKEN_LOOKUP_CACHE_SIZE = 1024
+# Well-known tickers keyed by interned upper-case symbol
+_SPL_UPPER = {sys.intern(k.upper()): v for k, v in SPL_TOKENS.items()}
+
+# Pre-rendered JSON-RPC envelopes for the hot single-account reads: method -> (the
+# params after the pubkey, body template). Base58 needs no JSON escaping, so the
+# pubkey is spliced in directly once it has been checked against _BASE58_RE
+_BASE58_RE = re.compile(rb"[1-9A-HJ-NP-Za-km-z]{32,44}")
+_RPC_TEMPLATES = {
+    "getBalance": (
+        [],
+        b'{"jsonrpc":"2.0","id":%d,"method":"getBalance","params":["%s"]}',
+    ),
+    "getAccountInfo": (
+        [{"encoding": "base64"}],
+        b'{"jsonrpc":"2.0","id":%d,"method":"getAccountInfo",'
+        b'"params":["%s",{"encoding":"base64"}]}',
+    ),
+}
+
+
+def _encode_rpc_call(call_id: int, method: str, params: list) -> bytes:
+    template = _RPC_TEMPLATES.get(method)
+    if template is not None and params and params[1:] == template[0]:
+        pubkey = params[0].encode() if isinstance(params[0], str) else b""
+        if _BASE58_RE.fullmatch(pubkey):
+            return template[1] % (call_id, pubkey)
+    return dumps({"jsonrpc": "2.0", "id": call_id, "method": method, "params": params})
+
 
 class SolanaConnectionError(Exception):
     """Base exception for Solana connection errors"""
@@ -43,27 +75,225 @@ class SolanaConfigurationError(SolanaConnectionError):
     pass
 
 
+# Action schemas are static, so every connection instance shares one table
+_SOLANA_ACTIONS = {
+    "transfer": Action(
+        name="transfer",
+        parameters=[
+            ActionParameter("to_address", True, str, "Destination address"),
+            ActionParameter("amount", True, float, "Amount to transfer"),
+            ActionParameter(
+                "token_mint",
+                False,
+                str,
+                "Token mint address (optional for SOL)",
+            ),
+        ],
+        description="Transfer SOL or SPL tokens",
+    ),
+    "trade": Action(
+        name="trade",
+        parameters=[
+            ActionParameter(
+                "output_mint", True, str, "Output token mint address"
+            ),
+            ActionParameter("input_amount", True, float, "Input amount"),
+            ActionParameter(
+                "input_mint", False, str, "Input token mint (optional for SOL)"
+            ),
+            ActionParameter(
+                "slippage_bps", False, int, "Slippage in basis points"
+            ),
+        ],
+        description="Swap tokens using Jupiter",
+    ),
+    "get-balance": Action(
+        name="get-balance",
+        parameters=[
+            ActionParameter(
+                "token_address",
+                False,
+                str,
+                "Token mint address (optional for SOL)",
+            )
+        ],
+        description="Check SOL or token balance",
+    ),
+    "stake": Action(
+        name="stake",
+        parameters=[
+            ActionParameter("amount", True, float, "Amount of SOL to stake")
+        ],
+        description="Stake SOL",
+    ),
+    "lend-assets": Action(
+        name="lend-assets",
+        parameters=[ActionParameter("amount", True, float, "Amount to lend")],
+        description="Lend assets",
+    ),
+    "request-faucet": Action(
+        name="request-faucet",
+        parameters=[],
+        description="Request funds from faucet for testing",
+    ),
+    "deploy-token": Action(
+        name="deploy-token",
+        parameters=[
+            ActionParameter(
+                "decimals", False, int, "Token decimals (default 9)"
+            )
+        ],
+        description="Deploy a new token",
+    ),
+    "fetch-price": Action(
+        name="fetch-price",
+        parameters=[
+            ActionParameter(
+                "token_id", True, str, "Token ID to fetch price for"
+            )
+        ],
+        description="Get token price",
+    ),
+    "get-tps": Action(
+        name="get-tps", parameters=[], description="Get current Solana TPS"
+    ),
+    "get-token-by-ticker": Action(
+        name="get-token-by-ticker",
+        parameters=[
+            ActionParameter("ticker", True, str, "Token ticker symbol")
+        ],
+        description="Get token data by ticker symbol",
+    ),
+    "get-token-by-address": Action(
+        name="get-token-by-address",
+        parameters=[ActionParameter("mint", True, str, "Token mint address")],
+        description="Get token data by mint address",
+    ),
+    "launch-pump-token": Action(
+        name="launch-pump-token",
+        parameters=[
+            ActionParameter("token_name", True, str, "Name of the token"),
+            ActionParameter("token_ticker", True, str, "Token ticker symbol"),
+            ActionParameter("description", True, str, "Token description"),
+            ActionParameter("image_url", True, str, "Token image URL"),
+            ActionParameter("options", False, dict, "Additional token options"),
+        ],
+        description="Launch a Pump & Fun token",
+    ),
+}
+
+
+class _LoopRunner:
+    """
+    Event loop running on its own daemon thread.
+
+    The cached AsyncClient's connection pool is bound to the loop it runs on, so every
+    action is submitted to this one loop, from whichever thread (server workers, the
+    agent loop) calls it.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.async_client: Optional["AsyncClient"] = None
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="solana-connection-loop", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def close(self) -> None:
+        if self.loop.is_closed():
+            return
+        if self.async_client is not None:
+            self.run(self.async_client.close())
+            self.async_client = None
+        self.run(close_async_http())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
 class SolanaConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         logger.info("Initializing Solana connection...")
         super().__init__(config)
+        self._wallet: Optional[Keypair] = None
+        self._wallet_key: Optional[str] = None
+        self._runner = _LoopRunner()
+        # The runner doesn't reference the connection, so the connection can still be
+        # collected; its loop and client are closed then, or at interpreter exit
+        self._close = weakref.finalize(self, self._runner.close)
+        self._pending_balances: Dict[Optional[str], list] = {}
+        self._balance_flush: Optional[asyncio.Task] = None
+        self._ticker_cache: OrderedDict = OrderedDict()
+        self._address_cache: OrderedDict = OrderedDict()
 
     @property
     def is_llm_provider(self) -> bool:
         return False
 
-    def _get_connection_async(self) -> AsyncClient:
-        conn = AsyncClient(self.config["rpc"])
-        return conn
+    def _get_connection_async(self) -> "AsyncClient":
+        if self._runner.async_client is None:
+            from solana.rpc.async_api import AsyncClient
+            from solana.rpc.commitment import Confirmed
+
+            self._runner.async_client = AsyncClient(self.config["rpc"], commitment=Confirmed)
+        return self._runner.async_client
+
+    def _get_http(self) -> httpx.AsyncClient:
+        return shared_async_http()
+
+    async def _rpc_batch(self, calls: List[Tuple[str, list]]) -> list:
+        """Send independent JSON-RPC calls in one POST and return results in call order"""
+        payload = b",".join(
+            _encode_rpc_call(i, method, params) for i, (method, params) in enumerate(calls)
+        )
+        response = await self._get_http().post(
+            self.config["rpc"],
+            content=b"[" + payload + b"]",
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        body = loads(response.content)
+        # Nodes that reject the whole batch answer with a single error object
+        if not isinstance(body, list):
+            error = body.get("error") if isinstance(body, dict) else body
+            raise SolanaConnectionError(f"RPC batch request failed: {error}")
+        # Batch replies may arrive in any order
+        replies = {reply["id"]: reply for reply in body}
+        results = []
+        for i, (method, _) in enumerate(calls):
+            reply = replies.get(i)
+            if reply is None:
+                raise SolanaConnectionError(f"RPC batch reply has no result for {method}")
+            if "error" in reply:
+                raise SolanaConnectionError(f"RPC {method} failed: {reply['error']}")
+            results.append(reply["result"])
+        return results
+
+    def _run(self, coro):
+        return self._runner.run(coro)
+
+    def close(self) -> None:
+        """Close the cached RPC client and the connection's event loop"""
+        self._close()
+
+    def _load_wallet(self, private_key: str) -> Keypair:
+        """Decode the keypair once per distinct key; doubles as key validation"""
+        if self._wallet is None or private_key != self._wallet_key:
+            self._wallet = Keypair.from_base58_string(private_key)
+            self._wallet_key = private_key
+        return self._wallet
 
     def _get_wallet(self):
         creds = self._get_credentials()
-        return Keypair.from_base58_string(creds["SOLANA_PRIVATE_KEY"])
+        return self._load_wallet(creds["SOLANA_PRIVATE_KEY"])
 
     def _get_credentials(self) -> Dict[str, str]:
         """Get Solana credentials from environment with validation"""
         logger.debug("Retrieving Solana Credentials")
-        load_dotenv()
         required_vars = {"SOLANA_PRIVATE_KEY": "solana wallet private key"}
         credentials = {}
         missing = []
@@ -78,11 +308,12 @@ class SolanaConnection(BaseConnection):
             error_msg = f"Missing Solana credentials: {', '.join(missing)}"
             raise SolanaConfigurationError(error_msg)
 
-        Keypair.from_base58_string(credentials["SOLANA_PRIVATE_KEY"])
         logger.debug("All required credentials found")
         return credentials
 
     def _get_jupiter(self, keypair, async_client):
+        from jupiter_python_sdk.jupiter import Jupiter
+
         jupiter = Jupiter(
             async_client=async_client,
             keypair=keypair,
@@ -112,112 +343,17 @@ class SolanaConnection(BaseConnection):
 
     def register_actions(self) -> None:
         """Register available Solana actions"""
-        self.actions = {
-            "transfer": Action(
-                name="transfer",
-                parameters=[
-                    ActionParameter("to_address", True, str, "Destination address"),
-                    ActionParameter("amount", True, float, "Amount to transfer"),
-                    ActionParameter(
-                        "token_mint",
-                        False,
-                        str,
-                        "Token mint address (optional for SOL)",
-                    ),
-                ],
-                description="Transfer SOL or SPL tokens",
-            ),
-            "trade": Action(
-                name="trade",
-                parameters=[
-                    ActionParameter(
-                        "output_mint", True, str, "Output token mint address"
-                    ),
-                    ActionParameter("input_amount", True, float, "Input amount"),
-                    ActionParameter(
-                        "input_mint", False, str, "Input token mint (optional for SOL)"
-                    ),
-                    ActionParameter(
-                        "slippage_bps", False, int, "Slippage in basis points"
-                    ),
-                ],
-                description="Swap tokens using Jupiter",
-            ),
-            "get-balance": Action(
-                name="get-balance",
-                parameters=[
-                    ActionParameter(
-                        "token_address",
-                        False,
-                        str,
-                        "Token mint address (optional for SOL)",
-                    )
-                ],
-                description="Check SOL or token balance",
-            ),
-            "stake": Action(
-                name="stake",
-                parameters=[
-                    ActionParameter("amount", True, float, "Amount of SOL to stake")
-                ],
-                description="Stake SOL",
-            ),
-            "lend-assets": Action(
-                name="lend-assets",
-                parameters=[ActionParameter("amount", True, float, "Amount to lend")],
-                description="Lend assets",
-            ),
-            "request-faucet": Action(
-                name="request-faucet",
-                parameters=[],
-                description="Request funds from faucet for testing",
-            ),
-            "deploy-token": Action(
-                name="deploy-token",
-                parameters=[
-                    ActionParameter(
-                        "decimals", False, int, "Token decimals (default 9)"
-                    )
-                ],
-                description="Deploy a new token",
-            ),
-            "fetch-price": Action(
-                name="fetch-price",
-                parameters=[
-                    ActionParameter(
-                        "token_id", True, str, "Token ID to fetch price for"
-                    )
-                ],
-                description="Get token price",
-            ),
-            "get-tps": Action(
-                name="get-tps", parameters=[], description="Get current Solana TPS"
-            ),
-            "get-token-by-ticker": Action(
-                name="get-token-by-ticker",
-                parameters=[
-                    ActionParameter("ticker", True, str, "Token ticker symbol")
-                ],
-                description="Get token data by ticker symbol",
-            ),
-            "get-token-by-address": Action(
-                name="get-token-by-address",
-                parameters=[ActionParameter("mint", True, str, "Token mint address")],
-                description="Get token data by mint address",
-            ),
-            "launch-pump-token": Action(
-                name="launch-pump-token",
-                parameters=[
-                    ActionParameter("token_name", True, str, "Name of the token"),
-                    ActionParameter("token_ticker", True, str, "Token ticker symbol"),
-                    ActionParameter("description", True, str, "Token description"),
-                    ActionParameter("image_url", True, str, "Token image URL"),
-                    ActionParameter("options", False, dict, "Additional token options"),
-                ],
-                description="Launch a Pump & Fun token",
-            ),
+        self.actions = _SOLANA_ACTIONS
+        # Resolve each action's bound method once instead of per call
+        self._dispatch = {
+            name: getattr(self, name.replace("-", "_")) for name in self.actions
         }
 
+    @classmethod
+    def reload_env(cls) -> None:
+        """Re-read .env after it changes; it is otherwise loaded once at import"""
+        load_dotenv(override=True)
+
     def configure(self) -> bool:
         """Sets up Solana credentials"""
         logger.info("\n🔑 SOLANA CREDENTIALS SETUP")
@@ -244,7 +380,7 @@ class SolanaConnection(BaseConnection):
                     f.write("")
 
             set_key(".env", "SOLANA_PRIVATE_KEY", private_key)
-            load_dotenv(override=True)
+            self.reload_env()
 
             logger.info("\n✅ Solana configuration successfully saved!")
             logger.info("Your private key has been stored in the .env file.")
@@ -258,7 +394,6 @@ class SolanaConnection(BaseConnection):
         """Check if Solana credentials are configured and valid"""
         try:
             # First check if credentials exist and key is valid
-            load_dotenv(override=True)
             private_key = os.getenv("SOLANA_PRIVATE_KEY")
             if not private_key:
                 if verbose:
@@ -266,7 +401,7 @@ class SolanaConnection(BaseConnection):
                 return False
 
             # Validate the key format
-            Keypair.from_base58_string(private_key)
+            self._load_wallet(private_key)
 
             # We successfully validated the private key exists and is in correct format
             if verbose:
@@ -280,67 +415,181 @@ class SolanaConnection(BaseConnection):
                     error_msg = f"Configuration error: {error_msg}"
                 elif isinstance(e, SolanaConnectionError):
                     error_msg = f"API validation error: {error_msg}"
-                logger.debug(f"Solana Configuration validation failed: {error_msg}")
+                logger.debug("Solana Configuration validation failed: %s", error_msg)
             return False
 
-    def transfer(
+    async def is_configured_async(self, verbose: bool = False) -> bool:
+        """Check Solana credentials without blocking the event loop on the key decode"""
+        private_key = os.getenv("SOLANA_PRIVATE_KEY")
+        if not private_key:
+            if verbose:
+                logger.debug("Solana private key not found in environment")
+            return False
+        if private_key == self._wallet_key:
+            return True
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._load_wallet, private_key
+            )
+            return True
+        except Exception as e:
+            if verbose:
+                logger.debug("Solana Configuration validation failed: %s", e)
+            return False
+
+    async def transfer_async(
         self, to_address: str, amount: float, token_mint: Optional[str] = None
     ) -> str:
-        res = SolanaTransferHelper.transfer(
+        from src.helpers.solana.transfer import SolanaTransferHelper
+
+        res = await SolanaTransferHelper.transfer(
             self._get_connection_async(),
             self._get_wallet(),
             to_address,
             amount,
             token_mint,
         )
-        res = asyncio.run(res)
-        logger.debug(f"Transferred {amount} to {to_address}\nTransaction ID: {res}")
+        logger.debug("Transferred %s to %s\nTransaction ID: %s", amount, to_address, res)
         return res
 
+    def transfer(
+        self, to_address: str, amount: float, token_mint: Optional[str] = None
+    ) -> str:
+        return self._run(self.transfer_async(to_address, amount, token_mint))
+
     # todo: test on mainnet
-    def trade(
+    async def trade_async(
         self,
         output_mint: str,
         input_amount: float,
         input_mint: Optional[str] = SPL_TOKENS["USDC"],
         slippage_bps: int = 100,
     ) -> str:
-        logger.info(f"Swapping {input_amount} for {output_mint}")
+        from src.helpers.solana.read import SolanaReadHelper
+        from src.helpers.solana.trade import TradeManager
+
+        logger.info("Swapping %s for %s", input_amount, output_mint)
         wallet = self._get_wallet()
         async_client = self._get_connection_async()
         jupiter = self._get_jupiter(wallet, async_client)
-        res = TradeManager.trade(
-            async_client,
-            wallet,
-            jupiter,
-            output_mint,
-            input_amount,
-            input_mint,
-            slippage_bps,
+
+        # Preflight reads share one round trip. When the input decimals are already
+        # known the Jupiter quote does not depend on it, so both run concurrently;
+        # nothing is signed or sent until the preflight has passed
+        decimals = SolanaReadHelper.known_mint_decimals(input_mint)
+        preflight = [("getBalance", [str(wallet.pubkey())])]
+        if decimals is None:
+            preflight.append(
+                ("getAccountInfo", [str(input_mint), {"encoding": "base64"}])
+            )
+            results = await self._rpc_batch(preflight)
+            mint_info = results[1]["value"]
+            if mint_info is None:
+                raise SolanaConnectionError(f"Input mint {input_mint} not found")
+            decimals = SolanaReadHelper.mint_decimals(
+                base64.b64decode(mint_info["data"][0])
+            )
+            if decimals is None:
+                raise SolanaConnectionError(
+                    f"Input mint {input_mint} is not initialized"
+                )
+            SolanaReadHelper.remember_mint_decimals(input_mint, decimals)
+            transaction_data = await TradeManager.build_swap(
+                jupiter, output_mint, input_amount, input_mint, slippage_bps, decimals
+            )
+        else:
+            results, transaction_data = await asyncio.gather(
+                self._rpc_batch(preflight),
+                TradeManager.build_swap(
+                    jupiter, output_mint, input_amount, input_mint, slippage_bps, decimals
+                ),
+            )
+
+        if not results[0]["value"]:
+            raise SolanaConnectionError("Wallet has no SOL to pay transaction fees")
+
+        return await TradeManager.send_swap(async_client, wallet, transaction_data)
+
+    def trade(
+        self,
+        output_mint: str,
+        input_amount: float,
+        input_mint: Optional[str] = SPL_TOKENS["USDC"],
+        slippage_bps: int = 100,
+    ) -> str:
+        return self._run(
+            self.trade_async(output_mint, input_amount, input_mint, slippage_bps)
         )
-        res = asyncio.run(res)
-        return res
+
+    async def get_balance_async(self, token_address: str = None) -> float:
+        if not token_address:
+            logger.info("Getting SOL balance")
+        else:
+            logger.info("Getting balance for %s", token_address)
+        future = asyncio.get_running_loop().create_future()
+        self._pending_balances.setdefault(token_address or None, []).append(future)
+        if self._balance_flush is None:
+            self._balance_flush = asyncio.create_task(self._flush_balances())
+        return await future
+
+    async def _flush_balances(self) -> None:
+        """Resolve every balance queued during the batch window with one RPC"""
+        # Let callers started in the same tick queue up; a lone read doesn't wait
+        await asyncio.sleep(0)
+        if sum(map(len, self._pending_balances.values())) > 1:
+            await asyncio.sleep(BALANCE_BATCH_WINDOW)
+        pending, self._pending_balances = self._pending_balances, {}
+        self._balance_flush = None
+        try:
+            balances = await self.get_balances_async(list(pending))
+        except Exception as error:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+            return
+        for token_address, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(balances.get(token_address))
 
     def get_balance(self, token_address: str = None) -> float:
+        # Sync callers block one at a time, so there is nothing to batch with
         if not token_address:
             logger.info("Getting SOL balance")
         else:
-            logger.info(f"Getting balance for {token_address}")
-        res = SolanaReadHelper.get_balance(
-            self._get_connection_async(), self._get_wallet(), token_address
+            logger.info("Getting balance for %s", token_address)
+        token_address = token_address or None
+        balances = self._run(self.get_balances_async([token_address]))
+        return balances.get(token_address)
+
+    async def get_balances_async(
+        self, token_addresses: List[Optional[str]]
+    ) -> Dict[Optional[str], Optional[float]]:
+        from src.helpers.solana.read import SolanaReadHelper
+
+        return await SolanaReadHelper.get_balances(
+            self._get_connection_async(), self._get_wallet(), token_addresses
         )
-        res = asyncio.run(res)
-        return res
 
-    def stake(self, amount: float) -> str:
-        logger.info(f"Staking {amount} SOL")
-        res = StakeManager.stake_with_jup(
+    def get_balances(
+        self, token_addresses: List[Optional[str]]
+    ) -> Dict[Optional[str], Optional[float]]:
+        return self._run(self.get_balances_async(token_addresses))
+
+    async def stake_async(self, amount: float) -> str:
+        from src.helpers.solana.stake import StakeManager
+
+        logger.info("Staking %s SOL", amount)
+        res = await StakeManager.stake_with_jup(
             self._get_connection_async(), self._get_wallet(), amount
         )
-        res = asyncio.run(res)
-        logger.debug(f"Staked {amount} SOL\nTransaction ID: {res}")
+        logger.debug("Staked %s SOL\nTransaction ID: %s", amount, res)
         return res
 
+    def stake(self, amount: float) -> str:
+        return self._run(self.stake_async(amount))
+
     # todo: test on mainnet
     def lend_assets(self, amount: float) -> str:
         return "Not implemented"
@@ -348,46 +597,89 @@ class SolanaConnection(BaseConnection):
         # res = AssetLender.lend_asset(
         #     self._get_connection_async(), self._get_wallet(), amount
         # )
-        # res = asyncio.run(res)
+        # res = self._run(res)
         # logger.debug(f"Lent {amount} USDC\nTransaction ID: {res}")
         # return res
 
-    def request_faucet(self) -> str:
+    async def request_faucet_async(self) -> str:
+        from src.helpers.solana.faucet import FaucetManager
+
         logger.info("Requesting faucet funds")
-        res = FaucetManager.request_faucet_funds(self)
-        res = asyncio.run(res)
-        logger.debug(f"Requested faucet funds\nTransaction ID: {res}")
+        res = await FaucetManager.request_faucet_funds(
+            self._get_connection_async(), self._get_wallet()
+        )
+        logger.debug("Requested faucet funds\nTransaction ID: %s", res)
         return res
 
+    def request_faucet(self) -> str:
+        return self._run(self.request_faucet_async())
+
     def deploy_token(self, decimals: int = 9) -> str:
         return "Not implemented"
         # logger.info(f"STUB: Deploy token with {decimals} decimals")
         # res = TokenDeploymentManager.deploy_token(
         #     self._get_connection_async(), self._get_wallet(), decimals
         # )
-        # res = asyncio.run(res)
+        # res = self._run(res)
         # logger.debug(
         #     f"Deployed token with {decimals} decimals\nToken Mint: {res['mint']}"
         # )
         # return res["mint"]
 
+    async def fetch_price_async(self, token_id: str) -> float:
+        from src.helpers.solana.read import SolanaReadHelper
+
+        return await SolanaReadHelper.fetch_price(self._get_http(), token_id)
+
     def fetch_price(self, token_id: str) -> float:
-        return SolanaReadHelper.fetch_price(token_id)
+        return self._run(self.fetch_price_async(token_id))
 
     # todo: test on mainnet
+    async def get_tps_async(self) -> int:
+        from src.helpers.solana.performance import SolanaPerformanceTracker
+
+        return await SolanaPerformanceTracker.fetch_current_tps(
+            self._get_connection_async()
+        )
+
     def get_tps(self) -> int:
-        res = SolanaPerformanceTracker.fetch_current_tps(self._get_connection_async())
-        res = asyncio.run(res)
-        return res
+        return self._run(self.get_tps_async())
+
+    async def _cached_lookup(self, cache: OrderedDict, key: str, lookup):
+        """Memoize a token lookup in an LRU; misses are not cached so they can be retried"""
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        result = await lookup(self._get_http(), key)
+        if result is not None:
+            cache[key] = result
+            if len(cache) > TOKEN_LOOKUP_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+
+    async def get_token_by_ticker_async(self, ticker: str) -> str:
+        from src.helpers.solana.read import SolanaReadHelper
 
-    def get_token_by_ticker(self, ticker: str) -> str:
         ticker = ticker.upper()
-        if ticker in SPL_TOKENS:
-            return SPL_TOKENS[ticker]
-        return SolanaReadHelper.get_token_by_ticker(ticker)
+        address = _SPL_UPPER.get(ticker)
+        if address:
+            return address
+        return await self._cached_lookup(
+            self._ticker_cache, ticker, SolanaReadHelper.get_token_by_ticker
+        )
+
+    def get_token_by_ticker(self, ticker: str) -> str:
+        return self._run(self.get_token_by_ticker_async(ticker))
+
+    async def get_token_by_address_async(self, mint: str) -> Dict[str, Any]:
+        from src.helpers.solana.read import SolanaReadHelper
+
+        return await self._cached_lookup(
+            self._address_cache, str(mint), SolanaReadHelper.get_token_by_address
+        )
 
     def get_token_by_address(self, mint: str) -> Dict[str, Any]:
-        return SolanaReadHelper.get_token_by_address(mint)
+        return self._run(self.get_token_by_address_async(mint))
 
     # todo: test on mainnet
     def launch_pump_token(
@@ -409,7 +701,7 @@ class SolanaConnection(BaseConnection):
         #    image_url,
         #    options,
         # )
-        # res = asyncio.run(res)
+        # res = self._run(res)
         # logger.debug(
         #    f"Launched Pump & Fun token {token_ticker}\nToken Mint: {res['mint']}"
         # )
@@ -417,14 +709,14 @@ class SolanaConnection(BaseConnection):
 
     def perform_action(self, action_name: str, kwargs) -> Any:
         """Execute a Solana action with validation"""
-        if action_name not in self.actions:
-            raise KeyError(f"Unknown action: {action_name}")
+        try:
+            action = self.actions[action_name]
+            method = self._dispatch[action_name]
+        except KeyError:
+            raise KeyError(f"Unknown action: {action_name}") from None
 
-        action = self.actions[action_name]
         errors = action.validate_params(kwargs)
         if errors:
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
 
-        method_name = action_name.replace("-", "_")
-        method = getattr(self, method_name)
         return method(**kwargs)
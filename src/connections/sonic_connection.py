@@ -2,16 +2,59 @@ import logging
 import os
 import requests
 import time
-from typing import Dict, Any, Optional
+import asyncio
+import aiohttp
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from dotenv import load_dotenv, set_key
 from web3 import Web3
+from web3.contract import Contract
+from eth_account.signers.local import LocalAccount
+from eth_typing import ChecksumAddress
+from hexbytes import HexBytes
 from web3.middleware import geth_poa_middleware
 from src.constants.abi import ERC20_ABI
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
 from src.constants.networks import SONIC_NETWORKS
+from src.helpers.http import dumps, loads
 
 logger = logging.getLogger("connections.sonic_connection")
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+load_dotenv()
+
+# Gas limits for plain ERC20 calls (approve ~46k, transfer ~65k) plus headroom,
+# used instead of an eth_estimateGas round trip per transaction
+APPROVE_GAS_LIMIT = 60000
+TRANSFER_GAS_LIMIT = 100000
+# A swap sent right behind its approval can't be estimated (the allowance isn't on chain
+# yet), so it gets this fixed limit; unused gas is refunded
+SWAP_GAS_LIMIT = 500000
+
+TICKER_CACHE_SIZE = 1024
+TICKER_CACHE_TTL = 24 * 3600  # a discovered token address does not change
+TICKER_MISS_TTL = 300  # unknown tickers are retried after this many seconds
+
+# Shared keep-alive session for JSON-RPC batches and the Dexscreener/Kyberswap APIs,
+# so consecutive route and build calls reuse one TLS connection
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+
+# Powers of ten indexed by ERC20 decimals (a uint8), so amount scaling is a tuple lookup
+_POW10 = tuple(10 ** i for i in range(256))
+
+
+@lru_cache(maxsize=2048)
+def _cs(address: str) -> ChecksumAddress:
+    """EIP-55 checksum an address; memoized since it keccak-hashes the hex each time"""
+    return Web3.to_checksum_address(address)
+
 
 class SonicConnectionError(Exception):
     """Base exception for Sonic connection errors"""
@@ -22,6 +65,13 @@ class SonicConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         logger.info("Initializing Sonic connection...")
         self._web3 = None
+        self._chain_id: Optional[int] = None
+        self._account: Optional[LocalAccount] = None
+        self._account_pk: Optional[str] = None
+        self._decimals_cache: Dict[str, int] = {}
+        self._erc20_cache: Dict[str, Contract] = {}
+        # ticker.lower() -> (expiry, address or None), least recently used first
+        self._ticker_cache: OrderedDict = OrderedDict()
         
         # Get network configuration
         network = config.get("network", "mainnet")
@@ -31,6 +81,10 @@ class SonicConnection(BaseConnection):
         network_config = SONIC_NETWORKS[network]
         self.explorer = network_config["scanner_url"]
         self.rpc_url = network_config["rpc_url"]
+        # Optional websocket endpoint; one persistent socket serves every web3 call
+        self.ws_url = config.get("ws_url") or network_config.get("ws_url")
+        # POA chains carry oversized extraData; skip the middleware where it isn't needed
+        self.poa = config.get("poa", network_config.get("poa", True))
         
         super().__init__(config)
         self._initialize_web3()
@@ -45,17 +99,96 @@ class SonicConnection(BaseConnection):
     def _initialize_web3(self):
         """Initialize Web3 connection"""
         if not self._web3:
-            self._web3 = Web3(Web3.HTTPProvider(self.rpc_url))
-            self._web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+            if self.ws_url:
+                provider = Web3.WebsocketProvider(self.ws_url, websocket_kwargs={"max_size": 2**23})
+            else:
+                provider = Web3.HTTPProvider(self.rpc_url, request_kwargs={"timeout": 10}, session=_SESSION)
+            self._web3 = Web3(provider)
+            if self.poa:
+                self._web3.middleware_onion.inject(geth_poa_middleware, name="geth_poa", layer=0)
             if not self._web3.is_connected():
                 raise SonicConnectionError("Failed to connect to Sonic network")
             
             try:
-                chain_id = self._web3.eth.chain_id
-                logger.info(f"Connected to network with chain ID: {chain_id}")
+                # The chain ID never changes for an endpoint, so keep it for building transactions
+                self._chain_id = self._web3.eth.chain_id
+                logger.info(f"Connected to network with chain ID: {self._chain_id}")
             except Exception as e:
                 logger.warning(f"Could not get chain ID: {e}")
 
+    def _get_account(self) -> LocalAccount:
+        """Get the wallet account, derived again only when the private key changes"""
+        private_key = os.getenv('SONIC_PRIVATE_KEY')
+        if not private_key:
+            raise SonicConnectionError("No wallet configured")
+        if private_key != self._account_pk:
+            self._account = self._web3.eth.account.from_key(private_key)
+            self._account_pk = private_key
+        return self._account
+
+    def _get_chain_id(self) -> int:
+        if self._chain_id is None:
+            self._chain_id = self._web3.eth.chain_id
+        return self._chain_id
+
+    def _erc20_tx(self, contract: Contract, fn_name: str, args: list,
+                  nonce: int, gas_price: int, gas: int) -> Dict[str, Any]:
+        """Assemble an ERC20 call transaction without build_transaction's extra RPCs"""
+        return {
+            'from': self._get_account().address,
+            'to': contract.address,
+            'data': contract.encodeABI(fn_name=fn_name, args=args),
+            'nonce': nonce,
+            'gasPrice': gas_price,
+            'gas': gas,
+            'chainId': self._get_chain_id()
+        }
+
+    def _batch_rpc(self, calls: List[Tuple[str, list]]) -> List[Any]:
+        """Send several JSON-RPC calls in one HTTP request and return their results in order"""
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        response = _SESSION.post(self.rpc_url, data=dumps(payload), headers=_JSON_HEADERS, timeout=10)
+        response.raise_for_status()
+
+        reply = loads(response.content)
+        # Nodes that reject the whole batch answer with a single error object
+        if not isinstance(reply, list):
+            error = reply.get("error") if isinstance(reply, dict) else reply
+            raise SonicConnectionError(f"Batch RPC request failed: {error}")
+
+        results = {}
+        for item in reply:
+            if "error" in item:
+                raise SonicConnectionError(f"RPC call {calls[item['id']][0]} failed: {item['error']}")
+            results[item["id"]] = item["result"]
+        missing = [calls[i][0] for i in range(len(calls)) if i not in results]
+        if missing:
+            raise SonicConnectionError(f"Batch RPC reply has no result for: {', '.join(missing)}")
+        return [results[i] for i in range(len(calls))]
+
+    def _erc20(self, token_address: str) -> Contract:
+        """Get the ERC20 contract object for a token, built once per address"""
+        address = _cs(token_address)
+        contract = self._erc20_cache.get(address)
+        if contract is None:
+            contract = self._web3.eth.contract(address=address, abi=self.ERC20_ABI)
+            self._erc20_cache[address] = contract
+        return contract
+
+    def _decimals(self, token_address: str) -> int:
+        """Get token decimals, cached per token since they never change"""
+        if token_address.lower() == self.NATIVE_TOKEN.lower():
+            return 18
+        address = _cs(token_address)
+        decimals = self._decimals_cache.get(address)
+        if decimals is None:
+            decimals = self._erc20(address).functions.decimals().call()
+            self._decimals_cache[address] = decimals
+        return decimals
+
     @property
     def is_llm_provider(self) -> bool:
         return False
@@ -74,38 +207,53 @@ class SonicConnection(BaseConnection):
 
     def get_token_by_ticker(self, ticker: str) -> Optional[str]:
         """Get token address by ticker symbol"""
-        try:
-            if ticker.lower() in ["s", "S"]:
-                return "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
-                
-            response = requests.get(
-                f"https://api.dexscreener.com/latest/dex/search?q={ticker}"
-            )
-            response.raise_for_status()
+        ticker_lower = ticker.lower()
+        if ticker_lower == "s":
+            return self.NATIVE_TOKEN
 
-            data = response.json()
-            if not data.get('pairs'):
-                return None
-
-            sonic_pairs = [
-                pair for pair in data["pairs"] if pair.get("chainId") == "sonic"
-            ]
-            sonic_pairs.sort(key=lambda x: x.get("fdv", 0), reverse=True)
-
-            sonic_pairs = [
-                pair
-                for pair in sonic_pairs
-                if pair.get("baseToken", {}).get("symbol", "").lower() == ticker.lower()
-            ]
-
-            if sonic_pairs:
-                return sonic_pairs[0].get("baseToken", {}).get("address")
-            return None
+        cached = self._ticker_cache.get(ticker_lower)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._ticker_cache.move_to_end(ticker_lower)
+                return cached[1]
+            del self._ticker_cache[ticker_lower]
 
+        try:
+            address = self._fetch_token_by_ticker(ticker, ticker_lower)
         except Exception as error:
+            # Failed lookups are not cached so the next call retries
             logger.error(f"Error fetching token address: {str(error)}")
             return None
 
+        ttl = TICKER_CACHE_TTL if address else TICKER_MISS_TTL
+        self._ticker_cache[ticker_lower] = (time.monotonic() + ttl, address)
+        if len(self._ticker_cache) > TICKER_CACHE_SIZE:
+            self._ticker_cache.popitem(last=False)
+        return address
+
+    def _fetch_token_by_ticker(self, ticker: str, ticker_lower: str) -> Optional[str]:
+        """Look the ticker up on Dexscreener, picking the Sonic pair with the highest FDV"""
+        response = _SESSION.get(
+            f"https://api.dexscreener.com/latest/dex/search?q={ticker}"
+        )
+        response.raise_for_status()
+
+        data = loads(response.content)
+        if not data.get('pairs'):
+            return None
+
+        sonic_pairs = (
+            pair
+            for pair in data["pairs"]
+            if pair.get("chainId") == "sonic"
+            and pair.get("baseToken", {}).get("symbol", "").lower() == ticker_lower
+        )
+        best = max(sonic_pairs, key=lambda x: x.get("fdv") or 0, default=None)
+
+        if best:
+            return best.get("baseToken", {}).get("address")
+        return None
+
     def register_actions(self) -> None:
         self.actions = {
             "get-token-by-ticker": Action(
@@ -144,6 +292,11 @@ class SonicConnection(BaseConnection):
             )
         }
 
+    @classmethod
+    def reload_env(cls) -> None:
+        """Pick up .env edits made after import"""
+        load_dotenv(override=True)
+
     def configure(self) -> bool:
         logger.info("\n🔷 SONIC CHAIN SETUP")
         if self.is_configured():
@@ -161,6 +314,7 @@ class SonicConnection(BaseConnection):
             if not private_key.startswith('0x'):
                 private_key = '0x' + private_key
             set_key('.env', 'SONIC_PRIVATE_KEY', private_key)
+            self.reload_env()
 
             if not self._web3.is_connected():
                 raise SonicConnectionError("Failed to connect to Sonic network")
@@ -175,7 +329,6 @@ class SonicConnection(BaseConnection):
 
     def is_configured(self, verbose: bool = False) -> bool:
         try:
-            load_dotenv()
             if not os.getenv('SONIC_PRIVATE_KEY'):
                 if verbose:
                     logger.error("Missing SONIC_PRIVATE_KEY in .env")
@@ -196,20 +349,11 @@ class SonicConnection(BaseConnection):
         """Get balance for an address or the configured wallet"""
         try:
             if not address:
-                private_key = os.getenv('SONIC_PRIVATE_KEY')
-                if not private_key:
-                    raise SonicConnectionError("No wallet configured")
-                account = self._web3.eth.account.from_key(private_key)
-                address = account.address
+                address = self._get_account().address
 
             if token_address:
-                contract = self._web3.eth.contract(
-                    address=Web3.to_checksum_address(token_address),
-                    abi=self.ERC20_ABI
-                )
-                balance = contract.functions.balanceOf(address).call()
-                decimals = contract.functions.decimals().call()
-                return balance / (10 ** decimals)
+                balance = self._erc20(token_address).functions.balanceOf(address).call()
+                return balance / _POW10[self._decimals(token_address)]
             else:
                 balance = self._web3.eth.get_balance(address)
                 return self._web3.from_wei(balance, 'ether')
@@ -221,35 +365,28 @@ class SonicConnection(BaseConnection):
     def transfer(self, to_address: str, amount: float, token_address: Optional[str] = None) -> str:
         """Transfer $S or tokens to an address"""
         try:
-            private_key = os.getenv('SONIC_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
-            chain_id = self._web3.eth.chain_id
+            account = self._get_account()
+            results = self._batch_rpc([
+                ("eth_getTransactionCount", [account.address, "pending"]),
+                ("eth_gasPrice", []),
+            ])
+            nonce = int(results[0], 16)
+            gas_price = int(results[1], 16)
             
             if token_address:
-                contract = self._web3.eth.contract(
-                    address=Web3.to_checksum_address(token_address),
-                    abi=self.ERC20_ABI
-                )
-                decimals = contract.functions.decimals().call()
-                amount_raw = int(amount * (10 ** decimals))
+                contract = self._erc20(token_address)
+                amount_raw = int(amount * _POW10[self._decimals(token_address)])
                 
-                tx = contract.functions.transfer(
-                    Web3.to_checksum_address(to_address),
-                    amount_raw
-                ).build_transaction({
-                    'from': account.address,
-                    'nonce': self._web3.eth.get_transaction_count(account.address),
-                    'gasPrice': self._web3.eth.gas_price,
-                    'chainId': chain_id
-                })
+                tx = self._erc20_tx(contract, "transfer", [_cs(to_address), amount_raw],
+                                    nonce, gas_price, TRANSFER_GAS_LIMIT)
             else:
                 tx = {
-                    'nonce': self._web3.eth.get_transaction_count(account.address),
-                    'to': Web3.to_checksum_address(to_address),
+                    'nonce': nonce,
+                    'to': _cs(to_address),
                     'value': self._web3.to_wei(amount, 'ether'),
                     'gas': 21000,
-                    'gasPrice': self._web3.eth.gas_price,
-                    'chainId': chain_id
+                    'gasPrice': gas_price,
+                    'chainId': self._get_chain_id()
                 }
 
             signed = account.sign_transaction(tx)
@@ -263,110 +400,128 @@ class SonicConnection(BaseConnection):
             logger.error(f"Transfer failed: {e}")
             raise
 
-    def _get_swap_route(self, token_in: str, token_out: str, amount_in: float) -> Dict:
-        """Get the best swap route from Kyberswap API"""
+    def _build_swap_route_request(self, token_in: str, token_out: str, amount_in: float) -> Tuple[str, Dict, Dict, int]:
+        """Build the Kyberswap route request (url, headers, params, raw input amount)"""
+        # Convert amount to raw value
+        if token_in.lower() == self.NATIVE_TOKEN.lower():
+            amount_raw = self._web3.to_wei(amount_in, 'ether')
+        else:
+            amount_raw = int(amount_in * _POW10[self._decimals(token_in)])
+        
+        url = f"{self.aggregator_api}/routes"
+        headers = {"x-client-id": "ZerePyBot"}
+        params = {
+            "tokenIn": token_in,
+            "tokenOut": token_out,
+            "amountIn": str(amount_raw),
+            "gasInclude": "true"
+        }
+        return url, headers, params, amount_raw
+
+    def _build_swap_data_request(self, route_summary: Dict, slippage: float) -> Tuple[str, Dict, Dict]:
+        """Build the Kyberswap route/build request (url, headers, payload)"""
+        account = self._get_account()
+        
+        url = f"{self.aggregator_api}/route/build"
+        headers = {"x-client-id": "zerepy"}
+        payload = {
+            "routeSummary": route_summary,
+            "sender": account.address,
+            "recipient": account.address,
+            "slippageTolerance": int(slippage * 100),  # Convert to bps
+            "deadline": int(time.time() + 1200),  # 20 minutes
+            "source": "ZerePyBot"
+        }
+        return url, headers, payload
+
+    @staticmethod
+    def _check_aggregator_response(data: Dict) -> Dict:
+        if data.get("code") != 0:
+            raise SonicConnectionError(f"API error: {data.get('message')}")
+        return data["data"]
+
+    def _get_swap_route(self, token_in: str, token_out: str, amount_in: float) -> Tuple[Dict, int]:
+        """Get the best swap route from Kyberswap API, with the raw input amount it was quoted for"""
         try:
-            # Handle native token address
-            
-            # Convert amount to raw value
-            if token_in.lower() == self.NATIVE_TOKEN.lower():
-                amount_raw = self._web3.to_wei(amount_in, 'ether')
-            else:
-                token_contract = self._web3.eth.contract(
-                    address=Web3.to_checksum_address(token_in),
-                    abi=self.ERC20_ABI
-                )
-                decimals = token_contract.functions.decimals().call()
-                amount_raw = int(amount_in * (10 ** decimals))
-            
-            # Set up API request
-            url = f"{self.aggregator_api}/routes"
-            headers = {"x-client-id": "ZerePyBot"}
-            params = {
-                "tokenIn": token_in,
-                "tokenOut": token_out,
-                "amountIn": str(amount_raw),
-                "gasInclude": "true"
-            }
-            
-            response = requests.get(url, headers=headers, params=params)
+            url, headers, params, amount_raw = self._build_swap_route_request(token_in, token_out, amount_in)
+            response = _SESSION.get(url, headers=headers, params=params)
             response.raise_for_status()
-            
-            data = response.json()
-            if data.get("code") != 0:
-                raise SonicConnectionError(f"API error: {data.get('message')}")
-                
-            return data["data"]
+            return self._check_aggregator_response(loads(response.content)), amount_raw
                 
         except Exception as e:
             logger.error(f"Failed to get swap route: {e}")
             raise
 
+    async def _aget_swap_route(self, session: aiohttp.ClientSession, token_in: str, token_out: str, amount_in: float) -> Tuple[Dict, int]:
+        """Async variant of _get_swap_route on a caller-owned aiohttp session"""
+        try:
+            url, headers, params, amount_raw = await asyncio.to_thread(
+                self._build_swap_route_request, token_in, token_out, amount_in
+            )
+            async with session.get(url, headers=headers, params=params) as response:
+                response.raise_for_status()
+                return self._check_aggregator_response(loads(await response.read())), amount_raw
+
+        except Exception as e:
+            logger.error(f"Failed to get swap route: {e}")
+            raise
+
     def _get_encoded_swap_data(self, route_summary: Dict, slippage: float = 0.5) -> str:
         """Get encoded swap data from Kyberswap API"""
         try:
-            private_key = os.getenv('SONIC_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
-            
-            url = f"{self.aggregator_api}/route/build"
-            headers = {"x-client-id": "zerepy"}
-            
-            payload = {
-                "routeSummary": route_summary,
-                "sender": account.address,
-                "recipient": account.address,
-                "slippageTolerance": int(slippage * 100),  # Convert to bps
-                "deadline": int(time.time() + 1200),  # 20 minutes
-                "source": "ZerePyBot"
-            }
-            
-            response = requests.post(url, headers=headers, json=payload)
+            url, headers, payload = self._build_swap_data_request(route_summary, slippage)
+            response = _SESSION.post(url, headers={**headers, **_JSON_HEADERS}, data=dumps(payload))
             response.raise_for_status()
-            
-            data = response.json()
-            if data.get("code") != 0:
-                raise SonicConnectionError(f"API error: {data.get('message')}")
-                
-            return data["data"]["data"]
+            return self._check_aggregator_response(loads(response.content))["data"]
                 
         except Exception as e:
             logger.error(f"Failed to encode swap data: {e}")
             raise
+
+    async def _aget_encoded_swap_data(self, session: aiohttp.ClientSession, route_summary: Dict, slippage: float = 0.5) -> str:
+        """Async variant of _get_encoded_swap_data on a caller-owned aiohttp session"""
+        try:
+            url, headers, payload = self._build_swap_data_request(route_summary, slippage)
+            async with session.post(url, headers=headers, json=payload) as response:
+                response.raise_for_status()
+                return self._check_aggregator_response(loads(await response.read()))["data"]
+
+        except Exception as e:
+            logger.error(f"Failed to encode swap data: {e}")
+            raise
     
-    def _handle_token_approval(self, token_address: str, spender_address: str, amount: int) -> None:
-        """Handle token approval for spender"""
+    def _handle_token_approval(self, token_address: str, spender_address: str, amount: int,
+                               nonce: Optional[int] = None, gas_price: Optional[int] = None,
+                               current_allowance: Optional[int] = None) -> Optional[HexBytes]:
+        """Handle token approval for spender; returns the approval tx hash if one was sent"""
         try:
-            private_key = os.getenv('SONIC_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = self._get_account()
             
-            token_contract = self._web3.eth.contract(
-                address=Web3.to_checksum_address(token_address),
-                abi=self.ERC20_ABI
-            )
+            token_contract = self._erc20(token_address)
             
-            # Check current allowance
-            current_allowance = token_contract.functions.allowance(
-                account.address,
-                spender_address
-            ).call()
+            # Check current allowance unless the caller already read it
+            if current_allowance is None:
+                current_allowance = token_contract.functions.allowance(
+                    account.address,
+                    spender_address
+                ).call()
             
             if current_allowance < amount:
-                approve_tx = token_contract.functions.approve(
-                    spender_address,
-                    amount
-                ).build_transaction({
-                    'from': account.address,
-                    'nonce': self._web3.eth.get_transaction_count(account.address),
-                    'gasPrice': self._web3.eth.gas_price,
-                    'chainId': self._web3.eth.chain_id
-                })
+                approve_tx = self._erc20_tx(
+                    token_contract, "approve", [spender_address, amount],
+                    self._web3.eth.get_transaction_count(account.address, "pending") if nonce is None else nonce,
+                    self._web3.eth.gas_price if gas_price is None else gas_price,
+                    APPROVE_GAS_LIMIT
+                )
                 
                 signed_approve = account.sign_transaction(approve_tx)
                 tx_hash = self._web3.eth.send_raw_transaction(signed_approve.rawTransaction)
                 logger.info(f"Approval transaction sent: {self._get_explorer_link(tx_hash.hex())}")
                 
-                # Wait for approval to be mined
-                self._web3.eth.wait_for_transaction_receipt(tx_hash)
+                # The caller waits for it to be mined after sending its follow-up tx at
+                # nonce + 1, which is ordered after the approval anyway
+                return tx_hash
+            return None
                 
         except Exception as e:
             logger.error(f"Approval failed: {e}")
@@ -375,61 +530,89 @@ class SonicConnection(BaseConnection):
     def swap(self, token_in: str, token_out: str, amount: float, slippage: float = 0.5) -> str:
         """Execute a token swap using the KyberSwap router"""
         try:
-            private_key = os.getenv('SONIC_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = self._get_account()
+
+            is_native = token_in.lower() == self.NATIVE_TOKEN.lower()
+
+            # Get optimal swap route first: its router address lets the allowance join
+            # the preflight batch below (the input decimals it needs are cached)
+            route_data, amount_raw = self._get_swap_route(token_in, token_out, amount)
+            router_address = _cs(route_data["routerAddress"])
+
+            # Nonce, gas price, the input balance and the router allowance are independent
+            # reads, so fetch them in one JSON-RPC batch instead of one round trip each
+            calls = [
+                ("eth_getTransactionCount", [account.address, "pending"]),
+                ("eth_gasPrice", []),
+            ]
+            if is_native:
+                calls.append(("eth_getBalance", [account.address, "latest"]))
+            else:
+                token_contract = self._erc20(token_in)
+                for fn_name, args in (("balanceOf", [account.address]),
+                                      ("allowance", [account.address, router_address])):
+                    calls.append(("eth_call", [{
+                        "to": token_contract.address,
+                        "data": token_contract.encodeABI(fn_name=fn_name, args=args)
+                    }, "latest"]))
+            results = self._batch_rpc(calls)
+            nonce = int(results[0], 16)
+            gas_price = int(results[1], 16)
 
             # Check token balance before proceeding
-            current_balance = self.get_balance(
-                address=account.address,
-                token_address=None if token_in.lower() == self.NATIVE_TOKEN.lower() else token_in
-            )
+            decimals = 18 if is_native else self._decimals(token_in)
+            current_balance = int(results[2], 16) / _POW10[decimals]
             
             if current_balance < amount:
                 raise ValueError(f"Insufficient balance. Required: {amount}, Available: {current_balance}")
-                
-            # Get optimal swap route
-            route_data = self._get_swap_route(token_in, token_out, amount)
             
             # Get encoded swap data
             encoded_data = self._get_encoded_swap_data(route_data["routeSummary"], slippage)
             
-            # Get router address from route data
-            router_address = route_data["routerAddress"]
-            
             # Handle token approval if not using native token
-            if token_in.lower() != self.NATIVE_TOKEN.lower():
-                if token_in.lower() == "0x039e2fb66102314ce7b64ce5ce3e5183bc94ad38".lower():  # $S token
-                    amount_raw = self._web3.to_wei(amount, 'ether')
-                else:
-                    token_contract = self._web3.eth.contract(
-                        address=Web3.to_checksum_address(token_in),
-                        abi=self.ERC20_ABI
-                    )
-                    decimals = token_contract.functions.decimals().call()
-                    amount_raw = int(amount * (10 ** decimals))
-                self._handle_token_approval(token_in, router_address, amount_raw)
+            # Approve exactly the amount the route was quoted for
+            approval_hash = None
+            if not is_native:
+                approval_hash = self._handle_token_approval(
+                    token_in, router_address, amount_raw, nonce, gas_price,
+                    current_allowance=int(results[3], 16)
+                )
+                if approval_hash is not None:
+                    nonce += 1
             
             # Prepare transaction
             tx = {
                 'from': account.address,
-                'to': Web3.to_checksum_address(router_address),
+                'to': router_address,
                 'data': encoded_data,
-                'nonce': self._web3.eth.get_transaction_count(account.address),
-                'gasPrice': self._web3.eth.gas_price,
-                'chainId': self._web3.eth.chain_id,
-                'value': self._web3.to_wei(amount, 'ether') if token_in.lower() == self.NATIVE_TOKEN.lower() else 0
+                'nonce': nonce,
+                'gasPrice': gas_price,
+                'chainId': self._get_chain_id(),
+                'value': self._web3.to_wei(amount, 'ether') if is_native else 0
             }
             
-            # Estimate gas
-            try:
-                tx['gas'] = self._web3.eth.estimate_gas(tx)
-            except Exception as e:
-                logger.warning(f"Gas estimation failed: {e}, using default gas limit")
-                tx['gas'] = 500000  # Default gas limit
+            # Estimate gas; not possible while a pending approval is still unmined
+            if approval_hash is not None:
+                tx['gas'] = SWAP_GAS_LIMIT
+            else:
+                try:
+                    tx['gas'] = self._web3.eth.estimate_gas(tx)
+                except Exception as e:
+                    logger.warning(f"Gas estimation failed: {e}, using default gas limit")
+                    tx['gas'] = SWAP_GAS_LIMIT
             
             # Sign and send transaction
             signed_tx = account.sign_transaction(tx)
             tx_hash = self._web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+
+            # Only report success once the approval the swap depends on has landed
+            if approval_hash is not None:
+                receipt = self._web3.eth.wait_for_transaction_receipt(approval_hash)
+                if receipt.status != 1:
+                    raise SonicConnectionError(
+                        f"Approval reverted ({self._get_explorer_link(approval_hash.hex())}); "
+                        f"swap {self._get_explorer_link(tx_hash.hex())} will fail"
+                    )
             
             # Log and return explorer link immediately
             tx_link = self._get_explorer_link(tx_hash.hex())
@@ -443,8 +626,6 @@ class SonicConnection(BaseConnection):
         if action_name not in self.actions:
             raise KeyError(f"Unknown action: {action_name}")
 
-        load_dotenv()
-        
         if not self.is_configured(verbose=True):
             raise SonicConnectionError("Sonic is not properly configured")
 
@@ -1,6 +1,7 @@
 import logging
 import os
-from typing import Dict, Any
+import time
+from typing import Dict, Any, FrozenSet, Optional, Tuple
 from dotenv import load_dotenv, set_key
 from together import Together
 from together.types.models import ModelObject, ModelType
@@ -9,6 +10,9 @@ from src.connections.base_connection import BaseConnection, Action, ActionParame
 
 logger = logging.getLogger("connections.together_ai_connection")
 
+MODELS_CACHE_TTL = 300  # seconds before the model catalog is fetched again
+_TEXT_MODEL_TYPES = frozenset({ModelType.CHAT.value, ModelType.LANGUAGE.value})
+
 class TogetherAIConnectionError(Exception):
     """Base exception for Together AI connection errors"""
     pass
@@ -25,6 +29,11 @@ class TogetherAIConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self._client = None
+        self._client_key = None
+        # Set once the current key has passed a models.list() round trip
+        self._validated = False
+        # (chat/language model ids in API order, the same ids as a set, fetch time)
+        self._models_cache: Optional[Tuple[Tuple[str, ...], FrozenSet[str], float]] = None
 
     @property
     def is_llm_provider(self) -> bool:
@@ -71,13 +80,30 @@ class TogetherAIConnection(BaseConnection):
 
     def _get_client(self) -> Together:
         """Get or create Together AI client"""
-        if not self._client:
-            api_key = os.getenv("TOGETHER_API_KEY")
-            if not api_key:
-                raise TogetherAIConfigurationError("Together API key not found in environment")
+        api_key = os.getenv("TOGETHER_API_KEY")
+        if not api_key:
+            raise TogetherAIConfigurationError("Together API key not found in environment")
+        if not self._client or api_key != self._client_key:
             self._client = Together(api_key=api_key)
+            self._client_key = api_key
+            self._validated = False
+            self._models_cache = None
         return self._client
 
+    def _get_models(self) -> Tuple[Tuple[str, ...], FrozenSet[str], float]:
+        """Get the chat/language model catalog, refreshed every MODELS_CACHE_TTL seconds"""
+        client = self._get_client()
+        cached = self._models_cache
+        if cached is None or time.monotonic() - cached[2] > MODELS_CACHE_TTL:
+            ids = tuple(m.id for m in client.models.list() if m.type in _TEXT_MODEL_TYPES)
+            cached = self._models_cache = (ids, frozenset(ids), time.monotonic())
+        return cached
+
+    @classmethod
+    def reload_env(cls) -> None:
+        """Pick up .env edits made after import"""
+        load_dotenv(override=True)
+
     def configure(self) -> bool:
         """Sets up Together AI API authentication"""
         logger.info("\n🤖 TOGETHER AI API SETUP")
@@ -101,10 +127,11 @@ class TogetherAIConnection(BaseConnection):
                     f.write('')
 
             set_key('.env', 'TOGETHER_API_KEY', api_key)
+            self.reload_env()
             
             # Validate the API key by trying to list models
-            client = Together(api_key=api_key)
-            client.models.list()
+            self._get_models()
+            self._validated = True
             logger.info("\n✅ Together AI API configuration successfully saved!")
             logger.info("Your API key has been stored in the .env file.")
             return True
@@ -121,8 +148,10 @@ class TogetherAIConnection(BaseConnection):
             if not api_key:
                 return False
 
-            client = Together(api_key=api_key)
-            client.models.list()
+            self._get_client()
+            if not self._validated:
+                self._get_models()
+                self._validated = True
             return True
             
         except Exception as e:
@@ -139,7 +168,9 @@ class TogetherAIConnection(BaseConnection):
             if not model:
                 model = self.config["model"]
 
-            messages = [{"role": "user", "content": prompt},{"role": "system", "content": system_prompt},] 
+            messages = [{"role": "user", "content": prompt}]
+            if system_prompt:
+                messages.insert(0, {"role": "system", "content": system_prompt})
 
             completion = client.chat.completions.create(
                 model=model,
@@ -153,25 +184,17 @@ class TogetherAIConnection(BaseConnection):
 
     def check_model(self, model: str, **kwargs) -> bool:
         try:
-            client = self._get_client()
-            models = client.models.list()
-            model_names = model_names = [
-                m.id for m in models 
-                if m.type in {ModelType.CHAT.value, ModelType.LANGUAGE.value}
-            ]
-            return model in model_names
+            return model in self._get_models()[1]
         except Exception as e:
             raise TogetherAIAPIError(f"Checking model failed: {e}")
 
     def list_models(self, **kwargs) -> None:
         """List all available Together AI models"""
         try:
-            client = self._get_client()
-            models = client.models.list()
+            model_ids = self._get_models()[0]
             logger.info("\nTOGETHER AI MODELS:")
-            for i, model in enumerate(models, start=1):
-                if model.type in {ModelType.CHAT.value, ModelType.LANGUAGE.value}:
-                    logger.info(f"{i}. {model.id}")
+            for i, model_id in enumerate(model_ids, start=1):
+                logger.info(f"{i}. {model_id}")
 
         except Exception as e:
             raise TogetherAIAPIError(f"Listing models failed: {e}")
@@ -1,14 +1,39 @@
 import os
+import asyncio
 import logging
-from typing import Dict, Any, List, Tuple, Iterator
+import random
+import re
+import time
+from urllib.parse import urlencode
+import aiohttp
+from typing import Callable, Dict, Any, List, Tuple, Iterator
 from requests_oauthlib import OAuth1Session
-from dotenv import set_key, load_dotenv
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
-from src.helpers import print_h_bar
-import json,requests
+from src.helpers import load_env, print_h_bar, set_env_vars
+from src.helpers.http import loads
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger("connections.twitter_connection")
 
+API_BASE_URL = "https://api.twitter.com/2"
+FANOUT_LIMIT = 64  # concurrent requests when fetching for many users at once
+MAX_RATE_LIMIT_RETRIES = 3
+# Numeric path segments (user and tweet ids) share their route's rate-limit window
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+_UNKNOWN_AUTHOR = ("Unknown", "Unknown")
+
+# Twitter sessions retry transient 5xx only: 429s go to _make_request, which waits for
+# the window reset in x-rate-limit-reset instead of urllib3's short backoff
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504)),
+)
+_SESSION = requests.Session()
+_SESSION.mount("https://", _ADAPTER)
+
 class TwitterConnectionError(Exception):
     """Base exception for Twitter connection errors"""
     pass
@@ -21,10 +46,78 @@ class TwitterAPIError(TwitterConnectionError):
     """Raised when Twitter API requests fail"""
     pass
 
+_TWITTER_ACTIONS = {
+    "get-latest-tweets": Action(
+        name="get-latest-tweets",
+        parameters=[
+            ActionParameter("username", True, str, "Twitter username to get tweets from"),
+            ActionParameter("count", False, int, "Number of tweets to retrieve")
+        ],
+        description="Get the latest tweets from a user"
+    ),
+    "post-tweet": Action(
+        name="post-tweet",
+        parameters=[
+            ActionParameter("message", True, str, "Text content of the tweet")
+        ],
+        description="Post a new tweet"
+    ),
+    "read-timeline": Action(
+        name="read-timeline",
+        parameters=[
+            ActionParameter("count", False, int, "Number of tweets to read from timeline")
+        ],
+        description="Read tweets from user's timeline"
+    ),
+    "like-tweet": Action(
+        name="like-tweet",
+        parameters=[
+            ActionParameter("tweet_id", True, str, "ID of the tweet to like")
+        ],
+        description="Like a specific tweet"
+    ),
+    "reply-to-tweet": Action(
+        name="reply-to-tweet",
+        parameters=[
+            ActionParameter("tweet_id", True, str, "ID of the tweet to reply to"),
+            ActionParameter("message", True, str, "Reply message content")
+        ],
+        description="Reply to an existing tweet"
+    ),
+    "get-tweet-replies": Action(
+        name="get-tweet-replies",
+        parameters=[
+            ActionParameter("tweet_id", True, str, "ID of the tweet to query for replies")
+        ],
+        description="Fetch tweet replies"
+    ),
+    "stream-tweets": Action(
+        name="stream-tweets",
+        parameters=[
+            ActionParameter("filter_string", True, str, "Filter string for rules of the stream , e.g @username")
+        ],
+        description="Stream tweets based on filter rule"
+    )
+}
+
+
 class TwitterConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self._oauth_session = None
+        self._credentials = None
+        self._user_id = None
+        # "METHOD /route" -> (requests remaining, window reset epoch) from response headers
+        self._rate_state: Dict[str, Tuple[int, float]] = {}
+        # Bearer-token calls (stream rules and the stream) share one pooled session
+        self._session = _SESSION
+
+    @staticmethod
+    def _pooled(session: requests.Session) -> requests.Session:
+        """Mount the Twitter keep-alive adapter so OAuth calls reuse pooled connections"""
+        session.mount("https://", _ADAPTER)
+        session.headers["Connection"] = "keep-alive"
+        return session
 
     @property
     def is_llm_provider(self) -> bool:
@@ -48,64 +141,30 @@ class TwitterConnection(BaseConnection):
 
     def register_actions(self) -> None:
         """Register available Twitter actions"""
-        self.actions = {
-            "get-latest-tweets": Action(
-                name="get-latest-tweets",
-                parameters=[
-                    ActionParameter("username", True, str, "Twitter username to get tweets from"),
-                    ActionParameter("count", False, int, "Number of tweets to retrieve")
-                ],
-                description="Get the latest tweets from a user"
-            ),
-            "post-tweet": Action(
-                name="post-tweet",
-                parameters=[
-                    ActionParameter("message", True, str, "Text content of the tweet")
-                ],
-                description="Post a new tweet"
-            ),
-            "read-timeline": Action(
-                name="read-timeline",
-                parameters=[
-                    ActionParameter("count", False, int, "Number of tweets to read from timeline")
-                ],
-                description="Read tweets from user's timeline"
-            ),
-            "like-tweet": Action(
-                name="like-tweet",
-                parameters=[
-                    ActionParameter("tweet_id", True, str, "ID of the tweet to like")
-                ],
-                description="Like a specific tweet"
-            ),
-            "reply-to-tweet": Action(
-                name="reply-to-tweet",
-                parameters=[
-                    ActionParameter("tweet_id", True, str, "ID of the tweet to reply to"),
-                    ActionParameter("message", True, str, "Reply message content")
-                ],
-                description="Reply to an existing tweet"
-            ),
-            "get-tweet-replies": Action(
-                name="get-tweet-replies",
-                parameters=[
-                    ActionParameter("tweet_id", True, str, "ID of the tweet to query for replies")
-                ],
-                description="Fetch tweet replies"
-            ),
-            "stream-tweets": Action(
-                name="stream-tweets",
-                parameters=[
-                    ActionParameter("filter_string", True, str, "Filter string for rules of the stream , e.g @username")
-                ],
-                description="Stream tweets based on filter rule"
-            )
+        # Actions (and their compiled validators) are built once per process
+        self.actions = _TWITTER_ACTIONS
+        self._dispatch = {
+            name: getattr(self, name.replace('-', '_')) for name in self.actions
         }
 
+    @classmethod
+    def reload_env(cls) -> None:
+        """Pick up .env edits made after import"""
+        load_env(override=True)
+
+    def reset_credentials(self) -> None:
+        """Forget cached credentials and the session signed with them"""
+        self._credentials = None
+        self._user_id = None
+        self._oauth_session = None
+
     def _get_credentials(self) -> Dict[str, str]:
         """Get Twitter credentials from environment with validation"""
+        if self._credentials is not None:
+            return self._credentials
+
         logger.debug("Retrieving Twitter credentials")
-        load_dotenv()
+        load_env()
 
         required_vars = {
             'TWITTER_CONSUMER_KEY': 'consumer key',
@@ -134,15 +193,55 @@ class TwitterConnection(BaseConnection):
             credentials[env_var] = os.getenv(env_var)
 
         logger.debug("All required credentials found")
+        self._credentials = credentials
         return credentials
      
-    def _make_request(self, method: str, endpoint: str,use_bearer: bool = False, stream: bool = False, **kwargs) -> dict:
+    @staticmethod
+    def _rate_family(method: str, endpoint: str) -> str:
+        return f"{method.upper()} " + _ID_SEGMENT.sub("/:id", "/" + endpoint.lstrip("/"))
+
+    def _rate_limit_delay(self, family: str) -> float:
+        """Seconds to wait before the next call so an exhausted window isn't spent on 429s"""
+        state = self._rate_state.get(family)
+        if state is None or state[0] > 1:
+            return 0.0
+        return max(0.0, state[1] - time.time())
+
+    def _record_rate_limit(self, family: str, headers) -> None:
+        remaining = headers.get("x-rate-limit-remaining")
+        reset = headers.get("x-rate-limit-reset")
+        if remaining is not None and reset is not None:
+            self._rate_state[family] = (int(remaining), float(reset))
+
+    def _rate_limited_backoff(self, family: str, headers, attempt: int) -> float:
+        """Back-off after a 429: Retry-After or the window reset, at least exponential, jittered"""
+        retry_after = headers.get("retry-after")
+        reset = headers.get("x-rate-limit-reset")
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+        elif reset:
+            delay = float(reset) - time.time()
+        else:
+            delay = 0.0
+        delay = max(delay, 2 ** attempt) + random.uniform(0, 1)
+        self._rate_state[family] = (0, time.time() + delay)
+        return delay
+
+    def _get_user_id(self) -> str:
+        """The authenticated account's user ID, resolved once"""
+        if self._user_id is None:
+            self._user_id = self._get_credentials()['TWITTER_USER_ID']
+        return self._user_id
+
+    def _make_request(self, method: str, endpoint: str,use_bearer: bool = False, stream: bool = False,
+                      auth: Callable = None, **kwargs) -> dict:
         """
         Make a request to the Twitter API with error handling
 
         Args:
             method: HTTP method ('get', 'post', etc.)
             endpoint: API endpoint path
+            auth: Bearer auth hook to use instead of _bearer_oauth
             **kwargs: Additional request parameters
 
         Returns:
@@ -150,19 +249,34 @@ class TwitterConnection(BaseConnection):
         """
         logger.debug(f"Making {method.upper()} request to {endpoint}")
         try:
-            full_url = f"https://api.twitter.com/2/{endpoint.lstrip('/')}"
-
-            if use_bearer:
-                response = requests.request(
-                    method=method.lower(),
-                    url=full_url,
-                    auth=self._bearer_oauth,
-                    stream=stream,
-                    **kwargs
-                )
-            else:
-                oauth = self._get_oauth()
-                response = getattr(oauth, method.lower())(full_url, **kwargs)
+            full_url = f"{API_BASE_URL}/{endpoint.lstrip('/')}"
+            family = self._rate_family(method, endpoint)
+
+            # A 429 means the request was not processed, so it is safe to resend even for
+            # POST; idempotent 5xx retries are handled by the shared session adapter
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                delay = self._rate_limit_delay(family)
+                if delay:
+                    logger.info(f"Rate limit window for {family} exhausted, waiting {delay:.0f}s")
+                    time.sleep(delay)
+
+                if use_bearer:
+                    response = self._session.request(
+                        method,
+                        full_url,
+                        auth=auth or self._bearer_oauth,
+                        stream=stream,
+                        **kwargs
+                    )
+                else:
+                    response = self._get_oauth().request(method, full_url, **kwargs)
+
+                self._record_rate_limit(family, response.headers)
+                if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                    break
+                delay = self._rate_limited_backoff(family, response.headers, attempt)
+                logger.warning(f"Rate limited on {family}, retrying in {delay:.0f}s")
+                response.close()
 
             if not stream and response.status_code not in [200, 201]:
                 logger.error(
@@ -177,7 +291,7 @@ class TwitterConnection(BaseConnection):
             if stream:
                 return response
         
-            return response.json()
+            return loads(response.content)
 
         except Exception as e:
             raise TwitterAPIError(f"API request failed: {str(e)}")
@@ -188,13 +302,13 @@ class TwitterConnection(BaseConnection):
             logger.debug("Creating new OAuth session")
             try:
                 credentials = self._get_credentials()
-                self._oauth_session = OAuth1Session(
+                self._oauth_session = self._pooled(OAuth1Session(
                     credentials['TWITTER_CONSUMER_KEY'],
                     client_secret=credentials['TWITTER_CONSUMER_SECRET'],
                     resource_owner_key=credentials['TWITTER_ACCESS_TOKEN'],
                     resource_owner_secret=credentials[
                         'TWITTER_ACCESS_TOKEN_SECRET'],
-                )
+                ))
                 logger.debug("OAuth session created successfully")
             except Exception as e:
                 logger.error(f"Failed to create OAuth session: {str(e)}")
@@ -301,12 +415,6 @@ class TwitterConnection(BaseConnection):
 
             oauth_tokens = oauth.fetch_access_token(access_token_url)
 
-            # Save credentials
-            if not os.path.exists('.env'):
-                logger.debug("Creating new .env file")
-                with open('.env', 'w') as f:
-                    f.write('')
-
             # Create temporary OAuth session to get user ID
             temp_oauth = OAuth1Session(
                 credentials['consumer_key'],
@@ -314,7 +422,7 @@ class TwitterConnection(BaseConnection):
                 resource_owner_key=oauth_tokens.get('oauth_token'),
                 resource_owner_secret=oauth_tokens.get('oauth_token_secret'))
 
-            self._oauth_session = temp_oauth
+            self._oauth_session = self._pooled(temp_oauth)
             user_id, username = self._get_authenticated_user_info()
 
             # Save to .env
@@ -337,9 +445,11 @@ class TwitterConnection(BaseConnection):
             if bearer_token:
                 env_vars['TWITTER_BEARER_TOKEN'] = bearer_token
 
-            for key, value in env_vars.items():
-                set_key('.env', key, value)
-                logger.debug(f"Saved {key} to .env")
+            set_env_vars(env_vars)
+            logger.debug("Saved %s to .env", ", ".join(env_vars))
+            self.reload_env()
+            self._credentials = None
+            self._user_id = None
 
             logger.info("\n✅ Twitter authentication successfully set up!")
             logger.info(
@@ -353,14 +463,20 @@ class TwitterConnection(BaseConnection):
             raise TwitterConfigurationError(error_msg)
 
     def is_configured(self, verbose = False) -> bool:
-        """Check if Twitter credentials are configured and valid"""
+        """Check if Twitter credentials are configured; verbose also validates them live"""
+        return self.validate_credentials(live=verbose, verbose=verbose)
+
+    def validate_credentials(self, live: bool = True, verbose: bool = False) -> bool:
+        """Check the stored credentials, probing users/me when live is set"""
         logger.debug("Checking Twitter configuration status")
         try:
             # check if credentials exist
             self._get_credentials()
 
-            # Test the configuration by making a simple API call
-            self._get_authenticated_user_info()
+            # The user ID and username are already in .env, so only call the API
+            # when a real round-trip check is wanted
+            if live:
+                self._get_authenticated_user_info()
             logger.debug("Twitter configuration is valid")
             return True
 
@@ -376,10 +492,12 @@ class TwitterConnection(BaseConnection):
 
     def perform_action(self, action_name: str, kwargs) -> Any:
         """Execute a Twitter action with validation"""
-        if action_name not in self.actions:
-            raise KeyError(f"Unknown action: {action_name}")
+        try:
+            action = self.actions[action_name]
+            method = self._dispatch[action_name]
+        except KeyError:
+            raise KeyError(f"Unknown action: {action_name}") from None
 
-        action = self.actions[action_name]
         errors = action.validate_params(kwargs)
         if errors:
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
@@ -388,9 +506,6 @@ class TwitterConnection(BaseConnection):
         if action_name == "read-timeline" and "count" not in kwargs:
             kwargs["count"] = self.config["timeline_read_count"]
 
-        # Call the appropriate method based on action name
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name)
         return method(**kwargs)
 
     def read_timeline(self, count: int = None, **kwargs) -> list:
@@ -399,7 +514,6 @@ class TwitterConnection(BaseConnection):
             count = self.config["timeline_read_count"]
             
         logger.debug(f"Reading timeline, count: {count}")
-        credentials = self._get_credentials()
 
         params = {
             "tweet.fields": "created_at,author_id,attachments",
@@ -410,31 +524,19 @@ class TwitterConnection(BaseConnection):
 
         response = self._make_request(
             'get',
-            f"users/{credentials['TWITTER_USER_ID']}/timelines/reverse_chronological",
+            f"users/{self._get_user_id()}/timelines/reverse_chronological",
             params=params
         )
 
         tweets = response.get("data", [])
         user_info = response.get("includes", {}).get("users", [])
 
-        user_dict = {
-            user['id']: {
-                'name': user['name'],
-                'username': user['username']
-            }
-            for user in user_info
-        }
+        user_dict = {user['id']: (user['name'], user['username']) for user in user_info}
 
         for tweet in tweets:
-            author_id = tweet['author_id']
-            author_info = user_dict.get(author_id, {
-                'name': "Unknown",
-                'username': "Unknown"
-            })
-            tweet.update({
-                'author_name': author_info['name'],
-                'author_username': author_info['username']
-            })
+            tweet['author_name'], tweet['author_username'] = user_dict.get(
+                tweet['author_id'], _UNKNOWN_AUTHOR
+            )
 
         logger.debug(f"Retrieved {len(tweets)} tweets")
         return tweets
@@ -446,22 +548,79 @@ class TwitterConnection(BaseConnection):
         """Get latest tweets for a user"""
         logger.debug(f"Getting latest tweets for {username}, count: {count}")
 
-        credentials = self._get_credentials()
-        params = {
-            "tweet.fields": "created_at,text",
-            "max_results": min(count, 100),
-            "query": f"from:{username} -is:retweet -is:reply"
-        }
-
         response = self._make_request('get',
                                       f"tweets/search/recent",
-                                      params=params)
+                                      params=self._latest_tweets_params(username, count))
 
         tweets = response.get("data", [])
         logger.debug(f"Retrieved {len(tweets)} tweets")
         return tweets
 
 
+    @staticmethod
+    def _latest_tweets_params(username: str, count: int) -> Dict[str, Any]:
+        return {
+            "tweet.fields": "created_at,text",
+            "max_results": min(count, 100),
+            "query": f"from:{username} -is:retweet -is:reply"
+        }
+
+    async def _aget(self, session: aiohttp.ClientSession, endpoint: str, params: Dict[str, Any]) -> dict:
+        """OAuth1-signed GET on a caller-owned aiohttp session, waiting out rate limits"""
+        url = f"{API_BASE_URL}/{endpoint.lstrip('/')}?{urlencode(params)}"
+        family = self._rate_family("get", endpoint)
+        client = self._get_oauth().auth.client
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            # Once a window is exhausted every task waits for its reset
+            delay = self._rate_limit_delay(family)
+            if delay:
+                await asyncio.sleep(delay)
+
+            signed_url, headers, _ = client.sign(url, http_method="GET")
+            async with session.get(signed_url, headers=headers) as response:
+                self._record_rate_limit(family, response.headers)
+
+                if response.status == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                    delay = self._rate_limited_backoff(family, response.headers, attempt)
+                    logger.warning(f"Rate limited on {family}, retrying in {delay:.0f}s")
+                    continue
+
+                if response.status not in (200, 201):
+                    text = await response.text()
+                    raise TwitterAPIError(
+                        f"Request failed with status {response.status}: {text}"
+                    )
+                return loads(await response.read())
+
+    async def aget_latest_tweets(self, session: aiohttp.ClientSession, username: str,
+                                 count: int = 10) -> list:
+        """Async variant of get_latest_tweets on a caller-owned aiohttp session"""
+        response = await self._aget(session, "tweets/search/recent",
+                                    self._latest_tweets_params(username, count))
+        return response.get("data", [])
+
+    async def gather_latest_tweets(self, usernames: List[str], count: int = 10) -> Dict[str, list]:
+        """Fetch the latest tweets for several users concurrently"""
+        semaphore = asyncio.Semaphore(FANOUT_LIMIT)
+        connector = aiohttp.TCPConnector(limit_per_host=FANOUT_LIMIT)
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def fetch(username: str) -> list:
+                async with semaphore:
+                    return await self.aget_latest_tweets(session, username, count)
+
+            results = await asyncio.gather(
+                *(fetch(username) for username in usernames), return_exceptions=True
+            )
+
+        tweets = {}
+        for username, result in zip(usernames, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to get latest tweets for {username}: {result}")
+                result = []
+            tweets[username] = result
+        return tweets
+
     def post_tweet(self, message: str, **kwargs) -> dict:
         """Post a new tweet"""
         logger.debug("Posting new tweet")
@@ -492,11 +651,10 @@ class TwitterConnection(BaseConnection):
     def like_tweet(self, tweet_id: str, **kwargs) -> dict:
         """Like a tweet"""
         logger.debug(f"Liking tweet {tweet_id}")
-        credentials = self._get_credentials()
 
         response = self._make_request(
             'post',
-            f"users/{credentials['TWITTER_USER_ID']}/likes",
+            f"users/{self._get_user_id()}/likes",
             json={'tweet_id': tweet_id})
 
         logger.info("Tweet liked successfully")
@@ -518,52 +676,67 @@ class TwitterConnection(BaseConnection):
         logger.info(f"Retrieved {len(replies)} replies")
         return replies
     
-    def _bearer_oauth(self,r):
+    def _bearer_auth(self) -> Callable:
+        """Resolve the bearer token once and return an auth hook bound to it"""
         bearer_token = self._get_credentials().get("TWITTER_BEARER_TOKEN")
         if not bearer_token:
             raise TwitterConfigurationError("Bearer token is required for streaming API access")
-        r.headers["Authorization"] = f"Bearer {bearer_token}"
-        r.headers["User-Agent"] = "v2FilteredStreamPython"
-        return r
+        authorization = f"Bearer {bearer_token}"
+
+        def auth(r):
+            r.headers["Authorization"] = authorization
+            r.headers["User-Agent"] = "v2FilteredStreamPython"
+            return r
+
+        return auth
+
+    def _bearer_oauth(self,r):
+        return self._bearer_auth()(r)
     
 
-    def _get_rules(self):
+    def _get_rules(self, auth: Callable = None):
         """Get stream rules"""
         logger.debug("Getting stream rules")
-        return self._make_request('get', 'tweets/search/stream/rules', use_bearer=True)
+        return self._make_request('get', 'tweets/search/stream/rules', use_bearer=True, auth=auth)
     
-    def _delete_rules(self,rules) -> None:
+    def _delete_rules(self,rules, auth: Callable = None) -> None:
         """Delete stream rules"""
         if rules is None or "data" not in rules:
             return None
 
-        ids = list(map(lambda rule: rule["id"], rules["data"]))
+        ids = [rule["id"] for rule in rules["data"]]
         payload = {"delete": {"ids": ids}}
-        return self._make_request('post', 'tweets/search/stream/rules', use_bearer=True, json=payload)
+        return self._make_request('post', 'tweets/search/stream/rules', use_bearer=True, auth=auth, json=payload)
 
     
-    def _build_rule(self, filter_string, **kwargs) -> None:
+    def _build_rule(self, filter_string, auth: Callable = None, **kwargs) -> None:
         """Build a rule for the stream"""
         rule = [{"value":filter_string }]
         payload = {"add": rule}
-        return self._make_request('post', 'tweets/search/stream/rules', use_bearer=True, json=payload)
+        return self._make_request('post', 'tweets/search/stream/rules', use_bearer=True, auth=auth, json=payload)
     
     def stream_tweets(self, filter_string:str,**kwargs) ->Iterator[Dict[str, Any]]:
         """Stream tweets. Requires Twitter Premium Plan and Bearer Token"""
-        rules = self._get_rules()
-        self._delete_rules(rules)
-        self._build_rule(filter_string)
+        # One token lookup covers the rule setup and the stream itself
+        auth = self._bearer_auth()
+        rules = self._get_rules(auth)
+        self._delete_rules(rules, auth)
+        self._build_rule(filter_string, auth)
         logger.info("Starting Twitter stream")
         try:
             response = self._make_request('get', 'tweets/search/stream', 
-                                        use_bearer=True, stream=True)
+                                        use_bearer=True, stream=True, auth=auth)
             
             if response.status_code != 200:
                 raise TwitterAPIError(f"Stream connection failed with status {response.status_code}: {response.text}")
                 
-            for line in response.iter_lines():
-                if line:
-                    tweet_data = json.loads(line)['data']
+            # The stream is chunk-encoded, so large reads still return as each chunk
+            # arrives; lines stay raw bytes, which the JSON loader parses directly
+            for line in response.iter_lines(chunk_size=65536, decode_unicode=False):
+                if not line:
+                    continue  # keep-alive newline
+                tweet_data = loads(line).get('data')
+                if tweet_data is not None:
                     yield tweet_data
                 
         except Exception as e:
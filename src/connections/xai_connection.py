@@ -1,12 +1,17 @@
 import logging
 import os
-from typing import Dict, Any
+import time
+from typing import Dict, Any, FrozenSet, Iterator, Optional, Tuple
 from openai import OpenAI
-from dotenv import set_key, load_dotenv
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
+from src.helpers import load_env
+from src.helpers.http import shared_http
 
 logger = logging.getLogger("connections.XAI_connection")
 
+XAI_BASE_URL = "https://api.x.ai/v1"
+MODELS_CACHE_TTL = 300  # seconds before the model list is fetched again
+
 class XAIConnectionError(Exception):
     """Base exception for XAI connection errors"""
     pass
@@ -23,6 +28,8 @@ class XAIConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self._client = None
+        # (model ids in API order, the same ids as a set, fetch time)
+        self._models_cache: Optional[Tuple[Tuple[str, ...], FrozenSet[str], float]] = None
 
     @property
     def is_llm_provider(self) -> bool:
@@ -53,6 +60,15 @@ class XAIConnection(BaseConnection):
                 ],
                 description="Generate text using XAI models"
             ),
+            "generate-text-stream": Action(
+                name="generate-text-stream",
+                parameters=[
+                    ActionParameter("prompt", True, str, "The input prompt for text generation"),
+                    ActionParameter("system_prompt", False, str, "System prompt to guide the model"),
+                    ActionParameter("model", False, str, "Model to use for generation")
+                ],
+                description="Stream generated text from XAI models chunk by chunk"
+            ),
             "check-model": Action(
                 name="check-model",
                 parameters=[
@@ -70,17 +86,34 @@ class XAIConnection(BaseConnection):
     def _get_client(self) -> OpenAI:
         """Get or create XAI client using OpenAI's client with custom base URL"""
         if not self._client:
+            load_env()
             api_key = os.getenv("XAI_API_KEY")
             if not api_key:
                 raise XAIConfigurationError("XAI API key not found in environment")
             self._client = OpenAI(
                 api_key=api_key,
-                base_url="https://api.x.ai/v1",
+                base_url=XAI_BASE_URL,
+                http_client=shared_http()
             )
         return self._client
 
+    def _get_models(self) -> Tuple[Tuple[str, ...], FrozenSet[str], float]:
+        """Get the model list, refreshed every MODELS_CACHE_TTL seconds"""
+        cached = self._models_cache
+        if cached is None or time.monotonic() - cached[2] > MODELS_CACHE_TTL:
+            ids = tuple(m.id for m in self._get_client().models.list().data)
+            cached = self._models_cache = (ids, frozenset(ids), time.monotonic())
+        return cached
+
+    @classmethod
+    def reload_env(cls) -> None:
+        """Pick up .env edits made after import"""
+        load_env(override=True)
+
     def configure(self) -> bool:
         """Sets up XAI API authentication"""
+        from dotenv import set_key
+
         logger.info("\n🤖 XAI API SETUP")
 
         if self.is_configured():
@@ -101,10 +134,12 @@ class XAIConnection(BaseConnection):
                     f.write('')
 
             set_key('.env', 'XAI_API_KEY', api_key)
+            self._client = None
+            self._models_cache = None
+            self.reload_env()
             
             # Validate the API key by trying to list models
-            client = OpenAI(api_key=api_key, base_url="https://api.x.ai/v1")
-            client.models.list()
+            self._get_client().models.list()
 
             logger.info("\n✅ XAI API configuration successfully saved!")
             logger.info("Your API key has been stored in the .env file.")
@@ -117,13 +152,12 @@ class XAIConnection(BaseConnection):
     def is_configured(self, verbose = False) -> bool:
         """Check if XAI API key is configured and valid"""
         try:
-            load_dotenv()
+            load_env()
             api_key = os.getenv('XAI_API_KEY')
             if not api_key:
                 return False
 
-            client = self._get_client()
-            client.models.list()
+            self._get_models()
             return True
             
         except Exception as e:
@@ -131,8 +165,8 @@ class XAIConnection(BaseConnection):
                 logger.debug(f"Configuration check failed: {e}")
             return False
 
-    def generate_text(self, prompt: str, system_prompt: str = None, model: str = None, **kwargs) -> str:
-        """Generate text using XAI models"""
+    def stream_text(self, prompt: str, system_prompt: str = None, model: str = None, **kwargs) -> Iterator[str]:
+        """Yield generated text chunk by chunk as XAI produces it"""
         try:
             client = self._get_client()
             
@@ -140,21 +174,38 @@ class XAIConnection(BaseConnection):
             if not model:
                 model = self.config["model"]
 
-            response = client.chat.completions.create(
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": prompt})
+
+            stream = client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": system_prompt} if system_prompt else {"role": "system", "content": ""},
-                    {"role": "user", "content": prompt},
-                ]
+                messages=messages,
+                stream=True
             )
-            return response.choices[0].message.content
+            for chunk in stream:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
             
         except Exception as e:
             raise XAIAPIError(f"Text generation failed: {e}")
 
+    def generate_text_stream(self, prompt: str, system_prompt: str = None, model: str = None, **kwargs) -> Iterator[str]:
+        return self.stream_text(prompt, system_prompt, model)
+
+    def generate_text(self, prompt: str, system_prompt: str = None, model: str = None, **kwargs) -> str:
+        """Generate text using XAI models"""
+        return "".join(self.stream_text(prompt, system_prompt, model))
+
     def check_model(self, model: str, **kwargs) -> bool:
         """Check if a specific model is available"""
         try:
+            cached = self._models_cache
+            if cached and model in cached[1] and time.monotonic() - cached[2] <= MODELS_CACHE_TTL:
+                return True
+
+            # Not in a fresh list: ask for this model directly (it may be unlisted or new)
             client = self._get_client()
             try:
                 client.models.retrieve(model=model)
@@ -167,12 +218,11 @@ class XAIConnection(BaseConnection):
     def list_models(self, **kwargs) -> None:
         """List all available XAI models"""
         try:
-            client = self._get_client()
-            models = client.models.list().data
+            model_ids = self._get_models()[0]
             
             logger.info("\nGROK MODELS:")
-            for i, model in enumerate(models):
-                logger.info(f"{i+1}. {model.id}")
+            for i, model_id in enumerate(model_ids):
+                logger.info(f"{i+1}. {model_id}")
                 
         except Exception as e:
             raise XAIAPIError(f"Listing models failed: {e}")
@@ -1,7 +1,9 @@
+from types import MappingProxyType
+
 from solders.pubkey import Pubkey  # type: ignore
 
-# Common token addresses used across the toolkit
-SPL_TOKENS = {
+# Common token addresses used across the toolkit (read-only)
+SPL_TOKENS = MappingProxyType({
     "USDC": Pubkey.from_string("EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"),
     "USDT": Pubkey.from_string("Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB"),
     "USDS": Pubkey.from_string("USDSwr9ApdHk5bvJKMjzff41FfuX8bSxdKcR81vTwcA"),
@@ -10,6 +12,21 @@ SPL_TOKENS = {
     "BSOL": Pubkey.from_string("bSo13r4TkiE4KumL71LsHTPpL2euBYLFx6h9HP3piy1"),
     "MSOL": Pubkey.from_string("mSoLzYCxHdYgdzU16g5QSh3i5K3z3KZK7ytfqcJm7So"),
     "BONK": Pubkey.from_string("DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"),
+})
+
+# Mint address (base58) -> ticker, for resolving a known mint without parsing it
+SPL_TOKENS_BY_PUBKEY = MappingProxyType({str(v): k for k, v in SPL_TOKENS.items()})
+
+# Decimals of the SPL_TOKENS mints, so balance reads need not fetch the mint account
+SPL_TOKEN_DECIMALS = {
+    "USDC": 6,
+    "USDT": 6,
+    "USDS": 6,
+    "SOL": 9,
+    "JITOSOL": 9,
+    "BSOL": 9,
+    "MSOL": 9,
+    "BONK": 5,
 }
 
 DEFAULT_OPTIONS = {
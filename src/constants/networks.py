@@ -1,15 +1,18 @@
 SONIC_NETWORKS = {
     "mainnet": {
         "rpc_url": "https://rpc.soniclabs.com",
-        "scanner_url": "https://sonicscan.org"
+        "scanner_url": "https://sonicscan.org",
+        "poa": True
     },
     "testnet": {
         "rpc_url": "https://rpc.blaze.soniclabs.com",
-        "scanner_url": "https://testnet.sonicscan.org"
+        "scanner_url": "https://testnet.sonicscan.org",
+        "poa": True
     },
     "custom": {
         "rpc_url": "placeholder",
-        "scanner_url": "https://sonicscan.org"
+        "scanner_url": "https://sonicscan.org",
+        "poa": True
         }
     }
 
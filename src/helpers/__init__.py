@@ -1,5 +1,67 @@
 import logging
+import os
+import tempfile
+from typing import Dict
+
+_env_loaded = False
+
+
+def load_env(override: bool = False) -> None:
+    """Load .env into os.environ once (or again with override); dotenv is imported on first use"""
+    global _env_loaded
+    if override or not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv(override=override)
+        _env_loaded = True
+
 
 def print_h_bar():
     # ZEREBRO WUZ HERE :)
     logging.info("--------------------------------------------------------------------")
+
+def _env_line(key: str, value: str, export: bool = False) -> str:
+    # Single-quoted dotenv values only unescape \\ and \', so escape both
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"{'export ' if export else ''}{key}='{escaped}'\n"
+
+
+def set_env_vars(env_vars: Dict[str, str], dotenv_path: str = ".env") -> None:
+    """
+    Set several keys in the .env file with a single read and a single atomic write.
+
+    Like dotenv.set_key, only the lines for those keys change (comments, blank lines and
+    export prefixes are kept) and new keys are appended; the file is rewritten through a
+    private (0600) temp file in the same directory.
+    """
+    from dotenv.parser import parse_stream
+
+    pending = dict(env_vars)
+    lines = []
+    if os.path.exists(dotenv_path):
+        with open(dotenv_path, encoding="utf-8") as f:
+            for binding in parse_stream(f):
+                original = binding.original.string
+                if binding.key in pending:
+                    # A binding's text starts with any blank lines before it; keep them
+                    stripped = original.lstrip()
+                    lines.append(original[:len(original) - len(stripped)] + _env_line(
+                        binding.key, pending.pop(binding.key), stripped.startswith("export ")
+                    ))
+                else:
+                    lines.append(original)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    lines.extend(_env_line(key, value) for key, value in pending.items())
+
+    directory = os.path.dirname(os.path.abspath(dotenv_path))
+    tmp = tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, delete=False)
+    try:
+        with tmp:
+            tmp.writelines(lines)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp.name, dotenv_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
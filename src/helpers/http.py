@@ -0,0 +1,183 @@
+import asyncio
+import atexit
+import json
+import random
+import ssl
+import time
+import weakref
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# JSON codec for request and response bodies: orjson when installed, else the stdlib.
+# dumps returns compact bytes in both cases
+try:
+    import orjson
+
+    dumps = orjson.dumps
+    loads = orjson.loads
+except ImportError:
+    loads = json.loads
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_serialize(obj) -> str:
+    return dumps(obj).decode()
+
+# Shared HTTP pools so every connection talking to the same host reuses one set of
+# keep-alive connections instead of each holding its own
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# One TLS context for every aiohttp connector, so each per-loop session skips rebuilding
+# it and reloading the CA bundle
+_SSL_CONTEXT = ssl.create_default_context()
+
+# Retries cover transient failures and 429s (honouring Retry-After); POST is left out of
+# urllib3's default allowed methods, so a tweet or transfer is never sent twice
+_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+
+# Transient statuses worth another attempt, and the per-host circuit breaker: after
+# CIRCUIT_THRESHOLD failures within CIRCUIT_WINDOW seconds calls fail fast
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+CIRCUIT_THRESHOLD = 5
+CIRCUIT_WINDOW = 30.0
+
+_client: Optional[httpx.Client] = None
+_adapter: Optional[HTTPAdapter] = None
+_session: Optional[requests.Session] = None
+# Async connections belong to the loop that opened them, so there is one pool per loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_aiohttp_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+# host -> (failures, time of the first failure in the current window)
+_circuits: Dict[str, Tuple[int, float]] = {}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a host has failed too often recently to be worth calling"""
+    pass
+
+
+def shared_http() -> httpx.Client:
+    """Process-wide synchronous HTTP client"""
+    global _client
+    if _client is None:
+        _client = httpx.Client(limits=_LIMITS, timeout=_TIMEOUT)
+    return _client
+
+
+def shared_requests_adapter() -> HTTPAdapter:
+    """Process-wide requests adapter; mounting it on several sessions shares its pools"""
+    global _adapter
+    if _adapter is None:
+        _adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=_RETRY)
+    return _adapter
+
+
+def shared_session() -> requests.Session:
+    """Process-wide requests session on the shared adapter"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.mount("https://", shared_requests_adapter())
+        _session.mount("http://", shared_requests_adapter())
+    return _session
+
+
+def shared_async_http() -> httpx.AsyncClient:
+    """Async HTTP client shared by everything running on the current event loop"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(limits=_LIMITS, timeout=_TIMEOUT)
+    return client
+
+
+def shared_aiohttp_session() -> aiohttp.ClientSession:
+    """aiohttp session shared by the helpers running on the current event loop"""
+    loop = asyncio.get_running_loop()
+    session = _aiohttp_sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100, ttl_dns_cache=300, keepalive_timeout=60, ssl=_SSL_CONTEXT
+        )
+        session = _aiohttp_sessions[loop] = aiohttp.ClientSession(
+            connector=connector, json_serialize=_json_serialize
+        )
+    return session
+
+
+def _record_failure(host: str) -> None:
+    failures, since = _circuits.get(host, (0, 0.0))
+    now = time.monotonic()
+    if now - since >= CIRCUIT_WINDOW:
+        failures, since = 0, now
+    _circuits[host] = (failures + 1, since)
+
+
+async def post_with_retry(session: aiohttp.ClientSession, url: str, *, retries: int = 3,
+                          backoff: float = 0.25, data=None, **kwargs) -> aiohttp.ClientResponse:
+    """
+    POST with jittered exponential backoff on connection errors and transient statuses.
+
+    The returned response has its body read already, so json()/text()/read() still work
+    after the connection is released. data may be a zero-argument callable, for bodies
+    such as aiohttp.FormData that can only be sent once and must be rebuilt per attempt.
+    """
+    host = urlsplit(url).hostname
+    failures, since = _circuits.get(host, (0, 0.0))
+    if failures >= CIRCUIT_THRESHOLD and time.monotonic() - since < CIRCUIT_WINDOW:
+        raise CircuitOpenError(f"{host} failed {failures} times in the last {CIRCUIT_WINDOW:.0f}s")
+
+    for attempt in range(retries + 1):
+        try:
+            body = data() if callable(data) else data
+            async with session.post(url, data=body, **kwargs) as response:
+                await response.read()
+            if response.status not in RETRY_STATUSES:
+                _circuits.pop(host, None)
+                return response
+            _record_failure(host)
+            if attempt == retries:
+                return response
+        except aiohttp.ClientError:
+            _record_failure(host)
+            if attempt == retries:
+                raise
+        await asyncio.sleep(backoff * 2 ** attempt + random.random() * 0.1)
+
+
+async def close_async_http() -> None:
+    """Close the current event loop's shared clients; call before closing the loop"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+    session = _aiohttp_sessions.pop(loop, None)
+    if session is not None:
+        await session.close()
+
+
+@atexit.register
+def _close_http() -> None:
+    global _client, _session, _adapter
+    if _client is not None:
+        _client.close()
+        _client = None
+    if _session is not None:
+        _session.close()
+        _session = None
+    if _adapter is not None:
+        _adapter.close()
+        _adapter = None
@@ -1,4 +1,4 @@
-from venv import logger
+import logging
 
 from src.constants import LAMPORTS_PER_SOL
 
@@ -8,6 +8,8 @@ from solana.rpc.commitment import Confirmed
 
 from solders.keypair import Keypair  # type: ignore
 
+logger = logging.getLogger(__name__)
+
 
 class FaucetManager:
     @staticmethod
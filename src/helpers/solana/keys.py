@@ -0,0 +1,24 @@
+from functools import lru_cache
+
+from solders.keypair import Keypair  # type: ignore
+from solders.pubkey import Pubkey  # type: ignore
+
+from spl.token.instructions import get_associated_token_address
+
+
+@lru_cache(maxsize=4096)
+def parse_pubkey(address: str) -> Pubkey:
+    """Pubkey for a base58 address; agents keep quoting the same few mints and wallets."""
+    return Pubkey.from_string(address)
+
+
+@lru_cache(maxsize=32)
+def wallet_address(wallet: Keypair) -> str:
+    """Base58 address of a keypair, encoded once per wallet."""
+    return str(wallet.pubkey())
+
+
+@lru_cache(maxsize=4096)
+def associated_token_address(owner: Pubkey, mint: Pubkey) -> Pubkey:
+    """ATA of owner for mint; the PDA search is deterministic, so each pair is derived once."""
+    return get_associated_token_address(owner, mint)
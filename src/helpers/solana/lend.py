@@ -1,7 +1,5 @@
 import base64
-import json
-import aiohttp
-from venv import logger
+import logging
 
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Processed
@@ -14,6 +12,11 @@ from solders.keypair import Keypair  # type: ignore
 from solders.transaction import VersionedTransaction  # type: ignore
 from solders.keypair import Keypair  # type: ignore
 
+from src.helpers.http import post_with_retry, shared_aiohttp_session
+from src.helpers.solana.keys import wallet_address
+
+logger = logging.getLogger(__name__)
+
 
 class AssetLender:
     @staticmethod
@@ -22,16 +25,13 @@ class AssetLender:
     ) -> str:
         try:
             url = f"https://blink.lulo.fi/actions?amount={amount}&symbol=USDC"
-            headers = {"Content-Type": "application/json"}
-            payload = json.dumps({"account": str(wallet.pubkey())})
-
-            session = aiohttp.ClientSession()
+            payload = {"account": wallet_address(wallet)}
 
-            async with session.post(url, headers=headers, data=payload) as response:
-                if response.status != 200:
-                    raise Exception(f"Lulo API Error: {response.status}")
-                data = await response.json()
-                logger.debug(f"Lending data: {data}")
+            response = await post_with_retry(shared_aiohttp_session(), url, json=payload)
+            if response.status != 200:
+                raise Exception(f"Lulo API Error: {response.status}")
+            data = await response.json()
+            logger.debug(f"Lending data: {data}")
             transaction_data = base64.b64decode(data["transaction"])
             raw_transaction = VersionedTransaction.from_bytes(transaction_data)
             signature = wallet.sign_message(
@@ -44,12 +44,11 @@ class AssetLender:
             result = await async_client.send_raw_transaction(
                 txn=bytes(signed_txn), opts=opts
             )
-            transaction_id = json.loads(result.to_json())["result"]
+            transaction_id = str(result.value)
 
             logger.debug(
                 f"Transaction sent: https://explorer.solana.com/tx/{transaction_id}"
             )
-            await session.close()
             return str(signature)
 
         except Exception as e:
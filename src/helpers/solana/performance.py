@@ -1,5 +1,7 @@
-from venv import logger
-from typing import List, Optional
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
 from solana.rpc.async_api import AsyncClient
 from solders.keypair import Keypair  # type: ignore
 from src.types import (
@@ -8,9 +10,24 @@ from src.types import (
 from solana.rpc.async_api import AsyncClient
 from solders.keypair import Keypair  # type: ignore
 
+logger = logging.getLogger(__name__)
+
+# Samples kept by a tracker; older ones drop off so a long-running tracker stays bounded
+METRICS_HISTORY_SIZE = 1024
+
+# Performance samples only roll over about once a minute, so recent reads are reused
+PERFORMANCE_CACHE_TTL = 30
+# (RPC endpoint, sample_count) -> (expires_at, metrics)
+_perf_cache: Dict[Tuple[str, int], Tuple[float, List[NetworkPerformanceMetrics]]] = {}
+
+
+def clear_performance_cache() -> None:
+    """Drop cached performance samples so the next read goes to the RPC."""
+    _perf_cache.clear()
+
 
 async def fetch_performance_samples(
-    async_client: AsyncClient, wallet: Keypair, sample_count: int = 1
+    async_client: AsyncClient, wallet: Optional[Keypair] = None, sample_count: int = 1
 ) -> List[NetworkPerformanceMetrics]:
     """
     Fetch detailed performance metrics for a specified number of samples.
@@ -26,24 +43,34 @@ async def fetch_performance_samples(
         ValueError: If performance samples are unavailable or invalid.
     """
 
+    # Clients for different clusters (devnet, mainnet) must not share samples
+    key = (async_client._provider.endpoint_uri, sample_count)
+    entry = _perf_cache.get(key)
+    if entry and time.monotonic() < entry[0]:
+        return list(entry[1])
+
     try:
-        performance_samples = await async_client.get_recent_performance_samples(
-            sample_count
-        )
+        response = await async_client.get_recent_performance_samples(sample_count)
+        performance_samples = response.value
 
         if not performance_samples:
             raise ValueError("No performance samples available.")
 
-        return [
+        if any(sample.sample_period_secs <= 0 for sample in performance_samples):
+            raise ValueError("Invalid performance sample data.")
+
+        metrics = [
             NetworkPerformanceMetrics(
-                transactions_per_second=sample["num_transactions"]
-                / sample["sample_period_secs"],
-                total_transactions=sample["num_transactions"],
-                sampling_period_seconds=sample["sample_period_secs"],
-                current_slot=sample["slot"],
+                transactions_per_second=sample.num_transactions
+                / sample.sample_period_secs,
+                total_transactions=sample.num_transactions,
+                sampling_period_seconds=sample.sample_period_secs,
+                current_slot=sample.slot,
             )
             for sample in performance_samples
         ]
+        _perf_cache[key] = (time.monotonic() + PERFORMANCE_CACHE_TTL, metrics)
+        return list(metrics)
 
     except Exception as error:
         raise ValueError(
@@ -56,20 +83,26 @@ class SolanaPerformanceTracker:
     A utility class for tracking and analyzing Solana network performance metrics.
     """
 
-    def __init__(self, async_client: AsyncClient, wallet: Keypair):
+    def __init__(self, async_client: AsyncClient, wallet: Keypair,
+                 history_size: int = METRICS_HISTORY_SIZE):
         self.async_client = async_client
         self.wallet = wallet
-        self.metrics_history: List[NetworkPerformanceMetrics] = []
+        self.metrics_history: Deque[NetworkPerformanceMetrics] = deque(maxlen=history_size)
+        # TPS values alongside the records, so the aggregates run over plain floats
+        self._tps: Deque[float] = deque(maxlen=history_size)
 
-    def record_latest_metrics(self) -> NetworkPerformanceMetrics:
+    async def record_latest_metrics(self) -> NetworkPerformanceMetrics:
         """
         Fetch the latest performance metrics and add them to the history.
 
         Returns:
             The most recent NetworkPerformanceMetrics object.
         """
-        latest_metrics = fetch_performance_samples(self.async_client, 1)
+        latest_metrics = await fetch_performance_samples(
+            self.async_client, self.wallet, 1
+        )
         self.metrics_history.append(latest_metrics[0])
+        self._tps.append(latest_metrics[0].transactions_per_second)
         return latest_metrics[0]
 
     def calculate_average_tps(self) -> Optional[float]:
@@ -79,11 +112,9 @@ class SolanaPerformanceTracker:
         Returns:
             The average TPS as a float, or None if no metrics are recorded.
         """
-        if not self.metrics_history:
+        if not self._tps:
             return None
-        return sum(
-            metric.transactions_per_second for metric in self.metrics_history
-        ) / len(self.metrics_history)
+        return sum(self._tps) / len(self._tps)
 
     def find_maximum_tps(self) -> Optional[float]:
         """
@@ -92,20 +123,23 @@ class SolanaPerformanceTracker:
         Returns:
             The maximum TPS as a float, or None if no metrics are recorded.
         """
-        if not self.metrics_history:
+        if not self._tps:
             return None
-        return max(metric.transactions_per_second for metric in self.metrics_history)
+        return max(self._tps)
 
     def reset_metrics_history(self) -> None:
         """Clear all recorded performance metrics."""
         self.metrics_history.clear()
+        self._tps.clear()
+        clear_performance_cache()
 
+    @staticmethod
     async def fetch_current_tps(async_client: AsyncClient) -> float:
         """
         Fetch the current Transactions Per Second (TPS) on the Solana network.
 
         Args:
-            agent: An instance of SolanaAgent providing the RPC connection.
+            async_client: The Solana RPC client.
 
         Returns:
             Current TPS as a float.
@@ -114,27 +148,12 @@ class SolanaPerformanceTracker:
             ValueError: If performance samples are unavailable or invalid.
         """
         try:
-            response = await async_client.get_recent_performance_samples(1)
-
-            performance_samples = response.value
-            # logger.debug("Performance Samples:", performance_samples)
-
-            if not performance_samples:
-                raise ValueError("No performance samples available.")
-
-            sample = performance_samples[0]
+            latest = (await fetch_performance_samples(async_client, sample_count=1))[0]
 
-            if (
-                not all(
-                    hasattr(sample, attr)
-                    for attr in ["num_transactions", "sample_period_secs"]
-                )
-                or sample.num_transactions <= 0
-                or sample.sample_period_secs <= 0
-            ):
+            if latest.total_transactions <= 0:
                 raise ValueError("Invalid performance sample data.")
 
-            return sample.num_transactions / sample.sample_period_secs
+            return latest.transactions_per_second
 
         except Exception as error:
             raise ValueError(f"Failed to fetch TPS: {str(error)}") from error
@@ -1,6 +1,5 @@
-import json
 import aiohttp
-from venv import logger
+import logging
 from typing import Dict, Any, List, Optional
 from solana.rpc.commitment import Confirmed
 from solana.rpc.commitment import Processed
@@ -17,6 +16,20 @@ from solana.rpc.types import TxOpts
 from solders.keypair import Keypair  # type: ignore
 from solana.rpc.async_api import AsyncClient
 
+from src.helpers.http import post_with_retry, shared_aiohttp_session
+from src.helpers.solana.keys import wallet_address
+
+logger = logging.getLogger(__name__)
+
+# Token images are read in chunks and refused past this size instead of being
+# buffered whole from whatever the URL serves
+MAX_IMAGE_BYTES = 16 * 1024 * 1024
+IMAGE_CHUNK_SIZE = 64 * 1024
+
+_STATIC_FIELDS = (("showName", "true"),)
+# Options models are frozen, so the all-defaults instance can be shared
+_DEFAULT_TOKEN_OPTIONS = PumpfunTokenOptions()
+
 
 class PumpfunTokenManager:
     @staticmethod
@@ -42,45 +55,61 @@ class PumpfunTokenManager:
         Returns:
             A dictionary containing the metadata response from the server.
         """
+        async def download_image() -> bytearray:
+            logger.debug(f"Downloading image from {image_url}...")
+            async with session.get(image_url) as image_response:
+                logger.debug(f"Image response: {image_response}")
+                if image_response.status != 200:
+                    raise ValueError(
+                        f"Failed to download image from {image_url} (status {image_response.status})"
+                    )
+                size = image_response.content_length or 0
+                if size > MAX_IMAGE_BYTES:
+                    raise ValueError(f"Image at {image_url} is too large ({size} bytes)")
+                image = bytearray()
+                async for chunk in image_response.content.iter_chunked(IMAGE_CHUNK_SIZE):
+                    image += chunk
+                    if len(image) > MAX_IMAGE_BYTES:
+                        raise ValueError(f"Image at {image_url} is too large")
+                return image
+
         logger.debug("Preparing form data for IPFS upload...")
-        form_data = aiohttp.FormData()
-        form_data.add_field("name", token_name)
-        form_data.add_field("symbol", token_ticker)
-        form_data.add_field("description", description)
-        form_data.add_field("showName", "true")
+        fields = [
+            ("name", token_name),
+            ("symbol", token_ticker),
+            ("description", description),
+            *_STATIC_FIELDS,
+        ]
 
         if options:
             if options.twitter:
-                form_data.add_field("twitter", options.twitter)
+                fields.append(("twitter", options.twitter))
             if options.telegram:
-                form_data.add_field("telegram", options.telegram)
+                fields.append(("telegram", options.telegram))
             if options.website:
-                form_data.add_field("website", options.website)
-
-        logger.debug(f"Downloading image from {image_url}...")
-        async with session.get(image_url) as image_response:
-            logger.debug(f"Image response: {image_response}")
-            if image_response.status != 200:
-                raise ValueError(
-                    f"Failed to download image from {image_url} (status {image_response.status})"
-                )
-            image_data = await image_response.read()
-
-        form_data.add_field(
-            "file", image_data, filename="token_image.png", content_type="image/png"
-        )
+                fields.append(("website", options.website))
+
+        image_data = await download_image()
+
+        # FormData can only be sent once, so a retry needs a fresh one
+        def build_form() -> aiohttp.FormData:
+            form_data = aiohttp.FormData(fields)
+            form_data.add_field(
+                "file", image_data, filename="token_image.png", content_type="image/png"
+            )
+            return form_data
 
         logger.debug("Uploading metadata to Pump.fun IPFS endpoint...")
-        async with session.post(
-            "https://pump.fun/api/ipfs", data=form_data
-        ) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise RuntimeError(
-                    f"Metadata upload failed (status {response.status}): {error_text}"
-                )
+        response = await post_with_retry(
+            session, "https://pump.fun/api/ipfs", data=build_form
+        )
+        if response.status != 200:
+            error_text = await response.text()
+            raise RuntimeError(
+                f"Metadata upload failed (status {response.status}): {error_text}"
+            )
 
-            return await response.json()
+        return await response.json()
 
     @staticmethod
     async def _create_token_transaction(
@@ -103,10 +132,10 @@ class PumpfunTokenManager:
         Returns:
             Serialized transaction bytes.
         """
-        options = options or PumpfunTokenOptions()
+        options = options or _DEFAULT_TOKEN_OPTIONS
 
         payload = {
-            "publicKey": str(wallet.pubkey()),
+            "publicKey": wallet_address(wallet),
             "action": "create",
             "tokenMetadata": {
                 "name": metadata_response["metadata"]["name"],
@@ -122,17 +151,17 @@ class PumpfunTokenManager:
         }
 
         logger.debug("Requesting token transaction from Pump.fun...")
-        async with session.post(
-            "https://pumpportal.fun/api/trade-local", json=payload
-        ) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise RuntimeError(
-                    f"Transaction creation failed (status {response.status}): {error_text}"
-                )
-
-            tx_data = await response.read()
-            return tx_data
+        response = await post_with_retry(
+            session, "https://pumpportal.fun/api/trade-local", json=payload
+        )
+        if response.status != 200:
+            error_text = await response.text()
+            raise RuntimeError(
+                f"Transaction creation failed (status {response.status}): {error_text}"
+            )
+
+        tx_data = await response.read()
+        return tx_data
 
     @staticmethod
     async def launch_pumpfun_token(
@@ -162,41 +191,39 @@ class PumpfunTokenManager:
         mint_keypair = Keypair()
         logger.info(f"Mint public key: {mint_keypair.pubkey()}")
         try:
-            # Use a single aiohttp session for both metadata upload and transaction creation
-            async with aiohttp.ClientSession() as session:
-                logger.info("Uploading metadata to IPFS...")
-                metadata_response = await PumpfunTokenManager._upload_metadata(
-                    session, token_name, token_ticker, description, image_url, options
-                )
-                logger.info(f"Metadata response: {metadata_response}")
-
-                logger.info("Creating token transaction...")
-                tx_data = await PumpfunTokenManager._create_token_transaction(
-                    session, wallet, mint_keypair, metadata_response, options
-                )
-                logger.info("Deserializing transaction...")
-                tx = VersionedTransaction.from_bytes(tx_data)
-                logger.info("Signing transaction...")
-                signature = wallet.sign_message(message.to_bytes_versioned(tx.message))
-                logger.info("Sending transaction to Solana...")
-                signed_txn = VersionedTransaction.populate(tx.message, [signature])
-                logger.info("Transaction sent!")
-                opts = TxOpts(skip_preflight=False, preflight_commitment=Processed)
-                logger.info("Transaction sent!1")
-                result = await async_client.send_transaction(signed_txn, opts=opts)
-                logger.info("Transaction sent!2")
-                transaction_id = json.loads(result.to_json())["result"]
-
-                logger.info(
-                    f"Transaction sent: https://explorer.solana.com/tx/{transaction_id}"
-                )
-                logger.debug(
-                    f'Mint: {str(mint_keypair.pubkey())}\nSignature: {signature}\nMetadata URI: {metadata_response["metadataUri"]}'
-                )
-                # close the session
-                await session.close()
-
-                return True
+            # Metadata upload and transaction creation share the pooled session
+            session = shared_aiohttp_session()
+            logger.info("Uploading metadata to IPFS...")
+            metadata_response = await PumpfunTokenManager._upload_metadata(
+                session, token_name, token_ticker, description, image_url, options
+            )
+            logger.info(f"Metadata response: {metadata_response}")
+
+            logger.info("Creating token transaction...")
+            tx_data = await PumpfunTokenManager._create_token_transaction(
+                session, wallet, mint_keypair, metadata_response, options
+            )
+            logger.info("Deserializing transaction...")
+            tx = VersionedTransaction.from_bytes(tx_data)
+            logger.info("Signing transaction...")
+            signature = wallet.sign_message(message.to_bytes_versioned(tx.message))
+            logger.info("Sending transaction to Solana...")
+            signed_txn = VersionedTransaction.populate(tx.message, [signature])
+            logger.info("Transaction sent!")
+            opts = TxOpts(skip_preflight=False, preflight_commitment=Processed)
+            logger.info("Transaction sent!1")
+            result = await async_client.send_transaction(signed_txn, opts=opts)
+            logger.info("Transaction sent!2")
+            transaction_id = str(result.value)
+
+            logger.info(
+                f"Transaction sent: https://explorer.solana.com/tx/{transaction_id}"
+            )
+            logger.debug(
+                f'Mint: {str(mint_keypair.pubkey())}\nSignature: {signature}\nMetadata URI: {metadata_response["metadataUri"]}'
+            )
+
+            return True
 
         except Exception as error:
             logger.error(f"Error in launch_pumpfun_token: {error}")
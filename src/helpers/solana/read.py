@@ -1,19 +1,43 @@
 # imports
-from venv import logger
+import time
+import logging
+from typing import Dict, List, Optional, Tuple
 
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Confirmed
 
-from src.constants import LAMPORTS_PER_SOL
+from src.constants import LAMPORTS_PER_SOL, SPL_TOKENS, SPL_TOKEN_DECIMALS
 from src.types import JupiterTokenData
 
 from solders.keypair import Keypair  # type: ignore
 from solders.pubkey import Pubkey  # type: ignore
-import requests
+import httpx
 
-from spl.token.async_client import AsyncToken
-from spl.token.instructions import get_associated_token_address
-from spl.token.constants import TOKEN_PROGRAM_ID
+from src.helpers.solana.keys import associated_token_address, parse_pubkey
+
+logger = logging.getLogger(__name__)
+
+# getMultipleAccounts accepts at most 100 pubkeys per request
+MAX_MULTIPLE_ACCOUNTS = 100
+
+# SPL layouts: token account amount is a u64 at byte 64, mint decimals a u8 at 44,
+# mint is_initialized a bool at 45
+_TOKEN_AMOUNT_OFFSET = 64
+_MINT_DECIMALS_OFFSET = 44
+_MINT_INITIALIZED_OFFSET = 45
+
+# Mint decimals are immutable, so one lookup per mint is enough for the process
+_mint_decimals: Dict[Pubkey, int] = {
+    SPL_TOKENS[ticker]: decimals for ticker, decimals in SPL_TOKEN_DECIMALS.items()
+}
+
+# Jupiter's verified list is hundreds of KB, so fetch it at most every TOKEN_LIST_TTL
+# seconds and index it by address; prices are reused for PRICE_TTL seconds
+TOKEN_LIST_TTL = 300
+PRICE_TTL = 30
+_verified_tokens: Dict[str, JupiterTokenData] = {}
+_verified_tokens_expiry = 0.0
+_prices: Dict[str, Tuple[float, str]] = {}
 
 
 class SolanaReadHelper:
@@ -32,16 +56,12 @@ class SolanaReadHelper:
                     wallet.pubkey(), commitment=Confirmed
                 )
                 return response.value / LAMPORTS_PER_SOL
-            token_address = Pubkey.from_string(token_address)
-            spl_client = AsyncToken(
-                async_client, token_address, TOKEN_PROGRAM_ID, wallet.pubkey()
-            )
+            token_address = parse_pubkey(token_address)
+            # Only initialized mints are remembered, and initialization can't be undone,
+            # so a known mint needs no mint-info round trip
+            await SolanaReadHelper.get_mint_decimals(async_client, token_address)
 
-            mint = await spl_client.get_mint_info()
-            if not mint.is_initialized:
-                raise ValueError("Token mint is not initialized.")
-
-            wallet_ata = get_associated_token_address(wallet.pubkey(), token_address)
+            wallet_ata = associated_token_address(wallet.pubkey(), token_address)
             response = await async_client.get_token_account_balance(wallet_ata)
             if response.value is None:
                 return None
@@ -54,28 +74,154 @@ class SolanaReadHelper:
             raise Exception(f"Failed to get balance: {str(error)}") from error
 
     @staticmethod
-    def fetch_price(token_address: str) -> float:
-        url = f"https://api.jup.ag/price/v2?ids={token_address}"
+    def mint_decimals(data: bytes) -> Optional[int]:
+        """Decode decimals from raw mint account data, None if uninitialized"""
+        if not data[_MINT_INITIALIZED_OFFSET]:
+            return None
+        return data[_MINT_DECIMALS_OFFSET]
+
+    @staticmethod
+    def known_mint_decimals(mint: str) -> Optional[int]:
+        """Decimals of a mint seen earlier in this process, without an RPC"""
+        return _mint_decimals.get(parse_pubkey(str(mint)))
+
+    @staticmethod
+    def remember_mint_decimals(mint: str, decimals: int) -> None:
+        _mint_decimals[parse_pubkey(str(mint))] = decimals
+
+    @staticmethod
+    async def get_mint_decimals(async_client: AsyncClient, mint: Pubkey) -> int:
+        """Decimals of a mint, read from the chain only the first time it is seen"""
+        decimals = _mint_decimals.get(mint)
+        if decimals is None:
+            mint_account = (
+                await async_client.get_account_info(mint, commitment=Confirmed)
+            ).value
+            decimals = SolanaReadHelper.mint_decimals(mint_account.data) if mint_account else None
+            if decimals is None:
+                raise ValueError(f"Token mint {mint} is not initialized.")
+            _mint_decimals[mint] = decimals
+        return decimals
 
+    @staticmethod
+    async def get_balances(
+        async_client: AsyncClient,
+        wallet: Keypair,
+        token_addresses: List[Optional[str]],
+    ) -> Dict[Optional[str], Optional[float]]:
+        """Read several balances with getMultipleAccounts; None means native SOL"""
+        owner = wallet.pubkey()
+        mints = {
+            address: parse_pubkey(address)
+            for address in dict.fromkeys(token_addresses)
+            if address
+        }
+        atas = {
+            address: associated_token_address(owner, mint)
+            for address, mint in mints.items()
+        }
+        want_sol = not all(token_addresses)
+
+        # One key list covers the wallet if SOL is wanted, every ATA and any mint
+        # whose decimals are unknown; a known mint costs a single account read
+        keys = [owner] if want_sol else []
+        keys.extend(atas.values())
+        unknown_mints_at = len(keys)
+        keys.extend(
+            mint for mint in dict.fromkeys(mints.values()) if mint not in _mint_decimals
+        )
+        accounts = {}
         try:
-            with requests.get(url) as response:
-                response.raise_for_status()
-                data = response.json()
-                price = data.get("data", {}).get(token_address, {}).get("price")
+            for start in range(0, len(keys), MAX_MULTIPLE_ACCOUNTS):
+                chunk = keys[start : start + MAX_MULTIPLE_ACCOUNTS]
+                response = await async_client.get_multiple_accounts(
+                    chunk, commitment=Confirmed
+                )
+                accounts.update(zip(chunk, response.value))
+        except Exception as error:
+            raise Exception(f"Failed to get balances: {str(error)}") from error
 
-                if not price:
-                    raise Exception("Price data not available for the given token.")
+        for mint in keys[unknown_mints_at:]:
+            account = accounts.get(mint)
+            decimals = SolanaReadHelper.mint_decimals(account.data) if account else None
+            if decimals is not None:
+                _mint_decimals[mint] = decimals
 
-                return str(price)
+        balances = {}
+        if want_sol:
+            account = accounts.get(owner)
+            balances[None] = (account.lamports if account else 0) / LAMPORTS_PER_SOL
+
+        for address, mint in mints.items():
+            decimals = _mint_decimals.get(mint)
+            account = accounts.get(atas[address])
+            if decimals is None:
+                logger.warning(f"Token mint {address} is not initialized.")
+                balances[address] = None
+            elif account is None:
+                balances[address] = None
+            else:
+                amount = int.from_bytes(
+                    account.data[_TOKEN_AMOUNT_OFFSET : _TOKEN_AMOUNT_OFFSET + 8],
+                    "little",
+                )
+                balances[address] = amount / 10**decimals
+
+        logger.debug(f"Balances response: {balances}")
+        return balances
+
+    @staticmethod
+    async def fetch_prices(
+        http: httpx.AsyncClient, token_addresses: List[str]
+    ) -> Dict[str, str]:
+        """Prices for several tokens from one Jupiter request; tokens without one are left out"""
+        now = time.monotonic()
+        prices = {}
+        missing = []
+        for token_address in dict.fromkeys(token_addresses):
+            cached = _prices.get(token_address)
+            if cached is not None and cached[0] > now:
+                prices[token_address] = cached[1]
+            else:
+                missing.append(token_address)
+        if not missing:
+            return prices
+
+        response = await http.get(
+            "https://api.jup.ag/price/v2", params={"ids": ",".join(missing)}
+        )
+        response.raise_for_status()
+        data = response.json().get("data") or {}
+
+        expiry = time.monotonic() + PRICE_TTL
+        for token_address in missing:
+            price = (data.get(token_address) or {}).get("price")
+            if price:
+                prices[token_address] = str(price)
+                _prices[token_address] = (expiry, prices[token_address])
+        return prices
+
+    @staticmethod
+    async def fetch_price(http: httpx.AsyncClient, token_address: str) -> float:
+        try:
+            price = (await SolanaReadHelper.fetch_prices(http, [token_address])).get(
+                token_address
+            )
+
+            if not price:
+                raise Exception("Price data not available for the given token.")
+
+            return price
         except Exception as e:
             raise Exception(f"Price fetch failed: {str(e)}")
 
     @staticmethod
-    def get_token_by_ticker(
+    async def get_token_by_ticker(
+        http: httpx.AsyncClient,
         ticker: str,
     ) -> str:
         try:
-            response = requests.get(
+            response = await http.get(
                 f"https://api.dexscreener.com/latest/dex/search?q={ticker}"
             )
             response.raise_for_status()
@@ -106,24 +252,29 @@ class SolanaReadHelper:
             return None
 
     @staticmethod
-    def get_token_by_address(
+    async def get_token_by_address(
+        http: httpx.AsyncClient,
         address: str,
     ) -> str:
+        global _verified_tokens, _verified_tokens_expiry
         try:
-            response = requests.get(
-                "https://tokens.jup.ag/tokens?tags=verified",
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
+            if time.monotonic() >= _verified_tokens_expiry:
+                response = await http.get(
+                    "https://tokens.jup.ag/tokens?tags=verified",
+                    headers={"Content-Type": "application/json"},
+                )
+                response.raise_for_status()
 
-            data = response.json()
-            for token in data:
-                if token.get("address") == str(address):
-                    return JupiterTokenData(
+                _verified_tokens = {
+                    token.get("address"): JupiterTokenData(
                         address=token.get("address"),
                         symbol=token.get("symbol"),
                         name=token.get("name"),
                     )
-            return None
+                    for token in response.json()
+                }
+                _verified_tokens_expiry = time.monotonic() + TOKEN_LIST_TTL
+
+            return _verified_tokens.get(str(address))
         except Exception as error:
             raise Exception(f"Error fetching token data: {str(error)}")
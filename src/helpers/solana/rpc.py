@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import statistics
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment, Confirmed
+from solana.rpc.types import TxOpts
+from solders.signature import Signature  # type: ignore
+from solders.transaction_status import TransactionConfirmationStatus  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# A blockhash stays valid for ~150 slots (about a minute), so reusing one for a couple of
+# seconds costs nothing and saves a round-trip on every back-to-back transaction
+BLOCKHASH_TTL = 2.0
+BLOCKHASH_RETRIES = 3
+BLOCKHASH_RETRY_DELAY = 0.1
+
+# Priority fees in micro-lamports per compute unit: the median of recent fees, refreshed
+# every PRIORITY_FEE_TTL seconds and capped so a fee spike can't drain the wallet
+PRIORITY_FEE_TTL = 2.0
+MAX_PRIORITY_FEE = 100_000
+# Blockhashes whose compute-unit price offsets are remembered; more than are issued
+# within one blockhash's lifetime at BLOCKHASH_TTL
+FEE_OFFSET_BLOCKHASHES = 256
+
+# Confirmation polls signature status at slot pace; block height (for blockhash expiry) is
+# only checked every few polls, and CONFIRM_TIMEOUT bounds the wait when it is unknown
+CONFIRM_POLL_INTERVAL = 0.4
+EXPIRY_CHECK_EVERY = 5
+CONFIRM_TIMEOUT = 90.0
+# RPC nodes forward a transaction to the leaders only briefly; resending it at this
+# interval until it lands or its blockhash expires keeps it in front of them under load
+REBROADCAST_INTERVAL = 2.0
+_REBROADCAST_OPTS = TxOpts(skip_preflight=True)
+_CONFIRMED = (TransactionConfirmationStatus.Confirmed, TransactionConfirmationStatus.Finalized)
+
+
+# RPC clients shared per event loop and endpoint, since a client's connection pool
+# belongs to the loop that opened it
+_rpc_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, Commitment], AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def shared_rpc_client(endpoint: str, commitment: Commitment = Confirmed) -> AsyncClient:
+    """
+    AsyncClient for endpoint shared by everything on the current event loop.
+
+    Reusing one client keeps its keep-alive connections (and TLS sessions) to the RPC
+    node instead of handshaking again for every operation.
+    """
+    clients = _rpc_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get((endpoint, commitment))
+    if client is None:
+        client = clients[endpoint, commitment] = AsyncClient(endpoint, commitment=commitment)
+    return client
+
+
+async def close_rpc_clients() -> None:
+    """Close the shared RPC clients opened on the current event loop."""
+    clients = _rpc_clients.pop(asyncio.get_running_loop(), {})
+    await asyncio.gather(*(client.close() for client in clients.values()))
+
+
+class _BlockhashCache:
+    """Latest blockhash per RPC client, refreshed by at most one request at a time."""
+
+    def __init__(self):
+        # client -> (fetched_at, GetLatestBlockhashResp.value)
+        self._entries: "weakref.WeakKeyDictionary[AsyncClient, Tuple[float, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._fetching: "weakref.WeakKeyDictionary[AsyncClient, asyncio.Task]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def get(self, async_client: AsyncClient) -> Any:
+        entry = self._entries.get(async_client)
+        if entry and time.monotonic() - entry[0] < BLOCKHASH_TTL:
+            return entry[1]
+
+        # Concurrent callers share one in-flight refresh; shield it so a caller being
+        # cancelled doesn't cancel the fetch for everyone else
+        task = self._fetching.get(async_client)
+        if task is None:
+            task = self._fetching[async_client] = asyncio.create_task(
+                self._refresh(async_client)
+            )
+        return await asyncio.shield(task)
+
+    async def _refresh(self, async_client: AsyncClient) -> Any:
+        try:
+            for attempt in range(BLOCKHASH_RETRIES):
+                try:
+                    value = (await async_client.get_latest_blockhash()).value
+                    break
+                except Exception as e:
+                    if attempt == BLOCKHASH_RETRIES - 1:
+                        raise
+                    logger.debug("Blockhash fetch failed, retrying: %s", e)
+                    await asyncio.sleep(BLOCKHASH_RETRY_DELAY * 2**attempt)
+            self._entries[async_client] = (time.monotonic(), value)
+            return value
+        finally:
+            self._fetching.pop(async_client, None)
+
+    def invalidate(self, async_client: AsyncClient) -> None:
+        self._entries.pop(async_client, None)
+
+
+_BLOCKHASH_CACHE = _BlockhashCache()
+
+
+async def latest_blockhash(async_client: AsyncClient) -> Any:
+    """
+    Latest blockhash for async_client's cluster, at most BLOCKHASH_TTL seconds old.
+
+    Returns the RPC value, with .blockhash and .last_valid_block_height.
+    """
+    return await _BLOCKHASH_CACHE.get(async_client)
+
+
+# client -> (fetched_at, micro-lamports per compute unit)
+_priority_fees: "weakref.WeakKeyDictionary[AsyncClient, Tuple[float, int]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def priority_fee(async_client: AsyncClient) -> int:
+    """
+    Median recent prioritization fee, in micro-lamports per compute unit.
+
+    Falls back to 0 (no priority fee) when the RPC can't report recent fees; the fee only
+    helps a transaction land sooner, so its absence must not fail the send.
+    """
+    entry = _priority_fees.get(async_client)
+    if entry and time.monotonic() - entry[0] < PRIORITY_FEE_TTL:
+        return entry[1]
+
+    try:
+        fees = (await async_client.get_recent_prioritization_fees()).value
+        fee = int(statistics.median(f.prioritization_fee for f in fees)) if fees else 0
+    except Exception as e:
+        logger.debug("Priority fee estimate unavailable: %s", e)
+        fee = 0
+    fee = min(fee, MAX_PRIORITY_FEE)
+    _priority_fees[async_client] = (time.monotonic(), fee)
+    return fee
+
+
+# blockhash -> offset added to the compute-unit price of the last transaction built on it
+_fee_offsets: "OrderedDict[Any, int]" = OrderedDict()
+
+
+async def blockhash_and_fee(async_client: AsyncClient) -> Tuple[Any, int]:
+    """
+    Latest blockhash and a compute-unit price that is unique for that blockhash.
+
+    Both values are cached, so two transfers with the same payer, recipient and amount
+    would otherwise compile to the same bytes; the cluster drops the second as a
+    duplicate while the caller gets its signature back as if it had been sent. Each
+    transaction built on a blockhash pays one more micro-lamport per compute unit than
+    the previous one, which keeps every signature distinct.
+    """
+    latest, fee = await asyncio.gather(latest_blockhash(async_client), priority_fee(async_client))
+    offset = _fee_offsets.pop(latest.blockhash, -1) + 1
+    _fee_offsets[latest.blockhash] = offset
+    if len(_fee_offsets) > FEE_OFFSET_BLOCKHASHES:
+        _fee_offsets.popitem(last=False)
+    return latest, fee + offset
+
+
+async def confirm_signature(
+    async_client: AsyncClient,
+    signature: Signature,
+    last_valid_block_height: Optional[int] = None,
+) -> None:
+    """
+    Wait until signature reaches Confirmed.
+
+    Raises RuntimeError if the transaction failed on chain, and TimeoutError once its
+    blockhash has expired (or CONFIRM_TIMEOUT passes) without it landing.
+    """
+    deadline = time.monotonic() + CONFIRM_TIMEOUT
+    polls = 0
+    while True:
+        status = (await async_client.get_signature_statuses([signature])).value[0]
+        if status is not None:
+            if status.err is not None:
+                raise RuntimeError(f"Transaction {signature} failed: {status.err}")
+            if status.confirmation_status in _CONFIRMED:
+                return
+
+        polls += 1
+        if last_valid_block_height is not None and polls % EXPIRY_CHECK_EVERY == 0:
+            if (await async_client.get_block_height()).value > last_valid_block_height:
+                raise TimeoutError(f"Transaction {signature} expired before confirmation")
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Transaction {signature} not confirmed after {CONFIRM_TIMEOUT:.0f}s")
+        await asyncio.sleep(CONFIRM_POLL_INTERVAL)
+
+
+async def rebroadcast_until_confirmed(
+    async_client: AsyncClient,
+    transaction: bytes,
+    signature: Signature,
+    last_valid_block_height: Optional[int] = None,
+) -> None:
+    """
+    Confirm an already-sent transaction, resending it every REBROADCAST_INTERVAL seconds.
+
+    Resends skip preflight (the first send already ran it) and their failures are only
+    logged; the outcome is whatever confirm_signature decides.
+    """
+    confirmation = asyncio.create_task(
+        confirm_signature(async_client, signature, last_valid_block_height)
+    )
+    try:
+        while True:
+            done, _ = await asyncio.wait({confirmation}, timeout=REBROADCAST_INTERVAL)
+            if done:
+                return confirmation.result()
+            try:
+                await async_client.send_raw_transaction(transaction, opts=_REBROADCAST_OPTS)
+            except Exception as e:
+                logger.debug("Rebroadcast of %s failed: %s", signature, e)
+    finally:
+        confirmation.cancel()
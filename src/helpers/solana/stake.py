@@ -1,7 +1,5 @@
 import base64
-import json
-import aiohttp
-from venv import logger
+import logging
 
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Processed
@@ -13,6 +11,11 @@ from solders.transaction import VersionedTransaction  # type: ignore
 
 from solders.keypair import Keypair  # type: ignore
 
+from src.helpers.http import post_with_retry, shared_aiohttp_session
+from src.helpers.solana.keys import wallet_address
+
+logger = logging.getLogger(__name__)
+
 
 class StakeManager:
     @staticmethod
@@ -23,14 +26,13 @@ class StakeManager:
         try:
 
             url = f"https://worker.jup.ag/blinks/swap/So11111111111111111111111111111111111111112/jupSoLaHXQiZZTSfEWMTRRgpnyFm8f6sZdosWBjx93v/{amount}"
-            payload = {"account": str(wallet.pubkey())}
+            payload = {"account": wallet_address(wallet)}
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload) as res:
-                    if res.status != 200:
-                        raise Exception(f"Failed to fetch transaction: {res.status}")
+            res = await post_with_retry(shared_aiohttp_session(), url, json=payload)
+            if res.status != 200:
+                raise Exception(f"Failed to fetch transaction: {res.status}")
 
-                    data = await res.json()
+            data = await res.json()
 
             raw_transaction = VersionedTransaction.from_bytes(
                 base64.b64decode(data["transaction"])
@@ -45,7 +47,7 @@ class StakeManager:
             result = await async_client.send_raw_transaction(
                 txn=bytes(signed_txn), opts=opts
             )
-            transaction_id = json.loads(result.to_json())["result"]
+            transaction_id = str(result.value)
             logger.debug(
                 f"Transaction sent: https://explorer.solana.com/tx/{transaction_id}"
             )
@@ -1,13 +1,15 @@
-from venv import logger
+import asyncio
+import logging
 from typing import Dict, Any
 
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Confirmed
 from solana.rpc.types import TxOpts
-from solana.transaction import Transaction
 
 from solders.keypair import Keypair  # type: ignore
+from solders.message import MessageV0  # type: ignore
 from solders.system_program import CreateAccountParams, create_account
+from solders.transaction import VersionedTransaction  # type: ignore
 
 from spl.token._layouts import MINT_LAYOUT
 from spl.token.constants import TOKEN_PROGRAM_ID
@@ -20,6 +22,8 @@ from spl.token.instructions import (
     mint_to,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class TokenDeploymentManager:
     @staticmethod
@@ -46,19 +50,15 @@ class TokenDeploymentManager:
                 sender.pubkey(), new_mint.pubkey()
             )
 
-            transaction = Transaction()
-
-            blockhash = await client.get_latest_blockhash()
-            transaction.recent_blockhash = blockhash.value.blockhash
-
-            lamports = (
-                await client.get_minimum_balance_for_rent_exemption(
-                    MINT_LAYOUT.sizeof()
-                )
-            ).value
+            # Independent reads: run them concurrently so they cost one round trip
+            blockhash, rent = await asyncio.gather(
+                client.get_latest_blockhash(),
+                client.get_minimum_balance_for_rent_exemption(MINT_LAYOUT.sizeof()),
+            )
+            lamports = rent.value
 
-            # Add the create account instruction
-            transaction.add(
+            amount_to_transfer = 1000000000 * 10**8
+            instructions = [
                 create_account(
                     CreateAccountParams(
                         from_pubkey=sender.pubkey(),
@@ -67,13 +67,7 @@ class TokenDeploymentManager:
                         lamports=lamports,
                         space=MINT_LAYOUT.sizeof(),
                     )
-                )
-            )
-
-            transaction.fee_payer = sender.pubkey()
-
-            # Add the initialize mint instruction
-            transaction.add(
+                ),
                 initialize_mint(
                     InitializeMintParams(
                         decimals=decimals,
@@ -82,17 +76,10 @@ class TokenDeploymentManager:
                         mint_authority=sender.pubkey(),
                         program_id=TOKEN_PROGRAM_ID,
                     )
-                )
-            )
-
-            transaction.add(
+                ),
                 create_associated_token_account(
                     sender.pubkey(), sender.pubkey(), new_mint.pubkey()
-                )
-            )
-
-            amount_to_transfer = 1000000000 * 10**8
-            transaction.add(
+                ),
                 mint_to(
                     MintToParams(
                         amount=amount_to_transfer,
@@ -102,18 +89,20 @@ class TokenDeploymentManager:
                         program_id=TOKEN_PROGRAM_ID,
                         signers=[sender.pubkey(), new_mint.pubkey()],
                     )
-                )
+                ),
+            ]
+
+            # Compile the message once and sign with both keys in one step
+            message = MessageV0.try_compile(
+                payer=sender.pubkey(),
+                instructions=instructions,
+                address_lookup_table_accounts=[],
+                recent_blockhash=blockhash.value.blockhash,
             )
-
-            blockhash_response = await async_client.get_latest_blockhash()
-            recent_blockhash = blockhash_response.value.blockhash
-            transaction.recent_blockhash = recent_blockhash
-
-            transaction.sign_partial(new_mint)
-            transaction.sign(sender)
+            transaction = VersionedTransaction(message, [sender, new_mint])
 
             tx_resp = await async_client.send_raw_transaction(
-                transaction.serialize(), opts=TxOpts(preflight_commitment=Confirmed)
+                bytes(transaction), opts=TxOpts(preflight_commitment=Confirmed)
             )
 
             logger.debug(f"resp {tx_resp}")
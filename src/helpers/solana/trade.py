@@ -1,6 +1,7 @@
+import asyncio
 import base64
-import json
-from venv import logger
+from typing import Optional, Tuple
+import logging
 
 from jupiter_python_sdk.jupiter import Jupiter
 
@@ -10,15 +11,26 @@ from solana.rpc.types import TxOpts
 
 from solders import message
 from solders.keypair import Keypair  # type: ignore
-from solders.pubkey import Pubkey  # type: ignore
+from solders.signature import Signature  # type: ignore
 from solders.transaction import VersionedTransaction  # type: ignore
 
-from spl.token.async_client import AsyncToken
-from spl.token.constants import TOKEN_PROGRAM_ID
-
 from src.constants import DEFAULT_OPTIONS
+from src.helpers.solana.keys import parse_pubkey
+from src.helpers.solana.read import SolanaReadHelper
+from src.helpers.solana.rpc import latest_blockhash
 from src.helpers.solana.transfer import SolanaTransferHelper
 
+logger = logging.getLogger(__name__)
+
+
+def _sign_swap(
+    transaction_data: str, wallet: Keypair
+) -> Tuple[VersionedTransaction, Signature]:
+    """Decode a base64 Jupiter transaction and sign it with wallet."""
+    raw_transaction = VersionedTransaction.from_bytes(base64.b64decode(transaction_data))
+    signature = wallet.sign_message(message.to_bytes_versioned(raw_transaction.message))
+    return VersionedTransaction.populate(raw_transaction.message, [signature]), signature
+
 
 class TradeManager:
     @staticmethod
@@ -30,16 +42,24 @@ class TradeManager:
         input_amount: float,
         input_mint: str,
         slippage_bps: int,
+        decimals: Optional[int] = None,
+        confirm: bool = True,
     ) -> str:
         """
         Swap tokens using Jupiter Exchange.
 
         Args:
-            agent (SolanaAgentKit): The Solana agent instance.
+            async_client (AsyncClient): RPC client; reuse one (e.g. from
+                rpc.shared_rpc_client) rather than creating one per trade.
+            wallet (Keypair): The signing wallet.
+            jupiter (Jupiter): Jupiter client bound to the same RPC client.
             output_mint (Pubkey): Target token mint address.
             input_amount (float): Amount to swap (in token decimals).
             input_mint (Pubkey): Source token mint address (default: USDC).
             slippage_bps (int): Slippage tolerance in basis points (default: 300 = 3%).
+            decimals (int, optional): Input mint decimals, fetched when not given.
+            confirm (bool): Wait for confirmation (default: True); when False, return
+                once the RPC has accepted the transaction.
 
         Returns:
             str: Transaction signature.
@@ -50,40 +70,70 @@ class TradeManager:
         # convert wallet.secret() from bytes to string
         input_mint = str(input_mint)
         output_mint = str(output_mint)
-        spl_client = AsyncToken(
-            async_client, Pubkey.from_string(input_mint), TOKEN_PROGRAM_ID, wallet
+        if decimals is None:
+            decimals = await SolanaReadHelper.get_mint_decimals(
+                async_client, parse_pubkey(input_mint)
+            )
+
+        # Warm the blockhash cache while Jupiter quotes, so confirmation starts
+        # without another round trip
+        transaction_data, _ = await asyncio.gather(
+            TradeManager.build_swap(
+                jupiter, output_mint, input_amount, input_mint, slippage_bps, decimals
+            ),
+            latest_blockhash(async_client),
+        )
+        return await TradeManager.send_swap(
+            async_client, wallet, transaction_data, confirm
         )
-        mint = await spl_client.get_mint_info()
-        decimals = mint.decimals
-        input_amount = int(input_amount * 10**decimals)
 
+    @staticmethod
+    async def build_swap(
+        jupiter: Jupiter,
+        output_mint: str,
+        input_amount: float,
+        input_mint: str,
+        slippage_bps: int,
+        decimals: int,
+    ) -> str:
+        """Quote the swap on Jupiter and return the unsigned transaction (base64)."""
         try:
-            transaction_data = await jupiter.swap(
-                input_mint,
-                output_mint,
-                input_amount,
+            return await jupiter.swap(
+                str(input_mint),
+                str(output_mint),
+                int(input_amount * 10**decimals),
                 only_direct_routes=False,
                 slippage_bps=slippage_bps,
             )
-            raw_transaction = VersionedTransaction.from_bytes(
-                base64.b64decode(transaction_data)
-            )
-            signature = wallet.sign_message(
-                message.to_bytes_versioned(raw_transaction.message)
-            )
-            signed_txn = VersionedTransaction.populate(
-                raw_transaction.message, [signature]
+        except Exception as e:
+            raise Exception(f"Swap failed: {str(e)}")
+
+    @staticmethod
+    async def send_swap(
+        async_client: AsyncClient,
+        wallet: Keypair,
+        transaction_data: str,
+        confirm: bool = True,
+    ) -> str:
+        """Sign a Jupiter swap transaction, send it and (unless confirm=False) wait for confirmation."""
+        try:
+            # Decoding and signing are CPU work; keep them off the event loop so
+            # concurrent trades and reads aren't stalled behind them
+            signed_txn, signature = await asyncio.get_running_loop().run_in_executor(
+                None, _sign_swap, transaction_data, wallet
             )
             opts = TxOpts(skip_preflight=False, preflight_commitment=Processed)
-            result = await async_client.send_raw_transaction(
-                txn=bytes(signed_txn), opts=opts
-            )
-            logger.debug(f"Transaction sent: {json.loads(result.to_json())}")
-            transaction_id = json.loads(result.to_json())["result"]
-            logger.debug(
-                f"Transaction sent: https://explorer.solana.com/tx/{transaction_id}"
-            )
-            await SolanaTransferHelper._confirm_transaction(async_client, signature)
+            raw = bytes(signed_txn)
+            result = await async_client.send_raw_transaction(txn=raw, opts=opts)
+            transaction_id = str(result.value)
+            logger.debug("Transaction sent: https://explorer.solana.com/tx/%s", transaction_id)
+            if confirm:
+                # Jupiter built the transaction on a blockhash from moments ago, so the
+                # current one's expiry is a close (slightly late) bound for it
+                latest = await latest_blockhash(async_client)
+                await SolanaTransferHelper._confirm_transaction(
+                    async_client, signature, latest.last_valid_block_height, raw
+                )
             return str(signature)
 
         except Exception as e:
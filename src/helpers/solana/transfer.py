@@ -1,23 +1,39 @@
 import math
-from venv import logger
-from src.constants import LAMPORTS_PER_SOL, SOL_FEES
+import logging
+from typing import List, Optional, Tuple
+from src.constants import LAMPORTS_PER_SOL
 
 from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Confirmed
 
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
 from solders.keypair import Keypair  # type: ignore
 from solders.pubkey import Pubkey  # type: ignore
+from solders.signature import Signature  # type: ignore
 from solders.system_program import TransferParams, transfer
 from solders.transaction import VersionedTransaction  # type: ignore
 from solders.message import MessageV0  # type: ignore
 
-from spl.token.async_client import AsyncToken
 from spl.token.constants import TOKEN_PROGRAM_ID
-from spl.token.instructions import get_associated_token_address, transfer_checked
+from spl.token.instructions import transfer_checked
 from spl.token.instructions import TransferCheckedParams
-from solana.transaction import Transaction
 import asyncio
 
+from src.helpers.solana.keys import associated_token_address, parse_pubkey
+from src.helpers.solana.read import SolanaReadHelper
+from src.helpers.solana.rpc import (
+    blockhash_and_fee,
+    confirm_signature,
+    rebroadcast_until_confirmed,
+)
+
+logger = logging.getLogger(__name__)
+
+# Compute unit limits with headroom over what each transfer uses (a system transfer
+# ~150 CU, transfer_checked ~6k, plus ~300 for the budget instructions). A tight limit
+# keeps the priority fee small and lets the leader pack more transactions per block
+SOL_TRANSFER_CU_LIMIT = 2_000
+SPL_TRANSFER_CU_LIMIT = 20_000
+
 
 class SolanaTransferHelper:
     """Helper class for Solana token and SOL transfers."""
@@ -29,26 +45,30 @@ class SolanaTransferHelper:
         to: str,
         amount: float,
         spl_token: str = None,
+        confirm: bool = True,
     ) -> str:
         """
         Transfer SOL or SPL tokens.
 
         Args:
-            async_client: Async RPC client instance.
+            async_client: Async RPC client instance; reuse one (e.g. from
+                rpc.shared_rpc_client) rather than creating one per transfer.
             wallet: Sender's wallet keypair.
             to: Recipient's public key as string.
             amount: Amount of tokens to transfer.
             spl_token: SPL token mint address as string (default: None).
+            confirm: Wait for confirmation; when False, return once the RPC has
+                accepted the transaction.
 
         Returns:
             Transaction signature.
         """
         try:
             # Convert string address to Pubkey
-            to_pubkey = Pubkey.from_string(to)
+            to_pubkey = parse_pubkey(to)
             
             if spl_token:
-                signature = await SolanaTransferHelper._transfer_spl_tokens(
+                signature, tx, last_valid_block_height = await SolanaTransferHelper._transfer_spl_tokens(
                     async_client,
                     wallet,
                     to_pubkey,
@@ -57,27 +77,31 @@ class SolanaTransferHelper:
                 )
                 token_identifier = str(spl_token)
             else:
-                signature = await SolanaTransferHelper._transfer_native_sol(
+                signature, tx, last_valid_block_height = await SolanaTransferHelper._transfer_native_sol(
                     async_client, wallet, to_pubkey, amount
                 )
                 token_identifier = "SOL"
                 
-            await SolanaTransferHelper._confirm_transaction(async_client, signature)
+            if confirm:
+                await SolanaTransferHelper._confirm_transaction(
+                    async_client, signature, last_valid_block_height, bytes(tx)
+                )
 
             logger.debug(
-                f"\nSuccess!\n\nSignature: {signature}\nFrom Address: {str(wallet.pubkey())}\nTo Address: {to}\nAmount: {amount}\nToken: {token_identifier}"
+                "\nSuccess!\n\nSignature: %s\nFrom Address: %s\nTo Address: %s\nAmount: %s\nToken: %s",
+                signature, wallet.pubkey(), to, amount, token_identifier,
             )
 
             return signature
 
         except Exception as error:
-            logger.error(f"Transfer failed: {error}")
+            logger.error("Transfer failed: %s", error)
             raise RuntimeError(f"Transfer operation failed: {error}") from error
 
     @staticmethod
     async def _transfer_native_sol(
         async_client: AsyncClient, wallet: Keypair, to: Pubkey, amount: float
-    ) -> str:
+    ) -> Tuple[Signature, VersionedTransaction, int]:
         """
         Transfer native SOL.
 
@@ -88,36 +112,50 @@ class SolanaTransferHelper:
             amount: Amount of SOL to transfer
 
         Returns:
-            Transaction signature.
+            Transaction signature, the signed transaction and the last block height its
+            blockhash is valid for.
         """
         try:
-            # Convert amount to lamports
-            lamports = int(amount * LAMPORTS_PER_SOL)
-            
-            ix = transfer(
-                TransferParams(
-                    from_pubkey=wallet.pubkey(),
-                    to_pubkey=to,
-                    lamports=lamports,
-                )
-            )
-            
-            blockhash = (await async_client.get_latest_blockhash()).value.blockhash
-            msg = MessageV0.try_compile(
-                payer=wallet.pubkey(),
-                instructions=[ix],
-                address_lookup_table_accounts=[],
-                recent_blockhash=blockhash,
+            tx, last_valid_block_height = await SolanaTransferHelper._build_native_sol(
+                async_client, wallet, to, amount
             )
-            tx = VersionedTransaction(msg, [wallet])
-
             result = await async_client.send_transaction(tx)
-            return result.value
+            return result.value, tx, last_valid_block_height
 
         except Exception as e:
-            logger.error(f"Native SOL transfer failed: {str(e)}")
+            logger.error("Native SOL transfer failed: %s", e)
             raise
 
+    @staticmethod
+    async def _build_native_sol(
+        async_client: AsyncClient, wallet: Keypair, to: Pubkey, amount: float
+    ) -> Tuple[VersionedTransaction, int]:
+        """Build and sign a native SOL transfer, with its blockhash's last valid height."""
+        # Convert amount to lamports
+        lamports = int(amount * LAMPORTS_PER_SOL)
+        
+        ix = transfer(
+            TransferParams(
+                from_pubkey=wallet.pubkey(),
+                to_pubkey=to,
+                lamports=lamports,
+            )
+        )
+        
+        latest, fee = await blockhash_and_fee(async_client)
+        msg = MessageV0.try_compile(
+            payer=wallet.pubkey(),
+            instructions=[
+                set_compute_unit_limit(SOL_TRANSFER_CU_LIMIT),
+                set_compute_unit_price(fee),
+                ix,
+            ],
+            address_lookup_table_accounts=[],
+            recent_blockhash=latest.blockhash,
+        )
+        tx = VersionedTransaction(msg, [wallet])
+        return tx, latest.last_valid_block_height
+
     @staticmethod
     async def _transfer_spl_tokens(
         async_client: AsyncClient,
@@ -125,7 +163,7 @@ class SolanaTransferHelper:
         recipient: Pubkey,
         spl_token: str,
         amount: float,
-    ) -> str:
+    ) -> Tuple[Signature, VersionedTransaction, int]:
         """
         Transfer SPL tokens from payer to recipient.
 
@@ -137,62 +175,202 @@ class SolanaTransferHelper:
             amount: Amount of tokens to transfer.
 
         Returns:
-            Transaction signature.
+            Transaction signature, the signed transaction and the last block height its
+            blockhash is valid for.
         """
         try:
-            # Convert string token address to Pubkey
-            token_mint = Pubkey.from_string(spl_token)
-            
-            spl_client = AsyncToken(
-                async_client, token_mint, TOKEN_PROGRAM_ID, wallet.pubkey()
+            tx, last_valid_block_height = await SolanaTransferHelper._build_spl_transfer(
+                async_client, wallet, recipient, spl_token, amount
             )
-            
-            # Get token decimals
-            mint = await spl_client.get_mint_info()
-            decimals = mint.decimals
-            
-            # Convert amount to token units
-            token_amount = math.floor(amount * 10**decimals)
-            
-            # Get token accounts
-            sender_token_address = get_associated_token_address(wallet.pubkey(), token_mint)
-            recipient_token_address = get_associated_token_address(recipient, token_mint)
-            
-            # Create transfer instruction
-            transfer_ix = transfer_checked(
-                TransferCheckedParams(
-                    source=sender_token_address,
-                    dest=recipient_token_address,
-                    owner=wallet.pubkey(),
-                    mint=token_mint,
-                    amount=token_amount,
-                    decimals=decimals,
-                    program_id=TOKEN_PROGRAM_ID,
-                )
-            )
-
-            # Build and send transaction
-            blockhash = (await async_client.get_latest_blockhash()).value.blockhash
-            msg = MessageV0.try_compile(
-                payer=wallet.pubkey(),
-                instructions=[transfer_ix],
-                address_lookup_table_accounts=[],
-                recent_blockhash=blockhash,
-            )
-            tx = VersionedTransaction(msg, [wallet])
-
             result = await async_client.send_transaction(tx)
-            return result.value
+            return result.value, tx, last_valid_block_height
 
         except Exception as e:
-            logger.error(f"SPL token transfer failed: {str(e)}")
+            logger.error("SPL token transfer failed: %s", e)
             raise
 
     @staticmethod
-    async def _confirm_transaction(async_client: AsyncClient, signature: str) -> None:
-        """Wait for transaction confirmation."""
+    async def _build_spl_transfer(
+        async_client: AsyncClient,
+        wallet: Keypair,
+        recipient: Pubkey,
+        spl_token: str,
+        amount: float,
+    ) -> Tuple[VersionedTransaction, int]:
+        """Build and sign an SPL transfer_checked, with its blockhash's last valid height."""
+        # Convert string token address to Pubkey
+        token_mint = parse_pubkey(spl_token)
+        
+        # Decimals, blockhash and fee are independent reads, so overlap them
+        decimals, (latest, fee) = await asyncio.gather(
+            SolanaReadHelper.get_mint_decimals(async_client, token_mint),
+            blockhash_and_fee(async_client),
+        )
+        
+        # Convert amount to token units
+        token_amount = math.floor(amount * 10**decimals)
+        
+        # Get token accounts
+        sender_token_address = associated_token_address(wallet.pubkey(), token_mint)
+        recipient_token_address = associated_token_address(recipient, token_mint)
+        
+        # Create transfer instruction
+        transfer_ix = transfer_checked(
+            TransferCheckedParams(
+                source=sender_token_address,
+                dest=recipient_token_address,
+                owner=wallet.pubkey(),
+                mint=token_mint,
+                amount=token_amount,
+                decimals=decimals,
+                program_id=TOKEN_PROGRAM_ID,
+            )
+        )
+
+        # Compile and sign the transaction
+        msg = MessageV0.try_compile(
+            payer=wallet.pubkey(),
+            instructions=[
+                set_compute_unit_limit(SPL_TRANSFER_CU_LIMIT),
+                set_compute_unit_price(fee),
+                transfer_ix,
+            ],
+            address_lookup_table_accounts=[],
+            recent_blockhash=latest.blockhash,
+        )
+        tx = VersionedTransaction(msg, [wallet])
+        return tx, latest.last_valid_block_height
+
+    @staticmethod
+    async def _confirm_transaction(
+        async_client: AsyncClient,
+        signature: Signature,
+        last_valid_block_height: Optional[int] = None,
+        transaction: Optional[bytes] = None,
+    ) -> None:
+        """
+        Wait for transaction confirmation, giving up once its blockhash expires.
+
+        When the signed transaction is given it is rebroadcast until it lands.
+        """
         try:
-            await async_client.confirm_transaction(signature, commitment=Confirmed)
+            if transaction is not None:
+                await rebroadcast_until_confirmed(
+                    async_client, transaction, signature, last_valid_block_height
+                )
+            else:
+                await confirm_signature(async_client, signature, last_valid_block_height)
         except Exception as e:
-            logger.error(f"Transaction confirmation failed: {str(e)}")
-            raise
\ No newline at end of file
+            logger.error("Transaction confirmation failed: %s", e)
+            raise
+
+
+class BatchTransferSession:
+    """
+    Pipelined transfers from one wallet for bursts such as payout loops.
+
+    Transfers move through build, send and confirm stages running concurrently, so while
+    one is confirming the next is being sent and another built; blockhash and priority
+    fee come from the shared short-lived caches, and repeated (to, amount) pairs still
+    get distinct signatures (see rpc.blockhash_and_fee). Use as an async context manager:
+
+        async with BatchTransferSession(async_client, wallet) as batch:
+            futures = [batch.enqueue(to, amount) for to, amount in payouts]
+            signatures = await asyncio.gather(*futures)
+    """
+
+    def __init__(self, async_client: AsyncClient, wallet: Keypair, confirm_workers: int = 8):
+        self.async_client = async_client
+        self.wallet = wallet
+        self._confirm_workers = confirm_workers
+        self._build_queue: asyncio.Queue = asyncio.Queue()
+        self._send_queue: asyncio.Queue = asyncio.Queue()
+        self._confirm_queue: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+
+    async def __aenter__(self) -> "BatchTransferSession":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._build_worker()),
+            asyncio.create_task(self._send_worker()),
+            *(asyncio.create_task(self._confirm_worker()) for _ in range(self._confirm_workers)),
+        ]
+
+    def enqueue(self, to: str, amount: float, spl_token: str = None) -> asyncio.Future:
+        """Queue a transfer; the returned future resolves to its confirmed signature."""
+        future = asyncio.get_running_loop().create_future()
+        self._build_queue.put_nowait((future, to, amount, spl_token))
+        return future
+
+    async def close(self) -> None:
+        """Wait for every queued transfer to finish, then stop the workers."""
+        for queue in (self._build_queue, self._send_queue, self._confirm_queue):
+            await queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _build_worker(self) -> None:
+        while True:
+            future, to, amount, spl_token = await self._build_queue.get()
+            try:
+                if future.done():
+                    continue
+                recipient = parse_pubkey(to)
+                if spl_token:
+                    built = await SolanaTransferHelper._build_spl_transfer(
+                        self.async_client, self.wallet, recipient, spl_token, amount
+                    )
+                else:
+                    built = await SolanaTransferHelper._build_native_sol(
+                        self.async_client, self.wallet, recipient, amount
+                    )
+                self._send_queue.put_nowait((future, *built))
+            except Exception as e:
+                logger.error("Batched transfer to %s failed to build: %s", to, e)
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._build_queue.task_done()
+
+    async def _send_worker(self) -> None:
+        while True:
+            future, tx, last_valid_block_height = await self._send_queue.get()
+            try:
+                if future.done():
+                    continue
+                signature = (await self.async_client.send_transaction(tx)).value
+                self._confirm_queue.put_nowait(
+                    (future, signature, bytes(tx), last_valid_block_height)
+                )
+            except Exception as e:
+                logger.error("Batched transfer failed to send: %s", e)
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._send_queue.task_done()
+
+    async def _confirm_worker(self) -> None:
+        while True:
+            future, signature, transaction, last_valid_block_height = await self._confirm_queue.get()
+            try:
+                await rebroadcast_until_confirmed(
+                    self.async_client, transaction, signature, last_valid_block_height
+                )
+                if not future.done():
+                    future.set_result(signature)
+            except Exception as e:
+                logger.error("Batched transfer %s failed to confirm: %s", signature, e)
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._confirm_queue.task_done()
@@ -4,4 +4,7 @@ from .app import create_app
 def start_server(host: str = "0.0.0.0", port: int = 8000):
     """Start the ZerePy server"""
     app = create_app()
-    uvicorn.run(app, host=host, port=port)
\ No newline at end of file
+    # uvicorn already picks uvloop and httptools when they are installed. The loaded
+    # agent lives in this process's ServerState, so the server runs a single worker:
+    # with several, a load and the actions after it could land on different processes
+    uvicorn.run(app, host=host, port=port, access_log=False)
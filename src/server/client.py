@@ -1,15 +1,40 @@
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, List, Dict, Any
+from urllib3.util.retry import Retry
 
 class ZerePyClient:
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", timeout: float = 10.0):
         self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        # One session keeps the connection to the server alive between calls. Only
+        # idempotent requests are retried, so an action is never performed twice
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+        )
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session"""
+        self._session.close()
+
+    def __enter__(self) -> "ZerePyClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make HTTP request with error handling"""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         try:
-            response = requests.request(method, url, **kwargs)
+            kwargs.setdefault("timeout", self.timeout)
+            response = self._session.request(method, url, **kwargs)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -47,4 +72,68 @@ class ZerePyClient:
 
     def stop_agent(self) -> Dict[str, Any]:
         """Stop the agent loop"""
-        return self._make_request("POST", "/agent/stop")
\ No newline at end of file
+        return self._make_request("POST", "/agent/stop")
+
+class AsyncZerePyClient:
+    """Async counterpart of ZerePyClient, for issuing several calls concurrently"""
+
+    def __init__(self, base_url: str = "http://localhost:8000", timeout: float = 10.0):
+        self.base_url = base_url.rstrip('/')
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client"""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncZerePyClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make HTTP request with error handling"""
+        try:
+            response = await self._client.request(method, f"/{endpoint.lstrip('/')}", **kwargs)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            raise Exception(f"Request failed: {str(e)}")
+
+    async def get_status(self) -> Dict[str, Any]:
+        """Get server status"""
+        return await self._make_request("GET", "/")
+
+    async def list_agents(self) -> List[str]:
+        """List available agents"""
+        response = await self._make_request("GET", "/agents")
+        return response.get("agents", [])
+
+    async def load_agent(self, agent_name: str) -> Dict[str, Any]:
+        """Load a specific agent"""
+        return await self._make_request("POST", f"/agents/{agent_name}/load")
+
+    async def list_connections(self) -> Dict[str, Any]:
+        """List available connections"""
+        return await self._make_request("GET", "/connections")
+
+    async def perform_action(self, connection: str, action: str, params: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Execute an agent action"""
+        data = {
+            "connection": connection,
+            "action": action,
+            "params": params or []
+        }
+        return await self._make_request("POST", "/agent/action", json=data)
+
+    async def start_agent(self) -> Dict[str, Any]:
+        """Start the agent loop"""
+        return await self._make_request("POST", "/agent/start")
+
+    async def stop_agent(self) -> Dict[str, Any]:
+        """Stop the agent loop"""
+        return await self._make_request("POST", "/agent/stop")
@@ -1,12 +1,14 @@
+from dataclasses import dataclass
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from solders.pubkey import Pubkey  # type: ignore
 
 
 class BaseModelWithArbitraryTypes(BaseModel):
-    class Config:
-        arbitrary_types_allowed = True
+    # Validated models are for options callers pass in; results built from trusted
+    # RPC/API data below are slotted dataclasses instead. Both are immutable
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True, extra="ignore")
 
 class Creator(BaseModelWithArbitraryTypes):
     address: str
@@ -22,7 +24,8 @@ class CollectionDeployment(BaseModelWithArbitraryTypes):
     collection_address: Pubkey
     signature: bytes
 
-class MintCollectionNFTResponse(BaseModelWithArbitraryTypes):
+@dataclass(slots=True, frozen=True)
+class MintCollectionNFTResponse:
     mint: Pubkey
     metadata: Pubkey
 
@@ -34,7 +37,8 @@ class PumpfunTokenOptions(BaseModelWithArbitraryTypes):
     slippage_bps: Optional[int] = None
     priority_fee: Optional[int] = None
 
-class PumpfunLaunchResponse(BaseModelWithArbitraryTypes):
+@dataclass(slots=True, frozen=True)
+class PumpfunLaunchResponse:
     signature: str
     mint: str
     metadata_uri: Optional[str] = None
@@ -46,31 +50,36 @@ class LuloAccountSettings(BaseModelWithArbitraryTypes):
     homebase: Optional[str] = None
     minimum_rate: str
 
-class LuloAccountDetailsResponse(BaseModelWithArbitraryTypes):
+@dataclass(slots=True, frozen=True)
+class LuloAccountDetailsResponse:
     total_value: float
     interest_earned: float
     realtime_apy: float
     settings: LuloAccountSettings
 
-class NetworkPerformanceMetrics(BaseModelWithArbitraryTypes):
+@dataclass(slots=True, frozen=True)
+class NetworkPerformanceMetrics:
     """Data structure for Solana network performance metrics."""
     transactions_per_second: float
     total_transactions: int
     sampling_period_seconds: int
     current_slot: int
 
-class TokenDeploymentResult(BaseModelWithArbitraryTypes):
+@dataclass(slots=True, frozen=True)
+class TokenDeploymentResult:
     """Result of a token deployment operation."""
     mint: Pubkey
     transaction_signature: str
 
-class TokenLaunchResult(BaseModelWithArbitraryTypes):
+@dataclass(slots=True, frozen=True)
+class TokenLaunchResult:
     """Result of a token launch operation."""
     signature: str
     mint: str
     metadata_uri: str
 
-class TransferResult(BaseModelWithArbitraryTypes):
+@dataclass(slots=True, frozen=True)
+class TransferResult:
     """Result of a transfer operation."""
     signature: str
     from_address: str
@@ -78,12 +87,14 @@ class TransferResult(BaseModelWithArbitraryTypes):
     amount: float
     token: Optional[str] = None
 
-class JupiterTokenData(BaseModelWithArbitraryTypes):
+@dataclass(slots=True, frozen=True)
+class JupiterTokenData:
     address:str
     symbol:str
     name:str
 
+@dataclass(slots=True, frozen=True)
 class GibworkCreateTaskResponse:
     status: str
     taskId: Optional[str] = None
-    signature: Optional[str] = None
\ No newline at end of file
+    signature: Optional[str] = None
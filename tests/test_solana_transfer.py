@@ -0,0 +1,60 @@
+import unittest
+from types import SimpleNamespace
+
+try:
+    from solders.hash import Hash  # type: ignore
+    from solders.keypair import Keypair  # type: ignore
+    from solders.transaction_status import TransactionConfirmationStatus  # type: ignore
+
+    from src.helpers.solana.transfer import BatchTransferSession
+except ImportError:  # the Solana SDK is an optional install
+    BatchTransferSession = None
+
+
+class _FakeClient:
+    """AsyncClient stand-in returning a fixed blockhash and fee; every send lands at once."""
+
+    def __init__(self):
+        self.blockhash = Hash.new_unique()
+        self.sent = []
+
+    async def get_latest_blockhash(self):
+        return SimpleNamespace(
+            value=SimpleNamespace(blockhash=self.blockhash, last_valid_block_height=1_000)
+        )
+
+    async def get_recent_prioritization_fees(self):
+        return SimpleNamespace(value=[SimpleNamespace(prioritization_fee=1_000)])
+
+    async def send_transaction(self, tx):
+        self.sent.append(bytes(tx))
+        return SimpleNamespace(value=tx.signatures[0])
+
+    async def send_raw_transaction(self, transaction, opts=None):
+        return SimpleNamespace(value=None)
+
+    async def get_signature_statuses(self, signatures):
+        status = SimpleNamespace(err=None, confirmation_status=TransactionConfirmationStatus.Confirmed)
+        return SimpleNamespace(value=[status for _ in signatures])
+
+    async def get_block_height(self):
+        return SimpleNamespace(value=0)
+
+
+@unittest.skipIf(BatchTransferSession is None, "solana/solders not installed")
+class BatchTransferSessionTest(unittest.IsolatedAsyncioTestCase):
+    async def test_identical_transfers_get_distinct_signatures(self):
+        client = _FakeClient()
+        recipient = str(Keypair().pubkey())
+
+        async with BatchTransferSession(client, Keypair()) as batch:
+            first = batch.enqueue(recipient, 0.01)
+            second = batch.enqueue(recipient, 0.01)
+            signatures = [await first, await second]
+
+        self.assertNotEqual(signatures[0], signatures[1])
+        self.assertEqual(len(set(client.sent)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()